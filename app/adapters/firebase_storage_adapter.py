@@ -2,16 +2,58 @@
 import asyncio
 import logging
 import os
+import threading
 import time
-from typing import Optional, Dict
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Iterable
 from google.cloud import storage as gcs_storage
+from google.cloud.storage._signing import generate_signed_url_v4
 import firebase_admin
 from firebase_admin import storage
+from app.adapters.signed_url_cache import expiry_window, signed_url_cache
+from app.config import SIGNED_URL_SIGN_CONCURRENCY
 from app.ports.storage_port import StoragePort, UploadResult
 from app.utils.storage_utils import normalize_storage_path
 
 logger = logging.getLogger(__name__)
 
+_signing_pool: Optional[ThreadPoolExecutor] = None
+_signing_pool_lock = threading.Lock()
+
+def _signing_executor() -> ThreadPoolExecutor:
+    """Pool compartilhado para assinar signed URLs em paralelo (criado sob demanda)."""
+    global _signing_pool
+    with _signing_pool_lock:
+        if _signing_pool is None:
+            _signing_pool = ThreadPoolExecutor(
+                max_workers=max(1, SIGNED_URL_SIGN_CONCURRENCY),
+                thread_name_prefix="signed-url",
+            )
+        return _signing_pool
+
+# Validade máxima de uma URL V4
+_V4_MAX_EXPIRATION_SECONDS = 7 * 24 * 3600
+
+def _generate_signed_url_at(blob, *, lifetime_seconds: int, signed_at: int) -> str:
+    """
+    Mesmo resultado de blob.generate_signed_url(version="v4", method="GET"),
+    mas com o instante da assinatura (X-Goog-Date) fixo em `signed_at`.
+    Blob.generate_signed_url sempre usa "agora", o que muda a URL a cada segundo.
+    """
+    client = blob.client
+    quoted_name = urllib.parse.quote(blob.name, safe="/~")
+    return generate_signed_url_v4(
+        client._credentials,
+        resource=f"/{blob.bucket.name}/{quoted_name}",
+        expiration=timedelta(seconds=lifetime_seconds),
+        api_access_endpoint=client.api_endpoint,
+        method="GET",
+        universe_domain=client.universe_domain,
+        _request_timestamp=datetime.fromtimestamp(signed_at, timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+    )
+
 class FirebaseStorageAdapter(StoragePort):
     """
     Adapter robusto para Firebase Storage.
@@ -188,35 +230,105 @@ class FirebaseStorageAdapter(StoragePort):
             expires_seconds=expires_seconds
         )
 
+    async def get_signed_urls(self, paths: Iterable[str], expires_seconds: int = 3600) -> Dict[str, Optional[str]]:
+        return await asyncio.to_thread(
+            self._get_signed_urls_sync,
+            paths=paths,
+            expires_seconds=expires_seconds
+        )
+
+    def _bucket_name(self) -> str:
+        # Evita instanciar o client do GCS só para montar a chave do cache
+        if self._bucket_instance is not None:
+            return self._bucket_instance.name
+        return self._app.options.get("storageBucket") or self._get_bucket().name
+
     def _get_signed_url_sync(self, path: str, expires_seconds: int = 3600) -> Optional[str]:
+        """
+        Com janelas alinhadas (SIGNED_URL_EXPIRY_WINDOW_SECONDS > 0) a URL é
+        assinada no início da janela atual e vale `expires_seconds` além do
+        fim dela: todos os chamadores da janela recebem a mesma URL, sempre
+        com pelo menos `expires_seconds` de validade pela frente.
+        """
         if not path:
             return None
-            
-        bucket = self._get_bucket()
-        normalized_path = normalize_storage_path(path, bucket.name)
+
+        bucket_name = self._bucket_name()
+        normalized_path = normalize_storage_path(path, bucket_name)
         if not normalized_path:
             return None
 
+        window = expiry_window()
+        cache_key = (bucket_name, normalized_path, expires_seconds, window[0] if window else 0)
+        cached = signed_url_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        bucket = self._get_bucket()
         blob = bucket.blob(normalized_path)
         
         # Lógica de Emulador centralizada no Adapter
         emulator_host = os.getenv("FIREBASE_STORAGE_EMULATOR_HOST")
         if emulator_host:
-            import urllib.parse
             encoded_path = urllib.parse.quote(normalized_path, safe="")
             return f"http://{emulator_host}/v0/b/{bucket.name}/o/{encoded_path}?alt=media"
 
-        from datetime import timedelta
         try:
-            return blob.generate_signed_url(
-                version="v4",
-                expiration=timedelta(seconds=expires_seconds),
-                method="GET",
-            )
+            if window:
+                window_start, window_end = window
+                lifetime = min(expires_seconds + (window_end - window_start), _V4_MAX_EXPIRATION_SECONDS)
+                expires_at = window_start + lifetime
+                url = _generate_signed_url_at(blob, lifetime_seconds=lifetime, signed_at=window_start)
+            else:
+                expires_at = time.time() + expires_seconds
+                url = blob.generate_signed_url(
+                    version="v4",
+                    expiration=timedelta(seconds=expires_seconds),
+                    method="GET",
+                )
         except Exception as e:
             logger.error(f"[Storage] Falha ao gerar signed URL para {normalized_path}: {e}")
             return None
 
+        signed_url_cache.put(cache_key, url, expires_at)
+        return url
+
+    def _get_signed_urls_sync(self, paths: Iterable[str], expires_seconds: int = 3600) -> Dict[str, Optional[str]]:
+        """
+        Assina vários paths de uma vez: hits vêm do cache e os misses são
+        assinados em paralelo. Retorna {path original: url ou None}.
+        """
+        unique_paths = list(dict.fromkeys(path for path in paths if path))
+        if not unique_paths:
+            return {}
+
+        bucket_name = self._bucket_name()
+        window = expiry_window()
+        window_start = window[0] if window else 0
+        results: Dict[str, Optional[str]] = {}
+        misses = []
+        for path in unique_paths:
+            cached = signed_url_cache.get(
+                (bucket_name, normalize_storage_path(path, bucket_name), expires_seconds, window_start)
+            )
+            if cached is not None:
+                results[path] = cached
+            else:
+                misses.append(path)
+
+        if len(misses) == 1:
+            results[misses[0]] = self._get_signed_url_sync(misses[0], expires_seconds)
+        elif misses:
+            # Inicializa o bucket uma vez antes de espalhar entre threads
+            self._get_bucket()
+            signed = _signing_executor().map(
+                lambda path: self._get_signed_url_sync(path, expires_seconds),
+                misses,
+            )
+            results.update(zip(misses, signed))
+
+        return results
+
     async def download_bytes(self, path: str) -> bytes:
         return await asyncio.to_thread(self._download_bytes_sync, path=path)
 
@@ -0,0 +1,132 @@
+# app/adapters/signed_url_cache.py
+"""
+Cache em memória (por processo) de signed URLs do Storage.
+
+Assinar uma URL V4 é trabalho de RSA feito na requisição. Uma URL assinada
+é reaproveitada até `safety_margin_seconds` antes de expirar, para que o
+cliente sempre receba uma URL com validade útil pela frente.
+
+Compartilhado entre instâncias de FirebaseStorageAdapter (que costumam ser
+criadas por requisição).
+
+Com SIGNED_URL_EXPIRY_WINDOW_SECONDS > 0 as assinaturas são ancoradas no
+início de janelas fixas de tempo (ver `expiry_window`): na mesma janela o
+mesmo path gera sempre a mesma URL, em qualquer instância, e browsers/CDN
+conseguem reaproveitar a imagem.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import (
+    SIGNED_URL_CACHE_SIZE,
+    SIGNED_URL_EXPIRY_WINDOW_SECONDS,
+    SIGNED_URL_RESPONSE_MAX_AGE_SECONDS,
+    SIGNED_URL_SAFETY_MARGIN_SECONDS,
+)
+
+# (bucket, path normalizado, expires_seconds, início da janela)
+CacheKey = Tuple[str, str, int, int]
+
+
+class SignedUrlCache:
+    def __init__(
+        self,
+        *,
+        max_size: int = SIGNED_URL_CACHE_SIZE,
+        safety_margin_seconds: float = SIGNED_URL_SAFETY_MARGIN_SECONDS,
+    ):
+        self.max_size = max_size
+        self.safety_margin_seconds = safety_margin_seconds
+        # CacheKey -> (expires_at, url)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry[0] - self.safety_margin_seconds:
+                self._entries.pop(key, None)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: CacheKey, url: str, expires_at: float) -> None:
+        """
+        Guarda a URL até `expires_at` (epoch, segundos). URLs que já estão
+        dentro da margem de segurança não são guardadas.
+        """
+        if not self.enabled or time.time() >= expires_at - self.safety_margin_seconds:
+            return
+
+        with self._lock:
+            self._entries[key] = (expires_at, url)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+signed_url_cache = SignedUrlCache()
+
+
+def expiry_window(now: Optional[float] = None) -> Optional[Tuple[int, int]]:
+    """
+    (início, fim) da janela de assinatura que contém `now` (epoch, segundos),
+    ou None quando o alinhamento está desativado.
+    """
+    window_seconds = SIGNED_URL_EXPIRY_WINDOW_SECONDS
+    if window_seconds <= 0:
+        return None
+
+    now = time.time() if now is None else now
+    start = int(now // window_seconds) * window_seconds
+    return start, start + window_seconds
+
+
+def signed_url_cache_control(*, private: bool = False, now: Optional[float] = None) -> Optional[str]:
+    """
+    Cache-Control para respostas que embutem signed URLs: as URLs não mudam
+    até o fim da janela atual, então a resposta pode ser reaproveitada até
+    lá (limitado a SIGNED_URL_RESPONSE_MAX_AGE_SECONDS, para a listagem em si
+    não envelhecer demais). None quando o alinhamento está desativado.
+    """
+    now = time.time() if now is None else now
+    window = expiry_window(now)
+    if window is None:
+        return None
+
+    max_age = max(0, min(SIGNED_URL_RESPONSE_MAX_AGE_SECONDS, int(window[1] - now)))
+    return f"{'private' if private else 'public'}, max-age={max_age}"
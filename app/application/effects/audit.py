@@ -4,7 +4,7 @@ Module audit.py.
 
 import logging
 from app.application.effects.build_result import build_effect_result
-from app.application.effects.persist_firestore import persist_effect_result_firestore
+from app.application.effects.result_sink import get_effect_result_sink
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,8 @@ def record_effect_result(relato_id: str, effect_type: str, effect_ref: str, succ
             metadata=metadata,
             error=error,
         )
-        persist_effect_result_firestore(result)
+        # write-behind: gravado em lote pelo sink, fora do caminho da requisição
+        get_effect_result_sink().submit(result)
         return result
     except Exception as exc:
         logger.exception(f"Erro ao registrar auditoria do efeito {effect_type}: {exc}")
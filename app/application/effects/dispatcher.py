@@ -3,6 +3,7 @@ import logging
 from typing import Any, List
 
 from app.application.effects.audit import record_effect_result
+from app.application.effects.plan import EffectStep, compile_effect_plan, persist_relato_data
 from app.application.effects.result import EffectResult
 from app.domain.relato.effects.emit_event import EmitDomainEventEffect
 from app.domain.relato.effects.enqueue import EnqueueProcessingEffect
@@ -10,7 +11,7 @@ from app.domain.relato.effects.persist import PersistRelatoEffect
 from app.domain.relato.effects.update_status import UpdateRelatoStatusEffect
 from app.domain.relato.effects.upload import PersistImageRefsEffect
 from app.ports.event_port import EventPort
-from app.ports.processing_port import ProcessingPort
+from app.ports.processing_port import ProcessingBackpressureError, ProcessingPort
 from app.ports.relato_repository_port import RelatoRepositoryPort
 
 
@@ -84,6 +85,14 @@ class EffectDispatcher:
     async def dispatch(self, effects: List[Any]) -> List[EffectResult]:
         """
         Itera sobre os efeitos e executa a acao correspondente via Ports.
+
+        Escritas contiguas no mesmo documento sao coalescidas pelo plano
+        (ver plan.compile_effect_plan); o EffectResult continua sendo
+        registrado por efeito.
+
+        Backpressure do processamento (ProcessingBackpressureError) nao
+        interrompe o dispatch: o enfileiramento e registrado como falha, para
+        o retry, e os efeitos seguintes continuam.
         """
         logger.info(
             "effects.pipeline.dispatch_started",
@@ -94,82 +103,108 @@ class EffectDispatcher:
         )
         effect_results: List[EffectResult] = []
 
-        for effect in effects:
-            
-            effect_type = _effect_type(effect)
-            relato_id = _effect_relato_id(effect)
-            effect_ref = _effect_ref(effect)
+        for step in compile_effect_plan(effects):
 
             try:
-                logger.info(
-                    "effects.pipeline.effect_execution_started",
-                    extra={
-                        "effect_type": effect_type,
-                        "effect_ref": effect_ref,
-                        "relato_id": relato_id,
-                    },
-                )
-
-                await self._execute_single_effect(effect)
-
-                logger.info(
-                    "effects.pipeline.effect_execution_finished",
+                for effect in step.effects:
+                    logger.info(
+                        "effects.pipeline.effect_execution_started",
+                        extra={
+                            "effect_type": _effect_type(effect),
+                            "effect_ref": _effect_ref(effect),
+                            "relato_id": _effect_relato_id(effect),
+                            "coalesced": step.coalesced,
+                        },
+                    )
+
+                if step.coalesced:
+                    await self._execute_coalesced_write(step)
+                else:
+                    await self._execute_single_effect(step.effects[0])
+
+                for effect in step.effects:
+                    logger.info(
+                        "effects.pipeline.effect_execution_finished",
+                        extra={
+                            "effect_type": _effect_type(effect),
+                            "effect_ref": _effect_ref(effect),
+                            "relato_id": _effect_relato_id(effect),
+                        },
+                    )
+                    self._record(effect, effect_results, success=True)
+
+            except ProcessingBackpressureError as exc:
+                logger.warning(
+                    "effects.pipeline.processing_backpressure",
                     extra={
-                        "effect_type": effect_type,
-                        "effect_ref": effect_ref,
-                        "relato_id": relato_id,
+                        "relato_id": step.relato_id or _effect_relato_id(step.effects[0]),
+                        "error": str(exc),
                     },
                 )
 
-                effect_result = record_effect_result(
-                    relato_id=relato_id,
-                    effect_type=effect_type,
-                    effect_ref=effect_ref,
-                    success=True,
-                    metadata=_effect_metadata(effect),
-                )
-                if effect_result is not None:
-                    effect_results.append(effect_result)
-
-                logger.info(
-                    "effects.pipeline.effect_result_persisted",
-                    extra={
-                        "effect_type": effect_type,
-                        "effect_ref": effect_ref,
-                        "relato_id": relato_id,
-                        "effect_result_status": effect_result.status.value if effect_result else None,
-                    },
-                )
+                for effect in step.effects:
+                    self._record(effect, effect_results, success=False, error=str(exc))
 
             except Exception as exc:
-                logger.error("Erro ao despachar efeito %s: %s", effect_type, str(exc))
-
-                effect_result = record_effect_result(
-                    relato_id=relato_id,
-                    effect_type=effect_type,
-                    effect_ref=effect_ref,
-                    success=False,
-                    metadata=_effect_metadata(effect),
-                    error=str(exc),
-                )
-                if effect_result is not None:
-                    effect_results.append(effect_result)
+                effect_types = [_effect_type(effect) for effect in step.effects]
+                logger.error("Erro ao despachar efeito %s: %s", ", ".join(effect_types), str(exc))
 
-                logger.info(
-                    "effects.pipeline.effect_result_persisted",
-                    extra={
-                        "effect_type": effect_type,
-                        "effect_ref": effect_ref,
-                        "relato_id": relato_id,
-                        "effect_result_status": effect_result.status.value if effect_result else None,
-                    },
-                )
+                for effect in step.effects:
+                    self._record(effect, effect_results, success=False, error=str(exc))
 
                 raise
 
         logger.info("effects.pipeline.dispatch_finished")
         return effect_results
 
+    def _record(
+        self,
+        effect: Any,
+        effect_results: List[EffectResult],
+        *,
+        success: bool,
+        error: str | None = None,
+    ) -> None:
+        effect_type = _effect_type(effect)
+        effect_ref = _effect_ref(effect)
+        relato_id = _effect_relato_id(effect)
+
+        effect_result = record_effect_result(
+            relato_id=relato_id,
+            effect_type=effect_type,
+            effect_ref=effect_ref,
+            success=success,
+            metadata=_effect_metadata(effect),
+            error=error,
+        )
+        if effect_result is not None:
+            effect_results.append(effect_result)
+
+        logger.info(
+            "effects.pipeline.effect_result_persisted",
+            extra={
+                "effect_type": effect_type,
+                "effect_ref": effect_ref,
+                "relato_id": relato_id,
+                "effect_result_status": effect_result.status.value if effect_result else None,
+            },
+        )
+
+    async def _execute_coalesced_write(self, step: EffectStep) -> None:
+        logger.info(
+            "[DEBUG DISPATCHER] Iniciando relato_repo.save coalescido para relato_id=%s efeitos=%s",
+            step.relato_id,
+            [_effect_type(effect) for effect in step.effects],
+        )
+        await self.relato_repo.save(
+            relato_id=step.relato_id,
+            data=step.document_data,
+        )
+        logger.info(
+            "[DEBUG DISPATCHER] Finalizado relato_repo.save coalescido para relato_id=%s",
+            step.relato_id,
+        )
+
     async def _execute_single_effect(self, effect: Any) -> None:
         if isinstance(effect, PersistRelatoEffect):
             logger.info(
@@ -177,19 +212,7 @@ class EffectDispatcher:
                 effect.relato_id,
             )
             
-            # Prepara os dados para persistência
-            data = {
-                "owner_id": effect.owner_id,
-                "conteudo_original": effect.conteudo,
-                "metadados": effect.metadados,
-                "status": effect.status,
-                "image_refs": effect.image_refs,
-                
-            }
-            
-            # Se houver estado de pipeline operacional, inclui no documento
-            if effect.pipeline:
-                data["_pipeline"] = effect.pipeline
+            data = persist_relato_data(effect)
 
             await self.relato_repo.save(
                 relato_id=effect.relato_id,
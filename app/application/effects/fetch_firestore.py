@@ -1,12 +1,14 @@
 # app/services/effects/fetch_firestore.py
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import logging
 
 from google.cloud.firestore_v1.base_query import And, FieldFilter
 
+from app.config import EFFECT_LEGACY_SUCCESS_LOOKUP, EFFECT_LEGACY_SUCCESS_LOOKUP_LIMIT
 from app.firestore.client import get_firestore_client
-from app.application.effects.result import EffectResult, EffectStatus
+from app.application.effects.result import EffectResult, EffectStatus, effect_idempotency_key
 
 logger = logging.getLogger(__name__)
 
@@ -20,32 +22,108 @@ def fetch_effect_result_success(
     """
     Busca no Firestore um EffectResult com success=True
     para a chave de idempotncia fornecida.
+
+    Sucessos são gravados com ID determinístico (effect_idempotency_key),
+    então a busca é um get() pontual. Sucessos antigos, com ID aleatório,
+    são procurados pela consulta legada quando o documento não existe.
+    """
+
+    db = get_firestore_client()
+
+    doc_id = effect_idempotency_key(relato_id, effect_type, effect_ref)
+    doc = db.collection("effect_results").document(doc_id).get()
+    if not doc.exists:
+        legacy = _fetch_legacy_successes(db, {doc_id: (relato_id, effect_type, effect_ref)})
+        return legacy.get(doc_id)
+
+    data = doc.to_dict()
+    if data.get("status") != EffectStatus.SUCCESS.value:
+        return None
+
+    logger.info(f"Fetched EffectResult success: {data}")
+
+    return _success_from_document(data)
+
+
+def fetch_effect_results_success_many(
+    keys: Mapping[str, Tuple[str, str, str]],
+) -> Dict[str, EffectResult]:
     """
+    Busca em uma única leitura (get_all) os sucessos para várias chaves de
+    idempotência (doc_id -> (relato_id, effect_type, effect_ref)). As que
+    faltarem passam pela consulta legada, uma por relato. Retorna apenas as
+    chaves encontradas.
+    """
+    doc_ids = list(keys)
+    if not doc_ids:
+        return {}
 
     db = get_firestore_client()
+    collection = db.collection("effect_results")
+
+    found: Dict[str, EffectResult] = {}
+    for doc in db.get_all([collection.document(doc_id) for doc_id in doc_ids]):
+        if not doc.exists:
+            continue
+        data = doc.to_dict()
+        if data.get("status") == EffectStatus.SUCCESS.value:
+            found[doc.id] = _success_from_document(data)
+
+    missing = {doc_id: key for doc_id, key in keys.items() if doc_id not in found}
+    if missing:
+        found.update(_fetch_legacy_successes(db, missing))
 
-    query = (
-        db.collection("effect_results")
-        .where(
+    logger.info(
+        "Fetched %d/%d EffectResult successes via get_all",
+        len(found),
+        len(doc_ids),
+    )
+    return found
+
+
+def _fetch_legacy_successes(
+    db,
+    keys: Mapping[str, Tuple[str, str, str]],
+) -> Dict[str, EffectResult]:
+    """
+    Sucessos gravados antes do ID determinístico (ID aleatório, effect_ref
+    em metadata). Uma consulta por relato devolve os sucessos dele (até
+    EFFECT_LEGACY_SUCCESS_LOOKUP_LIMIT); o casamento com as chaves pedidas
+    é feito aqui. Só roda com EFFECT_LEGACY_SUCCESS_LOOKUP ligado, enquanto
+    scripts/backfill_effect_idempotency_keys.py não tiver sido executado.
+    """
+    if not EFFECT_LEGACY_SUCCESS_LOOKUP:
+        return {}
+
+    by_relato: Dict[str, set] = defaultdict(set)
+    for doc_id, (relato_id, _effect_type, _effect_ref) in keys.items():
+        by_relato[relato_id].add(doc_id)
+
+    found: Dict[str, EffectResult] = {}
+    for relato_id, wanted in by_relato.items():
+        query = db.collection("effect_results").where(
             filter=And(
                 [
                     FieldFilter("relato_id", "==", relato_id),
-                    FieldFilter("effect_type", "==", effect_type),
-                    FieldFilter("metadata.effect_ref", "==", effect_ref),
                     FieldFilter("status", "==", EffectStatus.SUCCESS.value),
                 ]
             )
-        )
-        .limit(1)
-    )
-
-    docs = list(query.stream())
-    if not docs:
-        return None
-
-    data = docs[0].to_dict()
-    logger.info(f"Fetched EffectResult success: {data}")
-
+        ).limit(EFFECT_LEGACY_SUCCESS_LOOKUP_LIMIT)
+        for doc in query.stream():
+            data = doc.to_dict()
+            effect_ref = (data.get("metadata") or {}).get("effect_ref", data.get("effect_ref"))
+            if effect_ref is None:
+                continue
+            doc_id = effect_idempotency_key(relato_id, data.get("effect_type"), str(effect_ref))
+            if doc_id in wanted and doc_id not in found:
+                found[doc_id] = _success_from_document(data)
+
+    if found:
+        logger.info("Fetched %d legacy EffectResult successes", len(found))
+    return found
+
+
+def _success_from_document(data: dict) -> EffectResult:
     _metadata = data.get("metadata", {}) or {}
     _metadata["old_executed_at"] = data.get("executed_at")
     if data.get("effect_ref") is not None:
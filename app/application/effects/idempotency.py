@@ -1,5 +1,63 @@
-from app.application.effects.result import EffectResult
-from app.application.effects.fetch_firestore import fetch_effect_result_success
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.application.effects.result import EffectResult, EffectStatus, effect_idempotency_key
+from app.application.effects.fetch_firestore import (
+    fetch_effect_result_success,
+    fetch_effect_results_success_many,
+)
+from app.config import EFFECT_SUCCESS_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# (relato_id, effect_type, effect_ref)
+EffectKey = Tuple[str, str, str]
+
+
+class _KnownSuccesses:
+    """
+    LRU por processo das chaves de idempotência com sucesso conhecido.
+    Um sucesso nunca deixa de ser sucesso, então não há expiração.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._keys:
+                return False
+            self._keys.move_to_end(key)
+            return True
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+_known_successes = _KnownSuccesses(EFFECT_SUCCESS_CACHE_SIZE)
+
+
+def remember_effect_success(result: EffectResult) -> None:
+    """
+    Registra no LRU local um EffectResult SUCCESS recém-gravado.
+    """
+    effect_ref = (result.metadata or {}).get("effect_ref")
+    if result.status == EffectStatus.SUCCESS and effect_ref:
+        _known_successes.add(
+            effect_idempotency_key(result.relato_id, result.effect_type, str(effect_ref))
+        )
 
 
 def effect_already_succeeded(
@@ -9,13 +67,55 @@ def effect_already_succeeded(
     effect_ref: str,
 ) -> bool:
     """
-    Retorna True se j existe um EffectResult success=True
-    para a mesma chave de idempotncia.
+    Retorna True se já existe um EffectResult success=True
+    para a mesma chave de idempotência.
     """
+    key = effect_idempotency_key(relato_id, effect_type, effect_ref)
+    if key in _known_successes:
+        return True
+
     result: EffectResult | None = fetch_effect_result_success(
         relato_id=relato_id,
         effect_type=effect_type,
         effect_ref=effect_ref,
     )
 
-    return result is not None
+    if result is None:
+        return False
+
+    _known_successes.add(key)
+    return True
+
+
+def prefetch_effect_successes(keys: Iterable[EffectKey]) -> Optional[Dict[EffectKey, bool]]:
+    """
+    Resolve a idempotência de uma lista inteira de efeitos com no máximo uma
+    leitura em lote (get_all), consultando antes o LRU local.
+
+    Retorna None se a leitura falhar; nesse caso o chamador deve cair na
+    verificação por efeito (effect_already_succeeded).
+    """
+    known: Dict[EffectKey, bool] = {}
+    pending: Dict[str, EffectKey] = {}
+
+    for effect_key in keys:
+        doc_id = effect_idempotency_key(*effect_key)
+        if doc_id in _known_successes:
+            known[effect_key] = True
+        else:
+            pending[doc_id] = effect_key
+
+    if pending:
+        try:
+            found = fetch_effect_results_success_many(pending)
+        except Exception as exc:
+            logger.warning("Prefetch de idempotência falhou; verificando por efeito | erro=%s", exc)
+            return None
+
+        for doc_id, effect_key in pending.items():
+            succeeded = doc_id in found
+            if succeeded:
+                _known_successes.add(doc_id)
+            known[effect_key] = succeeded
+
+    return known
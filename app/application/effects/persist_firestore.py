@@ -5,7 +5,8 @@ from datetime import datetime
 from typing import Any, Dict
 
 from app.firestore.client import get_firestore_client
-from app.application.effects.result import EffectResult, EffectStatus
+from app.application.effects.idempotency import remember_effect_success
+from app.application.effects.result import EffectResult, EffectStatus, effect_idempotency_key
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,40 @@ def normalize_firestore_value(value: Any) -> Any:
     return value
 
 
+def effect_result_to_document(result: EffectResult) -> Dict[str, Any]:
+    """
+    Converte um EffectResult no documento (já normalizado) gravado em
+    effect_results. Usado pela escrita direta e pelo sink em lote.
+    """
+    data: Dict[str, Any] = {
+        "relato_id": result.relato_id,
+        "effect_type": result.effect_type,
+        "status": result.status.value,
+        "metadata": result.metadata,
+        "created_at": result.created_at,
+    }
+
+    if result.status == EffectStatus.ERROR and result.error_message:
+        data["error_message"] = result.error_message
+    if result.status == EffectStatus.RETRYING and result.retry_after is not None:
+        data["retry_after_seconds"] = result.retry_after.total_seconds()
+
+    return normalize_firestore_value(data)
+
+
+def effect_result_doc_id(result: EffectResult) -> str:
+    """
+    ID do documento em effect_results.
+
+    Resultados SUCCESS com effect_ref usam a chave de idempotência (um
+    sucesso por efeito); os demais são um log append-only com ID aleatório.
+    """
+    effect_ref = (result.metadata or {}).get("effect_ref")
+    if result.status == EffectStatus.SUCCESS and effect_ref:
+        return effect_idempotency_key(result.relato_id, result.effect_type, str(effect_ref))
+    return uuid.uuid4().hex
+
+
 def persist_effect_result_firestore(
     result: EffectResult,
 ) -> None:
@@ -37,7 +72,7 @@ def persist_effect_result_firestore(
 
     db = get_firestore_client()
 
-    doc_id = uuid.uuid4().hex
+    doc_id = effect_result_doc_id(result)
     logger.debug(
         "[EFFECT_RESULT] Persistindo EffectResult | "
         "relato_id=%s, effect_type=%s, status=%s, "
@@ -50,23 +85,11 @@ def persist_effect_result_firestore(
         result.created_at,
         result.retry_after.total_seconds() if result.retry_after else None,
     )
-    data: Dict[str, Any] = {
-        "relato_id": result.relato_id,
-        "effect_type": result.effect_type,
-        "status": result.status.value,
-        "metadata": result.metadata,
-        "created_at": result.created_at,
-    }
-
-    if result.status == EffectStatus.ERROR and result.error_message:
-        data["error_message"] = result.error_message
-    if result.status == EffectStatus.RETRYING and result.retry_after is not None:
-        data["retry_after_seconds"] = result.retry_after.total_seconds()
-
     try:
-        normalized_data = normalize_firestore_value(data)
+        normalized_data = effect_result_to_document(result)
         logger.debug("[EFFECT_RESULT] app.application.effects.persist_firestore.persist_effect_result_firestore(...) | Persistindo dados normalizados: %s", normalized_data)
         db.collection("effect_results").document(doc_id).set(normalized_data)
+        remember_effect_success(result)
         logger.debug(
             "[EFFECT_RESULT] app.application.effects.persist_firestore.persist_effect_result_firestore(...) Persistido | id=%s type=%s success=%s",
             doc_id,
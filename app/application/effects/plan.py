@@ -0,0 +1,111 @@
+# app/application/effects/plan.py
+"""
+Compilação do plano de execução de efeitos.
+
+O domínio emite efeitos atômicos (ex.: CreateRelato gera PersistRelatoEffect
+e PersistImageRefsEffect para o mesmo documento relatos/{id}). Executá-los um
+a um custa um round trip ao Firestore por efeito.
+
+O compilador agrupa uma sequência *contígua* de escritas no mesmo relato que
+comece por PersistRelatoEffect em um único passo: um `save` (set merge=True)
+com os campos dos efeitos seguintes aplicados por cima. Efeitos que não são
+escritas no documento (evento, enfileiramento) quebram a sequência, então a
+ordem observável dos efeitos é preservada.
+
+Cada passo guarda os efeitos originais para que o dispatcher continue
+reportando um EffectResult por efeito.
+"""
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from app.domain.relato.effects.persist import PersistRelatoEffect
+from app.domain.relato.effects.update_status import UpdateRelatoStatusEffect
+from app.domain.relato.effects.upload import PersistImageRefsEffect
+
+
+@dataclass(frozen=True)
+class EffectStep:
+    """
+    Unidade de execução do plano.
+
+    - `document_data` preenchido: escrita coalescida em relatos/{relato_id}
+    - caso contrário: um único efeito, executado como antes
+    """
+    effects: Tuple[Any, ...]
+    relato_id: Optional[str] = None
+    document_data: Optional[dict] = None
+
+    @property
+    def coalesced(self) -> bool:
+        return self.document_data is not None
+
+
+def persist_relato_data(effect: PersistRelatoEffect) -> dict:
+    """
+    Documento gravado por PersistRelatoEffect.
+    """
+    data = {
+        "owner_id": effect.owner_id,
+        "conteudo_original": effect.conteudo,
+        "metadados": effect.metadados,
+        "status": effect.status,
+        "image_refs": effect.image_refs,
+    }
+
+    # Se houver estado de pipeline operacional, inclui no documento
+    if effect.pipeline:
+        data["_pipeline"] = effect.pipeline
+
+    return data
+
+
+def _merge_into(data: dict, effect: Any) -> bool:
+    """
+    Aplica sobre `data` os campos de uma escrita subsequente no mesmo
+    documento. Retorna False se o efeito não puder ser coalescido.
+    """
+    if isinstance(effect, PersistImageRefsEffect):
+        data["image_refs"] = effect.image_refs
+        return True
+    if isinstance(effect, UpdateRelatoStatusEffect):
+        data["status"] = effect.new_status
+        return True
+    return False
+
+
+def compile_effect_plan(effects: List[Any]) -> List[EffectStep]:
+    steps: List[EffectStep] = []
+    i = 0
+
+    while i < len(effects):
+        effect = effects[i]
+
+        if not isinstance(effect, PersistRelatoEffect):
+            steps.append(EffectStep(effects=(effect,)))
+            i += 1
+            continue
+
+        data = persist_relato_data(effect)
+        group = [effect]
+        j = i + 1
+        while (
+            j < len(effects)
+            and getattr(effects[j], "relato_id", None) == effect.relato_id
+            and _merge_into(data, effects[j])
+        ):
+            group.append(effects[j])
+            j += 1
+
+        if len(group) == 1:
+            steps.append(EffectStep(effects=(effect,)))
+        else:
+            steps.append(
+                EffectStep(
+                    effects=tuple(group),
+                    relato_id=effect.relato_id,
+                    document_data=data,
+                )
+            )
+        i = j
+
+    return steps
@@ -21,7 +21,35 @@ logger = logging.getLogger(__name__)
 from app.application.effects.result import EffectResult
 
 from app.core.errors import RetryErrorMessages
-from app.application.effects.idempotency import effect_already_succeeded
+from app.application.effects.idempotency import effect_already_succeeded, prefetch_effect_successes
+
+# effect_type com que cada efeito é registrado em effect_results
+_EFFECT_TYPES = {
+    PersistRelatoEffect: "PERSIST_RELATO",
+    EnqueueProcessingEffect: "ENQUEUE_PROCESSING",
+    EmitDomainEventEffect: "EMIT_EVENT",
+    UploadImagesEffect: "UPLOAD_IMAGES",
+    UpdateRelatoStatusEffect: "UPDATE_STATUS",
+}
+
+
+def effect_idempotency_parts(effect) -> tuple:
+    """
+    (relato_id, effect_type, effect_ref) usados como chave de idempotência,
+    iguais aos gravados no EffectResult de sucesso do efeito.
+    """
+    effect_type = _EFFECT_TYPES.get(type(effect), effect.__class__.__name__)
+
+    if isinstance(effect, UpdateRelatoStatusEffect):
+        effect_ref = effect.new_status.value
+    elif isinstance(effect, EmitDomainEventEffect):
+        effect_ref = effect.event_name
+    else:
+        effect_ref = effect.relato_id
+
+    return effect.relato_id, effect_type, effect_ref
+
+
 class RelatoEffectExecutor:
     """
     LEGACY: Este executor está sendo substituído pelo EffectDispatcher.
@@ -46,30 +74,39 @@ class RelatoEffectExecutor:
         # 🔒 atributo SEMPRE existe
         self._rollback_images = rollback_images
 
-    def execute(self, effects: list):
+    def execute(self, effects: list, known_successes: dict | None = None):
+        """
+        `known_successes` permite ao chamador reaproveitar um prefetch de
+        idempotência já feito (ex.: RetryScheduler para um lote de falhas).
+        """
         logger.info("Executando efeitos do relato | total=%d", len(effects))
 
         executed_effects: list = []
 
+        idempotency_parts = [effect_idempotency_parts(effect) for effect in effects]
+        if known_successes is None and len(effects) > 1:
+            # Uma leitura em lote para a lista inteira em vez de uma query por efeito
+            known_successes = prefetch_effect_successes(
+                parts for parts in idempotency_parts if parts[2]
+            )
+
         try:
-            for effect in effects:
+            for effect, parts in zip(effects, idempotency_parts):
                 # =====================================================
                 # Idempotncia — skip se j executado com sucesso
                 # =====================================================
-                effect_type = effect.__class__.__name__
+                _, effect_type, effect_ref = parts
 
-                if isinstance(effect, UpdateRelatoStatusEffect):
-                    effect_ref = effect.new_status.value
-                elif isinstance(effect, EmitDomainEventEffect):
-                    effect_ref = effect.event_name
+                if known_successes is not None and parts in known_successes:
+                    already_succeeded = known_successes[parts]
                 else:
-                    effect_ref = effect.relato_id
+                    already_succeeded = bool(effect_ref) and effect_already_succeeded(
+                        relato_id=effect.relato_id,
+                        effect_type=effect_type,
+                        effect_ref=effect_ref,
+                    )
 
-                if effect_ref and effect_already_succeeded(
-                    relato_id=effect.relato_id,
-                    effect_type=effect_type,
-                    effect_ref=effect_ref,
-                ):
+                if effect_ref and already_succeeded:
                     logger.info(
                         "Effect j executado com sucesso | skip | type=%s relato=%s ref=%s",
                         effect_type,
@@ -358,6 +395,7 @@ class RelatoEffectExecutor:
         *,
         effect_result: EffectResult,
         attempt: int,
+        known_successes: dict | None = None,
     ):
         """
         Reexecuta um efeito com base em um EffectResult anterior.
@@ -400,7 +438,7 @@ class RelatoEffectExecutor:
 
         # Executa usando o mesmo pipeline normal
         try:
-            self.execute([effect])
+            self.execute([effect], known_successes=known_successes)
 
         except Exception as exc:
             logger.exception(
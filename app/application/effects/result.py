@@ -1,6 +1,7 @@
 # app/services/effects/result.py
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -14,6 +15,17 @@ class EffectStatus(Enum):
     STARTED = "started"
 
 
+def effect_idempotency_key(relato_id: str, effect_type: str, effect_ref: str) -> str:
+    """
+    Chave determinística de idempotência de um efeito.
+
+    Usada como ID do documento em effect_results para resultados SUCCESS,
+    o que transforma a verificação de idempotência em um get() pontual.
+    """
+    raw = f"{relato_id}|{effect_type}|{effect_ref}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 @dataclass(frozen=True)
 class EffectResult:
     """
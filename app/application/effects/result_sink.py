@@ -0,0 +1,297 @@
+# app/application/effects/result_sink.py
+"""
+Sink write-behind para auditoria de EffectResult.
+
+O dispatcher apenas enfileira o resultado; uma thread de flush grava os
+documentos em effect_results via WriteBatch do Firestore quando:
+- a fila atinge `batch_size` itens, ou
+- passa `flush_interval_seconds` desde o último flush.
+
+Backpressure / overflow:
+- com a fila cheia, `submit` bloqueia até `put_timeout_seconds` esperando
+  espaço (a thread de flush é acordada imediatamente);
+- se ainda não houver espaço, o registro é descartado e contado em `dropped`.
+  A auditoria nunca quebra o fluxo principal.
+
+Como a persistência direta, o sink NÃO lança exceção para quem chama.
+
+Sucessos só entram no LRU de idempotência depois que o lote que os contém
+foi gravado: um registro descartado ou um commit que falhou não pode
+impedir a reexecução do efeito.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from app.application.effects.idempotency import remember_effect_success
+from app.application.effects.persist_firestore import effect_result_doc_id, effect_result_to_document
+from app.application.effects.result import EffectResult
+from app.config import (
+    EFFECT_RESULT_SINK_BATCH_SIZE,
+    EFFECT_RESULT_SINK_FLUSH_INTERVAL,
+    EFFECT_RESULT_SINK_MAX_QUEUE,
+    EFFECT_RESULT_SINK_PUT_TIMEOUT,
+)
+from app.firestore.client import get_firestore_client
+
+logger = logging.getLogger(__name__)
+
+EFFECT_RESULTS_COLLECTION = "effect_results"
+
+# Limite de operações por WriteBatch imposto pelo Firestore
+FIRESTORE_MAX_BATCH_OPS = 500
+
+
+class EffectResultSink:
+    def __init__(
+        self,
+        *,
+        max_queue_size: int = EFFECT_RESULT_SINK_MAX_QUEUE,
+        batch_size: int = EFFECT_RESULT_SINK_BATCH_SIZE,
+        flush_interval_seconds: float = EFFECT_RESULT_SINK_FLUSH_INTERVAL,
+        put_timeout_seconds: float = EFFECT_RESULT_SINK_PUT_TIMEOUT,
+        db_factory: Callable = get_firestore_client,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size deve ser >= 1")
+
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(1, min(batch_size, FIRESTORE_MAX_BATCH_OPS))
+        self.flush_interval_seconds = flush_interval_seconds
+        self.put_timeout_seconds = put_timeout_seconds
+        self._db_factory = db_factory
+        self._db = None
+
+        # (doc_id, documento, EffectResult de origem)
+        self._queue: Deque[Tuple[str, Dict, EffectResult]] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closing = False
+        self._flushing = False
+        self._flush_requested = False
+
+        # --- contadores
+        self._enqueued = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._failed = 0
+        self._flush_count = 0
+        self._last_flush_latency_ms = 0.0
+        self._max_flush_latency_ms = 0.0
+
+    # =========================
+    # API pública
+    # =========================
+
+    def submit(self, result: EffectResult) -> bool:
+        """
+        Enfileira um EffectResult para gravação em lote.
+        Retorna False quando o registro foi descartado por overflow.
+        """
+        doc = (effect_result_doc_id(result), effect_result_to_document(result), result)
+
+        with self._cond:
+            if self._closing:
+                logger.warning(
+                    "[EFFECT_RESULT_SINK] Sink encerrado, descartando | type=%s",
+                    result.effect_type,
+                )
+                self._dropped += 1
+                return False
+
+            self._ensure_started()
+
+            if len(self._queue) >= self.max_queue_size:
+                self._flush_requested = True
+                self._cond.notify_all()
+                self._cond.wait_for(
+                    lambda: len(self._queue) < self.max_queue_size or self._closing,
+                    timeout=self.put_timeout_seconds,
+                )
+                if len(self._queue) >= self.max_queue_size or self._closing:
+                    self._dropped += 1
+                    logger.warning(
+                        "[EFFECT_RESULT_SINK] Fila cheia (%s), descartando | type=%s relato_id=%s",
+                        self.max_queue_size,
+                        result.effect_type,
+                        result.relato_id,
+                    )
+                    return False
+
+            self._queue.append(doc)
+            self._enqueued += 1
+
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Solicita um flush imediato e espera a fila esvaziar.
+        Retorna False se o timeout expirar antes.
+        """
+        with self._cond:
+            if self._thread is None:
+                return not self._queue
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._flushing,
+                timeout=timeout,
+            )
+
+    def shutdown(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        Encerra o sink drenando o que ainda estiver na fila.
+        """
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            thread = self._thread
+            self._cond.notify_all()
+
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+        if self._enqueued:
+            logger.info("[EFFECT_RESULT_SINK] Encerrado | stats=%s", self.stats())
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return {
+                "queue_depth": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "enqueued": self._enqueued,
+                "flushed": self._flushed,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "flush_count": self._flush_count,
+                "last_flush_latency_ms": round(self._last_flush_latency_ms, 2),
+                "max_flush_latency_ms": round(self._max_flush_latency_ms, 2),
+            }
+
+    # =========================
+    # Internos
+    # =========================
+
+    def _ensure_started(self) -> None:
+        # Chamado com self._cond adquirido
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="effect-result-sink",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: (
+                        self._closing
+                        or self._flush_requested
+                        or len(self._queue) >= self.batch_size
+                    ),
+                    timeout=self.flush_interval_seconds,
+                )
+                self._flush_requested = False
+                closing = self._closing
+
+            self._drain()
+
+            if closing:
+                with self._cond:
+                    if not self._queue:
+                        return
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                if not self._queue:
+                    self._cond.notify_all()
+                    return
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+                self._flushing = True
+                # libera produtores bloqueados por backpressure
+                self._cond.notify_all()
+
+            try:
+                self._commit(batch)
+            finally:
+                with self._cond:
+                    self._flushing = False
+                    self._cond.notify_all()
+
+    def _commit(self, batch) -> None:
+        start = time.perf_counter()
+        try:
+            if self._db is None:
+                self._db = self._db_factory()
+            collection = self._db.collection(EFFECT_RESULTS_COLLECTION)
+            write_batch = self._db.batch()
+            for doc_id, data, _result in batch:
+                write_batch.set(collection.document(doc_id), data)
+            write_batch.commit()
+            succeeded = True
+        except Exception as exc:
+            # ⚠️ Nunca quebrar o fluxo principal
+            succeeded = False
+            logger.error(
+                "[EFFECT_RESULT_SINK] Falha ao gravar lote | tamanho=%s erro=%s",
+                len(batch),
+                exc,
+                exc_info=True,
+            )
+
+        if succeeded:
+            # só agora o sucesso é durável
+            for _doc_id, _data, result in batch:
+                remember_effect_success(result)
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        with self._cond:
+            self._flush_count += 1
+            self._last_flush_latency_ms = latency_ms
+            self._max_flush_latency_ms = max(self._max_flush_latency_ms, latency_ms)
+            if succeeded:
+                self._flushed += len(batch)
+            else:
+                self._failed += len(batch)
+
+        logger.debug(
+            "[EFFECT_RESULT_SINK] Lote gravado | tamanho=%s ok=%s latencia_ms=%.2f",
+            len(batch),
+            succeeded,
+            latency_ms,
+        )
+
+
+_sink: Optional[EffectResultSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_effect_result_sink() -> EffectResultSink:
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            _sink = EffectResultSink()
+            atexit.register(_sink.shutdown)
+        return _sink
+
+
+def shutdown_effect_result_sink() -> None:
+    global _sink
+    with _sink_lock:
+        sink, _sink = _sink, None
+    if sink is not None:
+        sink.shutdown()
@@ -0,0 +1,185 @@
+# app/application/queries/feed_candidate_index.py
+"""
+Índice invertido dos candidatos do feed personalizado.
+
+Cada relato aprovado entra em três listas de postings: regiões afetadas,
+faixa etária (classificar_faixa_etaria) e sintomas/tags. Uma consulta soma
+os pesos das listas que casam com o perfil do usuário e devolve os melhores
+candidatos do corpus inteiro — não só dos mais recentes — para o ranking
+do FeedService.
+
+O índice é mantido incrementalmente (upsert/remove por relato) pela réplica
+em memória dos relatos públicos; não tem lock próprio, quem o possui
+serializa o acesso.
+"""
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.application.queries.feed_ranking import AGE_MATCH_WEIGHT, AREA_MATCH_WEIGHT
+from app.application.queries.feed_read_model import classificar_faixa_etaria
+
+SINTOMA_MATCH_WEIGHT = 0.1
+
+IndexKeys = Tuple[FrozenSet[str], Optional[str], FrozenSet[str]]
+
+
+def _as_list(value: Any) -> list:
+    if not value:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _as_dict(value: Any) -> dict:
+    return value if isinstance(value, dict) else {}
+
+
+def faixa_etaria_de(idade: Any) -> Optional[str]:
+    """Faixa etária de uma idade bruta; None quando a idade não é um número."""
+    try:
+        idade = int(idade)
+    except (TypeError, ValueError):
+        return None
+    return classificar_faixa_etaria(idade)
+
+
+def feed_index_keys(relato: Dict[str, Any]) -> IndexKeys:
+    """
+    Chaves de índice de um relato no formato do repositório
+    (build_relato_dict), com as mesmas precedências de
+    normalize_feed_relato_data.
+    """
+    meta = _as_dict(relato.get("metadados"))
+    enrichment = _as_dict(relato.get("enrichment"))
+    public_excerpt = _as_dict(relato.get("public_excerpt"))
+
+    regioes = (
+        _as_list(relato.get("regioes_afetadas"))
+        or _as_list(enrichment.get("regioes_afetadas"))
+        or _as_list(meta.get("regioes_afetadas"))
+    )
+    idade = enrichment.get("idade", meta.get("idade"))
+    sintomas = (
+        _as_list(relato.get("sintomas"))
+        or _as_list(public_excerpt.get("tags"))
+        or _as_list(relato.get("tags_extraidas"))
+        or _as_list(relato.get("tags"))
+    )
+
+    return (
+        frozenset(str(regiao) for regiao in regioes),
+        faixa_etaria_de(idade),
+        frozenset(str(sintoma) for sintoma in sintomas),
+    )
+
+
+class FeedCandidateIndex:
+    def __init__(self):
+        self._by_regiao: Dict[str, Set[str]] = defaultdict(set)
+        self._by_faixa: Dict[str, Set[str]] = defaultdict(set)
+        self._by_sintoma: Dict[str, Set[str]] = defaultdict(set)
+        self._keys: Dict[str, IndexKeys] = {}
+        # desempate entre candidatos com o mesmo peso (mais recente primeiro)
+        self._recency: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, relato_id: str) -> bool:
+        return relato_id in self._keys
+
+    def upsert(self, relato_id: str, keys: IndexKeys, recency: Any) -> None:
+        self._recency[relato_id] = recency
+        if self._keys.get(relato_id) == keys:
+            return
+
+        self.remove(relato_id, keep_recency=True)
+
+        regioes, faixa, sintomas = keys
+        for regiao in regioes:
+            self._by_regiao[regiao].add(relato_id)
+        if faixa is not None:
+            self._by_faixa[faixa].add(relato_id)
+        for sintoma in sintomas:
+            self._by_sintoma[sintoma].add(relato_id)
+        self._keys[relato_id] = keys
+
+    def remove(self, relato_id: str, *, keep_recency: bool = False) -> None:
+        if not keep_recency:
+            self._recency.pop(relato_id, None)
+
+        keys = self._keys.pop(relato_id, None)
+        if keys is None:
+            return
+
+        regioes, faixa, sintomas = keys
+        for regiao in regioes:
+            self._discard(self._by_regiao, regiao, relato_id)
+        if faixa is not None:
+            self._discard(self._by_faixa, faixa, relato_id)
+        for sintoma in sintomas:
+            self._discard(self._by_sintoma, sintoma, relato_id)
+
+    def clear(self) -> None:
+        self._by_regiao.clear()
+        self._by_faixa.clear()
+        self._by_sintoma.clear()
+        self._keys.clear()
+        self._recency.clear()
+
+    def candidates(
+        self,
+        *,
+        regioes: Iterable[str] = (),
+        faixa_etaria: Optional[str] = None,
+        sintomas: Iterable[str] = (),
+        limit: int,
+    ) -> List[str]:
+        """
+        Até `limit` relatos que casam com o perfil, por peso decrescente
+        (mesmos pesos do FeedRankingPolicy) e recência. Relatos que não casam
+        com nenhuma chave não são retornados.
+        """
+        if limit <= 0:
+            return []
+
+        scores: Dict[str, float] = defaultdict(float)
+
+        area_hits: Set[str] = set()
+        for regiao in set(regioes):
+            area_hits.update(self._by_regiao.get(regiao, ()))
+        for relato_id in area_hits:
+            scores[relato_id] += AREA_MATCH_WEIGHT
+
+        if faixa_etaria is not None:
+            for relato_id in self._by_faixa.get(faixa_etaria, ()):
+                scores[relato_id] += AGE_MATCH_WEIGHT
+
+        for sintoma in set(sintomas):
+            for relato_id in self._by_sintoma.get(sintoma, ()):
+                scores[relato_id] += SINTOMA_MATCH_WEIGHT
+
+        return heapq.nlargest(
+            limit,
+            scores,
+            key=lambda relato_id: (scores[relato_id], self._recency[relato_id]),
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "relatos": len(self._keys),
+            "regioes": len(self._by_regiao),
+            "faixas_etarias": len(self._by_faixa),
+            "sintomas": len(self._by_sintoma),
+        }
+
+    @staticmethod
+    def _discard(postings: Dict[str, Set[str]], key: str, relato_id: str) -> None:
+        ids = postings.get(key)
+        if ids is None:
+            return
+        ids.discard(relato_id)
+        if not ids:
+            del postings[key]
@@ -4,7 +4,8 @@ from app.auth.schemas import User
 from app.schema.relato import RelatoFullOutput
 from app.application.queries.feed_mappers.feed_mapper import relato_full_to_preview
 from app.application.queries.feed_ports import FeedRelatoQueryPort
-from app.application.queries.feed_ranking import FeedRankingPolicy
+from app.application.queries.feed_candidate_index import faixa_etaria_de
+from app.application.queries.feed_ranking import FeedRankingPolicy, top_k_by_score, user_areas
 from app.application.queries.feed_read_model import normalize_feed_relato_data
 from app.application.queries.feed_visibility import is_public_feed_relato
 
@@ -41,14 +42,19 @@ class FeedService:
 
     def _feed_personalizado(self, user: User, page: int, limit: int):
         relatos_usuario = self._load_owner_relatos(user.id, limit=3)
-        relatos_feed = self._load_public_relatos(limit=80)
+        relatos_feed = self._load_matching_relatos(user, relatos_usuario, limit=80)
 
+        # so o necessario ate o fim da pagina pedida e ranqueado/convertido
+        needed = max(page * limit - len(relatos_usuario), 0)
         feed = [
-            *self._to_previews(relatos_usuario, hide_after=False),
-            *self._ranked_previews(user, relatos_feed),
+            *relatos_usuario,
+            *self._rank(user, relatos_feed, needed),
         ]
 
-        return self._paginate(feed, page, limit)
+        return self._to_previews(
+            self._paginate(feed, page, limit),
+            hide_after=False,
+        )
 
     def _feed_admin(self, page: int, limit: int):
         relatos = self._load_public_relatos(limit=100)
@@ -64,6 +70,34 @@ class FeedService:
         ]
         return ret
 
+    def _load_matching_relatos(
+        self,
+        user: User,
+        relatos_usuario: list[RelatoFullOutput],
+        limit: int,
+    ) -> list[RelatoFullOutput]:
+        list_matching = getattr(self.relato_query, "list_matching_candidates", None)
+        if list_matching is None:
+            return self._load_public_relatos(limit=limit)
+
+        # sintomas de interesse: os dos proprios relatos do usuario
+        sintomas = {
+            sintoma
+            for relato in relatos_usuario
+            for sintoma in relato.sintomas or []
+        }
+        relatos_raw = list_matching(
+            regioes=list(user_areas(user)),
+            faixa_etaria=faixa_etaria_de(user.idade_aprox),
+            sintomas=sorted(sintomas),
+            limit=limit,
+        )
+        return [
+            RelatoFullOutput(**normalize_feed_relato_data(r))
+            for r in relatos_raw
+            if is_public_feed_relato(r)
+        ]
+
     def _load_owner_relatos(
         self,
         owner_user_id: str,
@@ -84,71 +118,24 @@ class FeedService:
     relatos: list[RelatoFullOutput],
     hide_after: bool = False,
     ):
-        previews = []
-
-        for relato in relatos:
-            preview = relato_full_to_preview(
-                relato,
-                hide_after=hide_after,
-            )
-
-            print(
-                f"[PREVIEW] relato_id={getattr(relato, 'id', None)} "
-                f"preview_id={getattr(preview, 'id', None)}"
-            )
-
-            previews.append(preview)
-
-        return previews
+        return [
+            relato_full_to_preview(relato, hide_after=hide_after)
+            for relato in relatos
+        ]
 
-    def _ranked_previews(
+    def _rank(
     self,
     user: User,
     relatos: list[RelatoFullOutput],
-    ):
-        scored = []
-
-        for relato in relatos:
-            score = self.ranking_policy.score(user, relato)
-
-            preview = relato_full_to_preview(
-                relato,
-                hide_after=False,
-            )
-
-            print(
-                f"[RANKING] "
-                f"relato_id={getattr(relato, 'id', None)} "
-                f"score={score}"
-            )
-
-            scored.append((score, preview))
-
-        print("\nANTES DO SORT")
-        for score, preview in scored:
-            print(
-                f"preview_id={getattr(preview, 'id', None)} "
-                f"score={score}"
-            )
-
-        scored.sort(
-            key=lambda item: item[0],
-            reverse=True,
-        )
-
-        print("\nDEPOIS DO SORT")
-        for score, preview in scored:
-            print(
-                f"preview_id={getattr(preview, 'id', None)} "
-                f"score={score}"
-            )
-
-        ranked_previews = []
-
-        for score, preview in scored:
-            ranked_previews.append(preview)
+    k: int,
+    ) -> list[RelatoFullOutput]:
+        top_k = getattr(self.ranking_policy, "top_k", None)
+        if top_k is not None:
+            return top_k(user, relatos, k)
 
-        return ranked_previews
+        # politicas que so implementam score(): mesmo heap, score por relato
+        scores = [self.ranking_policy.score(user, relato) for relato in relatos]
+        return top_k_by_score(relatos, scores, k)
 
     def _paginate(self, items: list, page: int, limit: int):
         start = (page - 1) * limit
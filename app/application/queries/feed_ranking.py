@@ -1,6 +1,82 @@
+import heapq
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
 from app.auth.schemas import User
 from app.schema.relato import RelatoFullOutput
 
+AREA_MATCH_WEIGHT = 0.6
+AGE_MATCH_WEIGHT = 0.3
+AGE_MATCH_MAX_DIFF = 5
+BASE_SCORE = 0.1
+
+
+def _parse_age(value) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def user_areas(user: User) -> list:
+    return (
+        getattr(user, "principais_areas_pele", None)
+        or getattr(user, "regioes_afetadas", None)
+        or []
+    )
+
+
+def top_k_by_score(items: Sequence, scores: Sequence[float], k: int) -> list:
+    """
+    Os `k` itens de maior score, em ordem decrescente, via heap
+    (O(n log k)). Empates mantêm a ordem original, como um sort estável.
+    """
+    if k <= 0:
+        return []
+    best = heapq.nlargest(k, range(len(items)), key=scores.__getitem__)
+    return [items[index] for index in best]
+
+
+@dataclass
+class RankingCandidates:
+    """
+    Pool de candidatos pré-processado para scoring em lote: regiões viram
+    bitsets (um bit por região distinta do pool) e idades já são inteiros.
+    """
+
+    relatos: List[RelatoFullOutput]
+    region_bits: Dict[str, int]
+    region_masks: List[int]
+    ages: List[Optional[int]]
+
+    @classmethod
+    def from_relatos(cls, relatos: Sequence[RelatoFullOutput]) -> "RankingCandidates":
+        region_bits: Dict[str, int] = {}
+        region_masks = []
+        ages = []
+
+        for relato in relatos:
+            mask = 0
+            for area in relato.regioes_afetadas or []:
+                bit = region_bits.get(area)
+                if bit is None:
+                    bit = region_bits[area] = 1 << len(region_bits)
+                mask |= bit
+            region_masks.append(mask)
+            ages.append(_parse_age(relato.idade))
+
+        return cls(
+            relatos=list(relatos),
+            region_bits=region_bits,
+            region_masks=region_masks,
+            ages=ages,
+        )
+
+    def __len__(self) -> int:
+        return len(self.relatos)
+
 
 class FeedRankingPolicy:
     """
@@ -8,34 +84,52 @@ class FeedRankingPolicy:
 
     Ainda nao e ranking semantico; apenas centraliza a heuristica existente
     para que a composicao do feed nao carregue detalhes de scoring.
+
+    `score_batch`/`top_k` pontuam o pool inteiro de uma vez (bitsets de
+    regiao e idades pre-calculadas) e selecionam so o necessario com um heap.
     """
 
-    def score(self, user: User, relato: RelatoFullOutput) -> float:
-        score = 0.0
+    def prepare(self, relatos: Sequence[RelatoFullOutput]) -> RankingCandidates:
+        return RankingCandidates.from_relatos(relatos)
 
-        user_areas = (
-            getattr(user, "principais_areas_pele", None)
-            or getattr(user, "regioes_afetadas", None)
-            or []
-        )
-        relato_areas = relato.regioes_afetadas or []
-
-        if user_areas and relato_areas:
-            match = set(user_areas).intersection(relato_areas)
-            if match:
-                score += 0.6
+    def score_batch(self, user: User, candidates: RankingCandidates) -> List[float]:
+        user_mask = 0
+        for area in user_areas(user):
+            user_mask |= candidates.region_bits.get(area, 0)
 
         user_age = user.idade_aprox
-        relato_age = relato.idade
-
-        if user_age and relato_age:
-            try:
-                relato_age = int(relato_age)
-                diff = abs(user_age - relato_age)
-                if diff <= 5:
-                    score += 0.3
-            except (TypeError, ValueError):
-                pass
-
-        score += 0.1
-        return score
+
+        if user_mask:
+            area_scores = [
+                AREA_MATCH_WEIGHT if mask & user_mask else 0.0
+                for mask in candidates.region_masks
+            ]
+        else:
+            area_scores = [0.0] * len(candidates)
+
+        if user_age:
+            age_scores = [
+                AGE_MATCH_WEIGHT
+                if age is not None and abs(user_age - age) <= AGE_MATCH_MAX_DIFF
+                else 0.0
+                for age in candidates.ages
+            ]
+        else:
+            age_scores = [0.0] * len(candidates)
+
+        return [
+            area + age + BASE_SCORE
+            for area, age in zip(area_scores, age_scores)
+        ]
+
+    def top_k(
+        self,
+        user: User,
+        relatos: Sequence[RelatoFullOutput],
+        k: int,
+    ) -> List[RelatoFullOutput]:
+        candidates = self.prepare(relatos)
+        return top_k_by_score(candidates.relatos, self.score_batch(user, candidates), k)
+
+    def score(self, user: User, relato: RelatoFullOutput) -> float:
+        return self.score_batch(user, self.prepare([relato]))[0]
@@ -1,3 +1,7 @@
+from typing import Optional
+
+from app.application.queries.feed_ports import FeedRelatoQueryPort
+from app.application.queries.public_relato_replica import PublicRelatoReplica
 from app.repositories.relato_repository import RelatoRepository
 
 
@@ -17,3 +21,46 @@ class LegacyFeedRelatoQuery:
 
     def list_owner_relatos(self, owner_user_id: str, limit: int) -> list[dict]:
         return self.repo.get_by_owner(owner_user_id, limit=limit)
+
+
+class ReplicaFeedRelatoQuery:
+    """
+    Candidatos públicos servidos pela réplica em memória, com consulta
+    direta (`fallback`) quando a réplica não está atualizada. Relatos do
+    próprio usuário incluem não publicados e vão sempre ao fallback.
+    """
+
+    def __init__(self, replica: PublicRelatoReplica, fallback: FeedRelatoQueryPort):
+        self.replica = replica
+        self.fallback = fallback
+
+    def list_public_candidates(self, limit: int) -> list[dict]:
+        relatos = self.replica.list_public_candidates(limit=limit)
+        if relatos is None:
+            return self.fallback.list_public_candidates(limit=limit)
+        return relatos
+
+    def list_matching_candidates(
+        self,
+        *,
+        regioes: list[str],
+        faixa_etaria: Optional[str],
+        sintomas: list[str],
+        limit: int,
+    ) -> list[dict]:
+        """
+        Candidatos do corpus aprovado inteiro que casam com o perfil (índice
+        invertido da réplica). Sem réplica, os `limit` mais recentes.
+        """
+        relatos = self.replica.list_matching_candidates(
+            regioes=regioes,
+            faixa_etaria=faixa_etaria,
+            sintomas=sintomas,
+            limit=limit,
+        )
+        if relatos is None:
+            return self.fallback.list_public_candidates(limit=limit)
+        return relatos
+
+    def list_owner_relatos(self, owner_user_id: str, limit: int) -> list[dict]:
+        return self.fallback.list_owner_relatos(owner_user_id, limit=limit)
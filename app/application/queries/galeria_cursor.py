@@ -0,0 +1,125 @@
+# app/application/queries/galeria_cursor.py
+"""
+Cursor opaco de paginação (keyset) da galeria.
+
+O cursor guarda a posição do último relato da página — `created_at` e o
+caminho do documento — e é devolvido ao Firestore via `start_after`. Assim
+cada página lê só `limit` documentos, qualquer que seja a profundidade
+(com `offset` o Firestore lê e cobra todos os documentos pulados).
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from google.cloud.firestore_v1.field_path import FieldPath
+
+
+class InvalidCursorError(ValueError):
+    """Cursor malformado ou adulterado."""
+
+
+def encode_galeria_cursor(created_at: Any, doc_path: str) -> str:
+    if isinstance(created_at, datetime):
+        value = {"t": "dt", "v": created_at.isoformat()}
+    else:
+        value = {"t": "raw", "v": created_at}
+
+    payload = json.dumps({"c": value, "p": doc_path}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_galeria_cursor(cursor: str, collection: Optional[str] = None) -> Tuple[Any, str]:
+    """
+    Retorna (created_at, doc_path). Lança InvalidCursorError se o cursor
+    não puder ser interpretado ou se `doc_path` não for o caminho de um
+    documento (número par de segmentos) da coleção `collection`, quando
+    informada.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value = payload["c"]
+        doc_path = payload["p"]
+        created_at = (
+            datetime.fromisoformat(value["v"]) if value["t"] == "dt" else value["v"]
+        )
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Cursor de paginação inválido.") from exc
+
+    segments = doc_path.split("/") if isinstance(doc_path, str) else []
+    if (
+        len(segments) < 2
+        or len(segments) % 2
+        or not all(segments)
+        or (collection is not None and segments[-2] != collection)
+    ):
+        raise InvalidCursorError("Cursor de paginação inválido.")
+
+    return created_at, doc_path
+
+
+def cursor_for_snapshot(snapshot) -> str:
+    return encode_galeria_cursor(
+        (snapshot.to_dict() or {}).get("created_at"),
+        snapshot.reference.path,
+    )
+
+
+def apply_keyset_page(
+    query,
+    *,
+    db,
+    collection: str,
+    limit: int,
+    page: int,
+    cursor: Optional[str],
+    fetch: Optional[int] = None,
+):
+    """
+    Ordena por (created_at desc, __name__ desc) e posiciona a consulta:
+    - com cursor: `start_after` (leituras constantes por página);
+    - sem cursor: `offset` por `page` (compatibilidade com clientes antigos).
+
+    Por padrão busca `limit + 1` documentos para saber se existe próxima
+    página; `fetch` permite overfetch (ex.: galeria contextual).
+    `collection` é o id da coleção consultada: cursores de outra coleção
+    são recusados com InvalidCursorError.
+    """
+    query = (
+        query
+        .order_by("created_at", direction="DESCENDING")
+        .order_by(FieldPath.document_id(), direction="DESCENDING")
+    )
+
+    if cursor:
+        created_at, doc_path = decode_galeria_cursor(cursor, collection)
+        # DocumentReference (e não o path em string) funciona também em collection_group
+        query = query.start_after({
+            "created_at": created_at,
+            FieldPath.document_id(): db.document(doc_path),
+        })
+    elif page > 1:
+        query = query.offset((page - 1) * limit)
+
+    return query.limit(fetch or limit + 1)
+
+
+def split_keyset_page(snapshots: list, limit: int) -> Tuple[list, Optional[str]]:
+    """
+    Separa a página (`limit` itens) e calcula o `next_cursor`.
+    """
+    page_items = snapshots[:limit]
+    if len(snapshots) <= limit or not page_items:
+        return page_items, None
+    return page_items, cursor_for_snapshot(page_items[-1])
+
+
+def page_meta(*, page: int, limit: int, count: int, next_cursor: Optional[str]) -> Dict[str, Any]:
+    return {
+        "page": page,
+        "limit": limit,
+        "count": count,
+        "next_cursor": next_cursor,
+    }
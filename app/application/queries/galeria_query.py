@@ -1,48 +1,58 @@
 # app/services/galeria_service.py
 import asyncio
+import heapq
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from google.cloud.firestore import FieldFilter
 
 from app.domain.galeria.eligibility_service import RelatoEligibilityService
+from app.domain.galeria.similarity.axes import SimilarityAxis
 from app.domain.galeria.similarity.calculator import SimilarityCalculator
+from app.domain.galeria.similarity.policy import SIMILARITY_POLICY_V1, compile_policy
+from app.domain.galeria.similarity.score import SimilarityScore
+from app.domain.galeria.similarity.scorers.narrative_tone import (
+    narrative_tone_features,
+    narrative_tone_similarity_from_features,
+    resolve_tone_features,
+)
+from app.domain.galeria.similarity.scorers.tags_overlap import jaccard_from_sets, normalize_tags
 from app.firestore.client import get_firestore_client
 from app.infra.storage.adapter import StorageAdapter
+from app.application.queries.galeria_cursor import (
+    apply_keyset_page,
+    cursor_for_snapshot,
+    encode_galeria_cursor,
+    page_meta,
+    split_keyset_page,
+)
+from app.application.queries.readmodels.galeria_card import (
+    GALERIA_CARDS_COLLECTION,
+    card_to_gallery_item,
+    pick_thumbnail_paths as _pick_thumbnail_paths,
+    public_ux_effects,
+)
+from app.application.queries.public_relato_replica import get_public_relato_replica
+from app.application.queries.relato_base_cache import relato_base_cache
+from app.config import GALERIA_PUBLIC_SOURCE
 from app.domain.relato.normalizer import normalize_relato_document
+from app.domain.relato.states import RelatoStatus
 from app.application.ux.adapters.galeria_explanation import GaleriaExplanationBuilder
+from app.application.ux.ux_serializer import serialize_ux_effects
 
 # ============================================================
 # 🔹 Seleção de thumbnails (ANTES / DEPOIS)
 # ============================================================
 
-def _pick_thumbnails(imagens: List[dict], storage: StorageAdapter) -> Dict[str, str | None]:
+def _pick_thumbnails(thumb_paths: Dict[str, str | None], signed_urls: Dict[str, str | None]) -> Dict[str, str | None]:
     """
-    Retorna thumbnails separadas por papel clínico.
-    Prioridade:
-      - ANTES
-      - DEPOIS
+    Converte os paths escolhidos em signed URLs já geradas em lote.
     """
-    thumbs = {
-        "antes": None,
-        "depois": None,
+    return {
+        papel: signed_urls.get(path) if path else None
+        for papel, path in thumb_paths.items()
     }
 
-    for img in imagens:
-        papel = img.get("papel_clinico")
-        thumb_path = img.get("storage", {}).get("thumb_path")
-
-        if not thumb_path:
-            continue
-
-        if papel == "ANTES" and thumbs["antes"] is None:
-            thumbs["antes"] = storage.get_signed_url(thumb_path)
-
-        elif papel == "DEPOIS" and thumbs["depois"] is None:
-            thumbs["depois"] = storage.get_signed_url(thumb_path)
-
-    return thumbs
-
 # ============================================================
 # 🧠 Servios Cognitivos (legacy-safe)
 # ============================================================
@@ -58,46 +68,44 @@ _explanation_builder = GaleriaExplanationBuilder()
 async def listar_galeria_publica_v3(
     *,
     limit: int,
-    page: int
+    page: int,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
+    """
+    Com `cursor` pagina por keyset (start_after); sem ele, `page` continua
+    funcionando via offset. `meta.next_cursor` aponta para a próxima página.
+    Lança InvalidCursorError para cursores malformados.
 
-    db = get_firestore_client()
+    Com GALERIA_PUBLIC_SOURCE="cards" lê o read model `galeria_public_cards`
+    (depois do backfill); "relatos" (padrão) monta a partir dos relatos.
+    """
 
-    # ============================================================
-    # 🧠 Servios Cognitivos (legacy-safe)
-    # ============================================================
-    from app.domain.galeria.eligibility_service import RelatoEligibilityService
-    from app.domain.relato.states import RelatoStatus
-    from app.domain.galeria.visibility_policy import (
-        RelatoVisibilityPolicy,
-    )
-     
+    db = get_firestore_client()
 
-    eligibility_service = RelatoEligibilityService()
-    explanation_builder = GaleriaExplanationBuilder()
+    if GALERIA_PUBLIC_SOURCE == "cards":
+        return await _listar_galeria_cards(db, limit=limit, page=page, cursor=cursor)
 
     # --------------------------------------------------------
     # 1️⃣ Buscar relatos pblicos
+    # Mesma coleção e mesmo campo da projeção dos cards (is_public_gallery_relato)
     # --------------------------------------------------------
-    relatos_query = (
-        db.collection_group("relatos")
-        .where(filter=FieldFilter("public_visibility.status", "==", RelatoStatus.APPROVED_PUBLIC.value))
-        .order_by("created_at", direction="DESCENDING")
-        .limit(limit)
-        .offset((page - 1) * limit)
+    relatos_query = apply_keyset_page(
+        db.collection("relatos")
+        .where(filter=FieldFilter("public_visibility.status", "==", RelatoStatus.APPROVED_PUBLIC.value)),
+        db=db,
+        collection="relatos",
+        limit=limit,
+        page=page,
+        cursor=cursor,
     )
 
-    relatos = await asyncio.to_thread(
-        lambda: [(doc.id, doc.to_dict()) for doc in relatos_query.stream()]
-    )
+    snapshots = await asyncio.to_thread(lambda: list(relatos_query.stream()))
+    snapshots, next_cursor = split_keyset_page(snapshots, limit)
+    relatos = [(doc.id, doc.to_dict()) for doc in snapshots]
 
     if not relatos:
         return {
-            "meta": {
-                "page": page,
-                "limit": limit,
-                "count": 0
-            },
+            "meta": page_meta(page=page, limit=limit, count=0, next_cursor=None),
             "dados": []
         }
 
@@ -128,10 +136,20 @@ async def listar_galeria_publica_v3(
 
     storage = StorageAdapter()
 
+    # Uma única chamada em lote assina todas as thumbnails da página
+    thumb_paths_por_relato = {
+        relato_id: _pick_thumbnail_paths(imagens_por_relato.get(relato_id, []))
+        for relato_id, _ in relatos
+    }
+    signed_urls = await asyncio.to_thread(
+        storage.get_signed_urls,
+        [path for paths in thumb_paths_por_relato.values() for path in paths.values() if path],
+    )
+
     for relato_id, relato in relatos:
         imagens = imagens_por_relato.get(relato_id, [])
 
-        thumbs = _pick_thumbnails(imagens, storage)
+        thumbs = _pick_thumbnails(thumb_paths_por_relato[relato_id], signed_urls)
 
         thumbnail_url = (
             thumbs["antes"]
@@ -145,43 +163,9 @@ async def listar_galeria_publica_v3(
         else:
             created_at = datetime.now(timezone.utc).isoformat()
 
-        # =====================================================
-        # 🧠 PIPELINE COGNITIVO — D2 (exposio progressiva)
-        # =====================================================
-
-        # Poltica mnima (no muda comportamento)
-        visibility_policy = RelatoVisibilityPolicy(
-            status=RelatoStatus.APPROVED_PUBLIC,
-            constraints=set(),
-        )
-
-        eligibility_decision = eligibility_service.decide(
-            user=None,  # galeria pblica
-            relato_policy=visibility_policy,
-        )
-
-        # 🔹 Similaridade neutra (placeholder controlado)
-        similarity_score_value = 0.65
-
-        ux_effects = []
-
-        # explicao base (D)
-        ux_effects.extend(
-            explanation_builder.build_for_relato(
-                eligibility=eligibility_decision,
-                similarity=None,
-            )
-        )
-
-        # exposio progressiva (D2)
-        ux_effects.append(
-            explanation_builder.build_progressive_exposure(
-                similarity_score=similarity_score_value
-            )
-        )
-        from app.application.ux.ux_serializer import serialize_ux_effects
+        # Efeitos de UX da galeria anônima: iguais para todo card
+        ux_effects = public_ux_effects()
 
-       
         # ----------------------------------------------------
         # Payload final (formatado para o frontend Vue)
         # ----------------------------------------------------
@@ -197,26 +181,148 @@ async def listar_galeria_publica_v3(
             "tags": relato.get("tags_extraidas") or relato.get("tags") or [],
             "created_at": created_at,
             "has_images": bool(imagens),
-            "ux_effects": [
-                 effect.serialize() if hasattr(effect, "serialize") else effect.__dict__
-                 for effect in ux_effects
-            ],
+            "ux_effects": ux_effects,
         })
 
     return {
-        "meta": {
-            "page": page,
-            "limit": limit,
-            "count": len(dados)
-        },
+        "meta": page_meta(page=page, limit=limit, count=len(dados), next_cursor=next_cursor),
+        "dados": dados
+    }
+
+async def _listar_galeria_cards(
+    db,
+    *,
+    limit: int,
+    page: int,
+    cursor: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Galeria pública a partir do read model: uma consulta indexada e uma
+    assinatura em lote das thumbnails, sem joins nem trabalho de domínio.
+    Com a réplica em memória atualizada, nem a consulta é feita.
+    """
+    replica_page = get_public_relato_replica().list_galeria_cards(
+        limit=limit,
+        page=page,
+        cursor=cursor,
+    )
+
+    if replica_page is not None:
+        cards = [card for _, card in replica_page[:limit]]
+        next_cursor = None
+        if len(replica_page) > limit and cards:
+            last_path, last_card = replica_page[limit - 1]
+            next_cursor = encode_galeria_cursor(last_card.get("created_at"), last_path)
+    else:
+        cards_query = apply_keyset_page(
+            db.collection(GALERIA_CARDS_COLLECTION),
+            db=db,
+            collection=GALERIA_CARDS_COLLECTION,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+        )
+
+        snapshots = await asyncio.to_thread(lambda: list(cards_query.stream()))
+        snapshots, next_cursor = split_keyset_page(snapshots, limit)
+        cards = [doc.to_dict() for doc in snapshots]
+
+    thumb_paths = [
+        path
+        for card in cards
+        for path in (card.get("thumb_paths") or {}).values()
+        if path
+    ]
+    signed_urls = (
+        await asyncio.to_thread(StorageAdapter().get_signed_urls, thumb_paths)
+        if thumb_paths
+        else {}
+    )
+
+    dados = [card_to_gallery_item(card, signed_urls) for card in cards]
+
+    return {
+        "meta": page_meta(page=page, limit=limit, count=len(dados), next_cursor=next_cursor),
         "dados": dados
     }
     
+def rank_contextual_candidates(
+    *,
+    relato_base: Optional[Dict[str, Any]],
+    relatos: List[Tuple[str, Dict[str, Any]]],
+    min_similarity: Optional[float],
+    limit: int,
+    tone_features: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[Tuple[str, Dict[str, Any], SimilarityScore]]:
+    """
+    Similaridade de todos os candidatos contra o relato-base em um único
+    calculate_many (SYMPTOMS, THERAPY_RESPONSE e NARRATIVE_TONE), filtro
+    pelo threshold e seleção da página com heap (mesma ordem de um sort
+    estável por score decrescente).
+
+    `tone_features`: features de tom guardadas nos cards, por relato_id;
+    candidatos sem elas têm as features calculadas do texto.
+    """
+    if not relatos:
+        return []
+
+    compiled = compile_policy(SIMILARITY_POLICY_V1)
+
+    if relato_base:
+        base_tags = relato_base.get("tags_normalizadas") or normalize_tags(
+            relato_base.get("tags_extraidas") or []
+        )
+        base_tone = relato_base.get("tone_features") or narrative_tone_features(
+            relato_base.get("excerpt")
+        )
+        stored_tones = tone_features or {}
+        rows = []
+        for relato_id, relato in relatos:
+            tags_score = jaccard_from_sets(
+                base_tags,
+                normalize_tags(relato.get("tags_extraidas") or []),
+            )
+            public_excerpt = relato.get("public_excerpt") or {}
+            rows.append(compiled.row({
+                SimilarityAxis.SYMPTOMS: tags_score,
+                SimilarityAxis.THERAPY_RESPONSE: tags_score,
+                # features guardadas no card: só aritmética
+                SimilarityAxis.NARRATIVE_TONE: narrative_tone_similarity_from_features(
+                    base_tone,
+                    resolve_tone_features(
+                        stored_tones.get(relato_id),
+                        public_excerpt.get("text"),
+                    ),
+                ),
+            }))
+    else:
+        # sem relato-base não há evidência: todos os eixos zerados
+        rows = [compiled.row({})] * len(relatos)
+
+    batch = _similarity_calculator.calculate_many(
+        partial_scores=rows,
+        policy=compiled,
+    )
+
+    selected = [
+        index
+        for index, total in enumerate(batch.totals)
+        if min_similarity is None or total >= min_similarity
+    ]
+    top = heapq.nlargest(limit, selected, key=batch.totals.__getitem__)
+
+    return [
+        (relatos[index][0], relatos[index][1], batch.score(index))
+        for index in top
+    ]
+
+
 async def listar_galeria_contextual(
     *,
     user_id: str,
     limit: int,
     page: int,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
 
     db = get_firestore_client()
@@ -229,120 +335,97 @@ async def listar_galeria_contextual(
         UserRole,
         ExposureLevel,
     )
-    from app.domain.galeria.eligibility_service import RelatoEligibilityService
     from app.domain.galeria.visibility_policy import (
         RelatoVisibilityPolicy,
         VisibilityConstraint,
     )
-    from app.domain.relato.states import RelatoStatus
-    from app.domain.galeria.similarity.calculator import SimilarityCalculator
-    from app.domain.galeria.similarity.policy import SIMILARITY_POLICY_V1
-    from app.services.ux_adapters.galeria_explanation import (
-        GaleriaExplanationBuilder,
-    )
-
-    eligibility_service = RelatoEligibilityService()
-    similarity_calculator = SimilarityCalculator()
-    explanation_builder = GaleriaExplanationBuilder()
 
     # ============================================================
-    # 1️⃣ Resolver perfil cognitivo do usurio
+    # 1️⃣ Resolver perfil cognitivo do usuário e relato-base
     # ============================================================
 
-    # 🔹 STUB CONTROLADO (v1)
-    # Futuro: buscar do Firestore / users / relatos
+    relato_base = await resolve_relato_base_for_user(user_id=user_id)
+
     user_profile = UserCognitiveProfile(
         user_id=user_id,
         role=UserRole.USER,
-        relato_base_id="RELATO_BASE_ID_DO_USUARIO",
+        relato_base_id=relato_base["id"] if relato_base else None,
         exposure_level=ExposureLevel.BALANCED,
     )
 
-    # ============================================================
-    # 2️⃣ Buscar relatos candidatos (pblicos)
-    # ============================================================
-
-    relatos_query = (
-        db.collection_group("relatos")
-        .where(filter=FieldFilter("public_visibility.status", "==", RelatoStatus.APPROVED_PUBLIC.value))
-        .order_by("created_at", direction="DESCENDING")
-        .limit(limit * 3)  # overfetch controlado
-        .offset((page - 1) * limit)
+    # Elegibilidade não depende do relato candidato (mesma política mínima
+    # para todos): decidida uma vez por requisição
+    eligibility = _eligibility_service.decide(
+        user=user_profile,
+        relato_policy=RelatoVisibilityPolicy(
+            status=RelatoStatus.APPROVED_PUBLIC,
+            constraints={VisibilityConstraint.REQUIRE_SIMILARITY},
+        ),
     )
-
-    relatos = await asyncio.to_thread(
-        lambda: [(doc.id, doc.to_dict()) for doc in relatos_query.stream()]
+    explanation_eligibility = _eligibility_service.decide(
+        user=user_profile,
+        relato_policy=RelatoVisibilityPolicy(
+            status=RelatoStatus.APPROVED_PUBLIC,
+            constraints=set(),
+        ),
     )
 
-    if not relatos:
-        return {
-            "meta": {
-                "page": page,
-                "limit": limit,
-                "count": 0,
-            },
-            "dados": [],
-        }
-
     # ============================================================
-    # 3️⃣ Avaliao cognitiva por relato
+    # 2️⃣ Buscar relatos candidatos (públicos)
     # ============================================================
 
-    scored_relatos = []
-
-    for relato_id, relato in relatos:
+    fetch = limit * 3  # overfetch controlado
+    skip = 0
+    relatos = None
 
-        # Poltica mnima do relato
-        visibility_policy = RelatoVisibilityPolicy(
-            status=RelatoStatus.APPROVED_PUBLIC,
-            constraints={VisibilityConstraint.REQUIRE_SIMILARITY},
-        )
+    # Com similaridade exigida, só relatos de tags parecidas passam do
+    # threshold: a lista curta do índice LSH substitui o overfetch por data
+    if eligibility.similarity_required and not cursor:
+        relatos = _lsh_candidates(relato_base, fetch=page * fetch)
 
-        eligibility = eligibility_service.decide(
-            user=user_profile,
-            relato_policy=visibility_policy,
+    if relatos is not None:
+        # ranking sobre todos os candidatos: a página é uma fatia dele
+        skip = (page - 1) * limit
+        next_cursor = None
+    else:
+        relatos_query = apply_keyset_page(
+            db.collection_group("relatos")
+            .where(filter=FieldFilter("public_visibility.status", "==", RelatoStatus.APPROVED_PUBLIC.value)),
+            db=db,
+            collection="relatos",
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            fetch=fetch,
         )
 
-        if not eligibility.eligible:
-            continue
-
-        # --------------------------------------------------------
-        # 🔹 Similaridade v1 (simples e honesta)
-        # --------------------------------------------------------
+        snapshots = await asyncio.to_thread(lambda: list(relatos_query.stream()))
+        # A próxima página continua depois do último candidato lido (não do último exibido)
+        next_cursor = cursor_for_snapshot(snapshots[-1]) if len(snapshots) >= fetch else None
+        relatos = [(doc.id, doc.to_dict()) for doc in snapshots]
 
-        # STUB: partial scores simples
-        partial_scores = {
-            # exemplos: substituir depois por lgica real
-            # SimilarityAxis.SYMPTOMS: 0.7,
-            # SimilarityAxis.BODY_REGION: 0.6,
+    if not relatos or not eligibility.eligible:
+        return {
+            "meta": page_meta(page=page, limit=limit, count=0, next_cursor=next_cursor),
+            "dados": [],
         }
 
-        similarity_score = similarity_calculator.calculate(
-            partial_scores=partial_scores,
-            policy=SIMILARITY_POLICY_V1,
-        )
-
-        if eligibility.similarity_required:
-            if similarity_score.total < eligibility.min_similarity:
-                continue
-
-        scored_relatos.append(
-            (relato_id, relato, similarity_score)
-        )
-
     # ============================================================
-    # 4️⃣ Ordenar por similaridade
+    # 3️⃣ Similaridade em lote + seleção da página (top-k)
     # ============================================================
 
-    scored_relatos.sort(
-        key=lambda item: item[2].total,
-        reverse=True,
-    )
-
-    scored_relatos = scored_relatos[:limit]
+    scored_relatos = rank_contextual_candidates(
+        relato_base=relato_base,
+        relatos=relatos,
+        min_similarity=eligibility.min_similarity if eligibility.similarity_required else None,
+        limit=skip + limit,
+        tone_features=get_public_relato_replica().card_tone_features(
+            relato_id for relato_id, _ in relatos
+        ),
+    )[skip:]
 
     # ============================================================
-    # 5️⃣ Montar resposta + D2
+    # 4️⃣ Montar resposta + D2
     # ============================================================
 
     dados = []
@@ -355,23 +438,15 @@ async def listar_galeria_contextual(
         else:
             created_at = datetime.now(timezone.utc).isoformat()
 
-        ux_effects = []
-
-        ux_effects.extend(
-            explanation_builder.build_for_relato(
-                eligibility=eligibility_service.decide(
-                    user=user_profile,
-                    relato_policy=RelatoVisibilityPolicy(
-                        status=RelatoStatus.APPROVED_PUBLIC,
-                        constraints=set(),
-                    ),
-                ),
+        ux_effects = list(
+            _explanation_builder.build_for_relato(
+                eligibility=explanation_eligibility,
                 similarity=similarity_score,
             )
         )
 
         ux_effects.append(
-            explanation_builder.build_progressive_exposure(
+            _explanation_builder.build_progressive_exposure(
                 similarity_score=similarity_score.total
             )
         )
@@ -384,25 +459,61 @@ async def listar_galeria_contextual(
 
             "similarity_score": similarity_score.total,
 
-            "ux_effects": [
-                effect.serialize() for effect in ux_effects
-            ],
+            "ux_effects": serialize_ux_effects(ux_effects),
         })
 
     return {
-        "meta": {
-            "page": page,
-            "limit": limit,
-            "count": len(dados),
-        },
+        "meta": page_meta(page=page, limit=limit, count=len(dados), next_cursor=next_cursor),
         "dados": dados,
     }
-    
-    
+
+
+def _lsh_candidates(
+    relato_base: Optional[Dict[str, Any]],
+    *,
+    fetch: int,
+) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+    """
+    Candidatos da galeria contextual pelo índice LSH da réplica: até
+    `fetch` relatos cujas tags colidem com as do relato-base (o próprio
+    relato-base fica de fora). None sem relato-base ou com a réplica
+    desatualizada: a consulta ao Firestore decide.
+    """
+    if not relato_base:
+        return None
+
+    replica = get_public_relato_replica()
+    similar = replica.similar_relatos(
+        relato_base.get("tags_extraidas") or [],
+        limit=fetch,
+        exclude=[relato_base["id"]],
+    )
+    if similar is None:
+        return None
+    return replica.get_relatos(relato_id for relato_id, _ in similar)
+
+
 async def resolve_relato_base_for_user(
     *,
     user_id: str,
 ) -> Optional[Dict[str, Any]]:
+    """
+    Relato-base do usuário, via relato_base_cache (invalidado pelas
+    transições dos relatos do usuário).
+    """
+    user_id_str = str(user_id)
+
+    found, relato_base = relato_base_cache.lookup(user_id_str)
+    if found:
+        return relato_base
+
+    generation = relato_base_cache.generation()
+    relato_base = await _load_relato_base_for_user(user_id_str)
+    relato_base_cache.put(user_id_str, relato_base, generation=generation)
+    return relato_base
+
+
+async def _load_relato_base_for_user(user_id_str: str) -> Optional[Dict[str, Any]]:
     """
     Resolve o relato-base cognitivo do usurio.
 
@@ -416,7 +527,6 @@ async def resolve_relato_base_for_user(
     """
 
     db = get_firestore_client()
-    user_id_str = str(user_id)
     query = (
         db.collection_group("relatos")
         .where(filter=FieldFilter("user_id", "==", user_id_str))
@@ -425,8 +535,9 @@ async def resolve_relato_base_for_user(
         .limit(1)
     )
 
+    # o id vem do snapshot (não é campo do documento)
     relatos = await asyncio.to_thread(
-        lambda: [doc.to_dict() for doc in query.stream()]
+        lambda: [{**doc.to_dict(), "id": doc.id} for doc in query.stream()]
     )
 
     if not relatos:
@@ -454,7 +565,12 @@ async def resolve_relato_base_for_user(
     return {
         "id": relato.get('id'),
         "tags_extraidas": tags,
+        "tags_normalizadas": normalize_tags(tags),
         "excerpt": excerpt,
+        "tone_features": resolve_tone_features(
+            get_public_relato_replica().card_tone_features([relato["id"]]).get(relato["id"]),
+            excerpt,
+        ),
     }
 
 
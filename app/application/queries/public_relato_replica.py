@@ -0,0 +1,791 @@
+# app/application/queries/public_relato_replica.py
+"""
+Réplica em memória (por processo) dos relatos públicos.
+
+`/feed` anônimo, `/galeria/public` e a leitura de relatos na galeria pública
+consultam sempre o mesmo conjunto pequeno de relatos aprovados. A réplica
+mantém esse conjunto em memória, alimentada por listeners `on_snapshot` do
+Firestore, e as leituras públicas deixam de fazer round trips:
+
+- relatos com status ou public_visibility.status == approved_public;
+- galeria_public_cards (read model da galeria).
+
+Os enrichments (tags e enrichment do feed) não têm listener: a coleção
+inteira não cabe em cada processo. Eles são lidos em lote (get_all) só para
+os relatos públicos que entram ou mudam em cada snapshot. O enrichment é
+gravado antes da transição de status que o publica, então acompanhar as
+mudanças do relato cobre o caso comum; um relato que já era público e é
+reenriquecido não muda, e seu enrichment fica defasado até a próxima
+releitura completa do watchdog (no máximo `enrichments_refresh_seconds`).
+
+Os candidatos do feed também alimentam um índice invertido
+(FeedCandidateIndex), atualizado só para os relatos que mudaram em cada
+snapshot, usado pelo feed personalizado para buscar no corpus inteiro.
+Os relatos da galeria pública (public_visibility.status == approved_public)
+alimentam da mesma forma um índice MinHash/LSH das tags, que gera os
+candidatos da galeria contextual ("relatos parecidos com o meu") sem varrer
+a galeria. O índice vem dos relatos, não dos cards: cobre o conjunto
+público inteiro qualquer que seja GALERIA_PUBLIC_SOURCE.
+
+Cada snapshot também recalcula a versão da visão (ReplicaValidator): um
+digest dos `update_time` dos documentos, igual em todas as instâncias, e o
+maior deles. As rotas públicas derivam ETag/Last-Modified dessas versões e
+respondem 304 sem montar a resposta.
+
+Limite de defasagem: enquanto os listeners estão ativos o Firestore empurra
+as mudanças quase em tempo real. Se algum listener cair, a réplica continua
+sendo usada por no máximo `max_staleness_seconds`; depois disso as leituras
+voltam às consultas diretas (None nos métodos de leitura). Antes do snapshot
+inicial a réplica também não é usada.
+
+Um watchdog (thread própria, a cada `watchdog_interval_seconds`) reinicia os
+listeners caídos além do limite, refaz a leitura dos enrichments que falhou
+e relê todos os enrichments a cada `enrichments_refresh_seconds`; as
+leituras só consultam o estado, nunca reiniciam nada.
+
+O ciclo de vida é controlado pelo lifespan da aplicação
+(start_public_relato_replica / shutdown_public_relato_replica).
+"""
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from google.cloud.firestore import FieldFilter
+from google.cloud.firestore_v1.base_query import Or
+
+from app.application.queries.feed_candidate_index import FeedCandidateIndex, feed_index_keys
+from app.application.queries.galeria_cursor import decode_galeria_cursor
+from app.application.queries.readmodels.galeria_card import GALERIA_CARDS_COLLECTION, is_public_gallery_relato
+from app.application.queries.relato_base_cache import relato_base_cache
+from app.domain.galeria.similarity.scorers.minhash import MinHashLSHIndex, minhash_signature
+from app.domain.galeria.similarity.scorers.tags_overlap import jaccard_from_sets, normalize_tags
+from app.config import (
+    PUBLIC_REPLICA_ENRICHMENTS_REFRESH_SECONDS,
+    PUBLIC_REPLICA_MAX_STALENESS_SECONDS,
+    PUBLIC_REPLICA_WATCHDOG_INTERVAL_SECONDS,
+)
+from app.domain.relato.states import RelatoStatus
+from app.firestore.client import get_firestore_client
+from app.repositories.relato_repository import build_relato_dict
+
+logger = logging.getLogger(__name__)
+
+_APPROVED = RelatoStatus.APPROVED_PUBLIC.value
+
+_RELATOS = "relatos"
+_ENRICHMENTS = "enrichments"
+_CARDS = "cards"
+
+
+def _order_value(value: Any) -> Tuple[int, Any]:
+    """
+    Chave de ordenação compatível com a ordem de tipos do Firestore
+    (null < booleanos < números < timestamps < strings).
+    """
+    if value is None:
+        return (0, 0)
+    if isinstance(value, bool):
+        return (1, value)
+    if isinstance(value, (int, float)):
+        return (2, value)
+    if isinstance(value, datetime):
+        return (3, value.timestamp())
+    if isinstance(value, str):
+        return (4, value)
+    return (5, str(value))
+
+
+class ReplicaValidator(NamedTuple):
+    """Versão de uma visão (ou de um relato) da réplica."""
+    version: str
+    last_modified: Optional[datetime]
+
+
+def _doc_version(doc, data: Dict[str, Any], *fields: str) -> Any:
+    """
+    `update_time` do snapshot; listeners sem esse metadado (testes) caem
+    nos campos de data do próprio documento.
+    """
+    version = getattr(doc, "update_time", None)
+    for field in fields:
+        if version is not None:
+            break
+        version = data.get(field)
+    return version
+
+
+def _as_utc(value: Any) -> Optional[datetime]:
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _view_validator(versions: Dict[str, Any]) -> ReplicaValidator:
+    digest = hashlib.blake2b(digest_size=12)
+    for key in sorted(versions):
+        digest.update(f"{key}\x00{versions[key]}\x01".encode("utf-8"))
+
+    modified = [value for value in map(_as_utc, versions.values()) if value is not None]
+    return ReplicaValidator(digest.hexdigest(), max(modified) if modified else None)
+
+
+def _relato_validator(version: Any) -> ReplicaValidator:
+    return ReplicaValidator(str(version), _as_utc(version))
+
+
+class PublicRelatoReplica:
+    def __init__(
+        self,
+        *,
+        max_staleness_seconds: float = PUBLIC_REPLICA_MAX_STALENESS_SECONDS,
+        watchdog_interval_seconds: float = PUBLIC_REPLICA_WATCHDOG_INTERVAL_SECONDS,
+        enrichments_refresh_seconds: float = PUBLIC_REPLICA_ENRICHMENTS_REFRESH_SECONDS,
+        db=None,
+    ):
+        self.max_staleness_seconds = max_staleness_seconds
+        self.watchdog_interval_seconds = watchdog_interval_seconds
+        self.enrichments_refresh_seconds = enrichments_refresh_seconds
+        self._db = db
+
+        # protege todo o estado abaixo, inclusive _inactive_since
+        self._lock = threading.Lock()
+        self._watches: Dict[str, Any] = {}
+        self._synced: set = set()
+        self._started = False
+        self._inactive_since: Optional[float] = None
+        self._last_restart = 0.0
+        self._stop_event = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+        # relato_id -> documento bruto
+        self._relatos: Dict[str, Dict[str, Any]] = {}
+        # relato_id -> payload do enrichment (campo "data"), só dos relatos públicos
+        self._enrichments: Dict[str, Dict[str, Any]] = {}
+        self._enrichment_versions: Dict[str, Any] = {}
+        # serializa leitura + aplicação dos enrichments
+        self._enrichments_lock = threading.Lock()
+        # relógio (monotonic) da última leitura completa dos enrichments
+        self._enrichments_read_at = 0.0
+        # (chave de ordenação, path, card), já ordenados como a galeria
+        self._cards: List[Tuple[Tuple, str, Dict[str, Any]]] = []
+        # candidatos do feed, já ordenados por updated_at desc
+        self._feed_ids: List[str] = []
+        # candidatos do feed por região, faixa etária e sintomas
+        self._index = FeedCandidateIndex()
+        # relato_id -> features de tom do card
+        self._card_tones: Dict[str, Dict[str, Any]] = {}
+        # relato_id -> tags normalizadas dos relatos da galeria, e LSH das assinaturas
+        self._relato_tags: Dict[str, frozenset] = {}
+        self._lsh = MinHashLSHIndex()
+        # versão de cada visão e de cada relato (ETag/Last-Modified)
+        self._validators: Dict[str, ReplicaValidator] = {}
+        self._relato_versions: Dict[str, Any] = {}
+
+        self._hits = 0
+        self._fallbacks = 0
+        self._restarts = 0
+
+    # =========================
+    # Ciclo de vida
+    # =========================
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._stop_event.clear()
+
+        self._subscribe()
+        self._watchdog = threading.Thread(
+            target=self._watchdog_loop,
+            name="public-replica-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+        logger.info("[PUBLIC_REPLICA] Listeners iniciados")
+
+    def stop(self) -> None:
+        with self._lock:
+            self._started = False
+            self._stop_event.set()
+            watchdog, self._watchdog = self._watchdog, None
+
+        self._unsubscribe()
+        if watchdog is not None and watchdog is not threading.current_thread():
+            watchdog.join(timeout=5)
+
+    def is_fresh(self) -> bool:
+        """
+        True se a réplica pode atender leituras: snapshot inicial recebido e
+        listeners ativos (ou inativos há menos de `max_staleness_seconds`).
+        Não reinicia listeners (isso é papel do watchdog).
+        """
+        with self._lock:
+            if not self._started or len(self._synced) < 3:
+                return False
+            return self._within_staleness(time.monotonic())
+
+    # =========================
+    # Leituras (None = use a consulta direta)
+    # =========================
+
+    def list_public_candidates(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Mesmo resultado de RelatoRepository.get_aprovados: status
+        approved_public, por updated_at desc, com enrichment e tags.
+        """
+        if not self._serve():
+            return None
+
+        with self._lock:
+            return [self._feed_relato(relato_id) for relato_id in self._feed_ids[:limit]]
+
+    def list_matching_candidates(
+        self,
+        *,
+        regioes: Iterable[str],
+        faixa_etaria: Optional[str],
+        sintomas: Iterable[str],
+        limit: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Até `limit` candidatos do feed escolhidos pelo índice invertido no
+        corpus aprovado inteiro; completa com os mais recentes quando poucos
+        relatos casam com o perfil.
+        """
+        if not self._serve():
+            return None
+
+        with self._lock:
+            relato_ids = self._index.candidates(
+                regioes=regioes,
+                faixa_etaria=faixa_etaria,
+                sintomas=sintomas,
+                limit=limit,
+            )
+            if len(relato_ids) < limit:
+                chosen = set(relato_ids)
+                for relato_id in self._feed_ids:
+                    if len(relato_ids) >= limit:
+                        break
+                    if relato_id not in chosen:
+                        relato_ids.append(relato_id)
+
+            return [self._feed_relato(relato_id) for relato_id in relato_ids]
+
+    def similar_relatos(
+        self,
+        tags: Iterable[str],
+        *,
+        limit: int,
+        exclude: Iterable[str] = (),
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Relatos da galeria com tags parecidas: candidatos pelo índice LSH e
+        Jaccard exato (jaccard_from_sets) só sobre eles. Retorna até `limit`
+        pares (relato_id, score) por score decrescente.
+        """
+        base = normalize_tags(tags)
+        signature = minhash_signature(base)
+
+        if not self._serve():
+            return None
+
+        excluded = set(exclude)
+        with self._lock:
+            scored = [
+                (relato_id, jaccard_from_sets(base, self._relato_tags[relato_id]))
+                for relato_id in self._lsh.candidates(signature)
+                if relato_id not in excluded
+            ]
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return [item for item in scored[:limit] if item[1] > 0.0]
+
+    def card_tone_features(self, relato_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Features de tom guardadas nos cards (relato_id -> features). Relatos
+        sem card, ou a réplica desatualizada, ficam de fora: o chamador
+        calcula a partir do texto (resolve_tone_features).
+        """
+        if not self.is_fresh():
+            return {}
+
+        with self._lock:
+            return {
+                relato_id: self._card_tones[relato_id]
+                for relato_id in relato_ids
+                if relato_id in self._card_tones
+            }
+
+    def get_relato(self, relato_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Documento bruto de um relato público. None se a réplica não está
+        atualizada ou se o relato não é público (a consulta direta decide).
+        """
+        if not self._serve():
+            return None
+
+        with self._lock:
+            data = self._relatos.get(relato_id)
+            return dict(data) if data is not None else None
+
+    def get_relatos(self, relato_ids: Iterable[str]) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Pares (relato_id, documento bruto) dos relatos públicos pedidos, na
+        mesma ordem; os que não são públicos ficam de fora. None se a
+        réplica não está atualizada.
+        """
+        if not self._serve():
+            return None
+
+        with self._lock:
+            return [
+                (relato_id, dict(self._relatos[relato_id]))
+                for relato_id in relato_ids
+                if relato_id in self._relatos
+            ]
+
+    def list_galeria_cards(
+        self,
+        *,
+        limit: int,
+        page: int,
+        cursor: Optional[str],
+    ) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Mesma paginação de apply_keyset_page sobre galeria_public_cards:
+        (created_at desc, __name__ desc), `start_after` com cursor ou offset
+        por `page`. Retorna até `limit + 1` pares (path, card).
+        Lança InvalidCursorError para cursores malformados.
+        """
+        position = None
+        if cursor:
+            created_at, doc_path = decode_galeria_cursor(cursor, GALERIA_CARDS_COLLECTION)
+            position = (_order_value(created_at), doc_path)
+
+        if not self._serve():
+            return None
+
+        with self._lock:
+            cards = self._cards
+
+            if position is not None:
+                # ordem desc: pula tudo que vem antes (ou é) o cursor
+                start = 0
+                while start < len(cards) and (cards[start][0], cards[start][1]) >= position:
+                    start += 1
+            else:
+                start = (page - 1) * limit if page > 1 else 0
+
+            return [(path, dict(card)) for _, path, card in cards[start:start + limit + 1]]
+
+    # =========================
+    # Validadores (None = sem GET condicional)
+    # =========================
+
+    def feed_validator(self) -> Optional[ReplicaValidator]:
+        """Versão dos candidatos do feed (relatos + enrichments)."""
+        return self._combined_validator(_RELATOS, _ENRICHMENTS)
+
+    def galeria_validator(self, source: str = "cards") -> Optional[ReplicaValidator]:
+        """
+        Versão da galeria pública para a fonte configurada
+        (GALERIA_PUBLIC_SOURCE). Com "relatos" a resposta sai dos relatos,
+        mas as thumbnails só mudam nos cards (a projeção roda nos ganchos
+        de imagens), então as duas visões entram na versão.
+        """
+        if source == "cards":
+            return self._combined_validator(_CARDS)
+        return self._combined_validator(_RELATOS, _CARDS)
+
+    def relato_validator(self, relato_id: str) -> Optional[ReplicaValidator]:
+        """Versão do documento de um relato público; None se não é público."""
+        if not self.is_fresh():
+            return None
+
+        with self._lock:
+            version = self._relato_versions.get(relato_id)
+        return _relato_validator(version) if version is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            started = self._started
+            synced = len(self._synced)
+            sizes = {
+                "relatos": len(self._relatos),
+                "feed_candidates": len(self._feed_ids),
+                "enrichments": len(self._enrichments),
+                "cards": len(self._cards),
+                "lsh_relatos": len(self._lsh),
+            }
+            index = self._index.stats()
+
+        lookups = self._hits + self._fallbacks
+        return {
+            "started": started,
+            "synced_listeners": synced,
+            "fresh": self.is_fresh(),
+            **sizes,
+            "hits": self._hits,
+            "fallbacks": self._fallbacks,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "restarts": self._restarts,
+            "candidate_index": index,
+            "max_staleness_seconds": self.max_staleness_seconds,
+        }
+
+    # =========================
+    # Internos
+    # =========================
+
+    def _combined_validator(self, *views: str) -> Optional[ReplicaValidator]:
+        if not self.is_fresh():
+            return None
+
+        with self._lock:
+            validators = [self._validators.get(view) for view in views]
+        if any(validator is None for validator in validators):
+            return None
+        if len(validators) == 1:
+            return validators[0]
+
+        modified = [validator.last_modified for validator in validators if validator.last_modified]
+        return ReplicaValidator(
+            ".".join(validator.version for validator in validators),
+            max(modified) if modified else None,
+        )
+
+    def _serve(self) -> bool:
+        fresh = self.is_fresh()
+        with self._lock:
+            if fresh:
+                self._hits += 1
+            else:
+                self._fallbacks += 1
+        return fresh
+
+    def _feed_relato(self, relato_id: str) -> Dict[str, Any]:
+        return build_relato_dict(
+            relato_id,
+            self._relatos[relato_id],
+            self._enrichments.get(relato_id, {}),
+        )
+
+    def _reindex(self, relato_ids: Iterable[str]) -> None:
+        # chamado com self._lock adquirido
+        for relato_id in relato_ids:
+            data = self._relatos.get(relato_id)
+            if data is None or data.get("status") != _APPROVED or data.get("updated_at") is None:
+                self._index.remove(relato_id)
+                continue
+            self._index.upsert(
+                relato_id,
+                feed_index_keys(self._feed_relato(relato_id)),
+                _order_value(data["updated_at"]),
+            )
+
+    def _index_tags(self, relato_ids: Iterable[str]) -> None:
+        # chamado com self._lock adquirido
+        for relato_id in relato_ids:
+            data = self._relatos.get(relato_id)
+            if data is None or not is_public_gallery_relato(data):
+                self._relato_tags.pop(relato_id, None)
+                self._lsh.remove(relato_id)
+                continue
+
+            tags = frozenset(normalize_tags(data.get("tags_extraidas") or []))
+            if self._relato_tags.get(relato_id) == tags:
+                continue
+            self._relato_tags[relato_id] = tags
+            self._lsh.insert(relato_id, minhash_signature(tags))
+
+    def _index_card(self, relato_id: str, card: Optional[Dict[str, Any]]) -> None:
+        # chamado com self._lock adquirido
+        if card is not None and isinstance(card.get("tone_features"), dict):
+            self._card_tones[relato_id] = card["tone_features"]
+        else:
+            self._card_tones.pop(relato_id, None)
+
+    def _client(self):
+        return self._db or get_firestore_client()
+
+    def _fetch_enrichments(
+        self,
+        relato_ids: List[str],
+    ) -> Optional[Dict[str, Optional[Tuple[Dict[str, Any], Any]]]]:
+        """
+        Enrichments dos relatos em uma chamada (get_all): relato_id ->
+        (payload, versão), ou None se o relato não tem enrichment. Retorna
+        None se a leitura falhar.
+        """
+        if not relato_ids:
+            return {}
+
+        db = self._client()
+        collection = db.collection("relato_enrichments")
+        fetched: Dict[str, Optional[Tuple[Dict[str, Any], Any]]] = dict.fromkeys(relato_ids)
+        try:
+            for snapshot in db.get_all([collection.document(relato_id) for relato_id in relato_ids]):
+                if not snapshot.exists:
+                    continue
+                data = snapshot.to_dict() or {}
+                fetched[snapshot.id] = (
+                    data.get("data", {}),
+                    _doc_version(snapshot, data, "updated_at", "created_at"),
+                )
+        except Exception:
+            logger.exception("[PUBLIC_REPLICA] Falha ao ler enrichments de %d relatos", len(relato_ids))
+            return None
+        return fetched
+
+    def _apply_enrichments(self, fetched, *, full: bool) -> None:
+        # chamado com self._lock adquirido
+        if full:
+            self._enrichments = {}
+            self._enrichment_versions = {}
+        for relato_id, entry in fetched.items():
+            if entry is None:
+                self._enrichments.pop(relato_id, None)
+                self._enrichment_versions.pop(relato_id, None)
+            else:
+                self._enrichments[relato_id], self._enrichment_versions[relato_id] = entry
+        # relatos que saíram do conjunto público levam o enrichment junto
+        for relato_id in [key for key in self._enrichments if key not in self._relatos]:
+            del self._enrichments[relato_id]
+            del self._enrichment_versions[relato_id]
+        self._validators[_ENRICHMENTS] = _view_validator(self._enrichment_versions)
+        self._synced.add(_ENRICHMENTS)
+
+    def _within_staleness(self, now: float) -> bool:
+        # chamado com self._lock adquirido
+        if all(getattr(watch, "is_active", True) for watch in self._watches.values()):
+            self._inactive_since = None
+            return True
+
+        if self._inactive_since is None:
+            self._inactive_since = now
+            logger.warning("[PUBLIC_REPLICA] Listener inativo; réplica em contagem de defasagem")
+
+        return now - self._inactive_since < self.max_staleness_seconds
+
+    def _watchdog_loop(self) -> None:
+        while not self._stop_event.wait(self.watchdog_interval_seconds):
+            try:
+                self._check_listeners(time.monotonic())
+            except Exception:
+                logger.exception("[PUBLIC_REPLICA] Falha no watchdog")
+
+    def _check_listeners(self, now: float) -> None:
+        """
+        Uma rodada do watchdog: reinicia listeners inativos além do limite;
+        com os listeners em dia, refaz a leitura de enrichments que falhou
+        ou, vencido `enrichments_refresh_seconds`, relê todos.
+        """
+        with self._lock:
+            if not self._started:
+                return
+            # sem watches: o último reinício falhou ao assinar
+            expired = not self._watches or not self._within_staleness(now)
+
+        if expired:
+            self._restart(now)
+        else:
+            self._resync_enrichments(now)
+
+    def _resync_enrichments(self, now: float) -> None:
+        with self._enrichments_lock:
+            with self._lock:
+                if _RELATOS not in self._synced:
+                    return
+                refresh_due = (
+                    self.enrichments_refresh_seconds > 0
+                    and now - self._enrichments_read_at >= self.enrichments_refresh_seconds
+                )
+                if _ENRICHMENTS in self._synced and not refresh_due:
+                    return
+                relato_ids = list(self._relatos)
+
+            fetched = self._fetch_enrichments(relato_ids)
+            if fetched is None:
+                return
+
+            with self._lock:
+                self._apply_enrichments(fetched, full=True)
+                self._enrichments_read_at = now
+                self._index.clear()
+                self._reindex(list(self._relatos))
+
+    def _subscribe(self) -> None:
+        db = self._client()
+
+        relatos_query = db.collection("relatos").where(
+            filter=Or([
+                FieldFilter("status", "==", _APPROVED),
+                FieldFilter("public_visibility.status", "==", _APPROVED),
+            ])
+        )
+
+        watches = {
+            _RELATOS: relatos_query.on_snapshot(self._on_relatos),
+            _CARDS: db.collection(GALERIA_CARDS_COLLECTION).on_snapshot(self._on_cards),
+        }
+
+        with self._lock:
+            self._watches = watches
+
+    def _unsubscribe(self) -> None:
+        with self._lock:
+            watches, self._watches = self._watches, {}
+            self._synced.clear()
+            self._validators.clear()
+            self._inactive_since = None
+
+        for watch in watches.values():
+            try:
+                watch.unsubscribe()
+            except Exception:
+                logger.exception("[PUBLIC_REPLICA] Falha ao encerrar listener")
+
+    def _restart(self, now: float) -> None:
+        with self._lock:
+            if now - self._last_restart < self.max_staleness_seconds:
+                return
+            self._last_restart = now
+            self._restarts += 1
+
+        logger.warning("[PUBLIC_REPLICA] Listener inativo além do limite; reiniciando")
+        self._unsubscribe()
+        with self._lock:
+            if not self._started:
+                return
+        try:
+            self._subscribe()
+        except Exception:
+            logger.exception("[PUBLIC_REPLICA] Falha ao reiniciar listeners")
+
+    # Callbacks dos listeners: recebem sempre o conjunto completo atual de
+    # documentos, então cada chamada reconstrói a visão correspondente. O
+    # índice de candidatos e os enrichments só são tocados para os
+    # documentos em `changes` (no snapshot inicial, todos chegam como ADDED).
+
+    def _on_relatos(self, docs, changes, _read_time) -> None:
+        relatos = {}
+        versions = {}
+        for doc in docs:
+            data = doc.to_dict() or {}
+            relatos[doc.id] = data
+            versions[doc.id] = _doc_version(doc, data, "updated_at", "created_at")
+
+        # get_aprovados: status == approved_public, order_by updated_at desc
+        # (documentos sem updated_at ficam de fora, como na consulta)
+        feed = [
+            (relato_id, data["updated_at"])
+            for relato_id, data in relatos.items()
+            if data.get("status") == _APPROVED and data.get("updated_at") is not None
+        ]
+        feed.sort(key=lambda item: _order_value(item[1]), reverse=True)
+
+        with self._enrichments_lock:
+            with self._lock:
+                initial = _RELATOS not in self._synced
+                # sem enrichments sincronizados (início ou leitura que falhou): relê todos
+                full = _ENRICHMENTS not in self._synced
+            changed = [change.document.id for change in changes]
+            fetched = self._fetch_enrichments(
+                list(relatos) if full else [relato_id for relato_id in changed if relato_id in relatos]
+            )
+
+            with self._lock:
+                self._relatos = relatos
+                self._relato_versions = versions
+                self._validators[_RELATOS] = _view_validator(versions)
+                self._feed_ids = [relato_id for relato_id, _ in feed]
+                if fetched is None:
+                    # réplica fora de uso até a próxima leitura completa
+                    self._synced.discard(_ENRICHMENTS)
+                else:
+                    self._apply_enrichments(fetched, full=full)
+                    if full:
+                        self._enrichments_read_at = time.monotonic()
+                if initial or full:
+                    self._index.clear()
+                    self._reindex(relatos)
+                else:
+                    self._reindex(changed)
+                if initial:
+                    self._relato_tags.clear()
+                    self._lsh.clear()
+                    self._index_tags(relatos)
+                else:
+                    self._index_tags(changed)
+                self._synced.add(_RELATOS)
+
+        # O relato-base de um usuário é um relato aprovado dele: qualquer
+        # relato que entra, muda ou sai deste conjunto invalida o do dono
+        if initial:
+            relato_base_cache.clear()
+            return
+        for change in changes:
+            owners = {
+                (change.document.to_dict() or {}).get("user_id"),
+                relatos.get(change.document.id, {}).get("user_id"),
+            }
+            for owner in owners - {None}:
+                relato_base_cache.invalidate(str(owner))
+
+    def _on_cards(self, docs, changes, _read_time) -> None:
+        cards = []
+        by_id = {}
+        versions = {}
+        for doc in docs:
+            data = doc.to_dict() or {}
+            by_id[doc.id] = data
+            versions[doc.id] = _doc_version(doc, data, "projected_at", "created_at")
+            if "created_at" not in data:
+                continue
+            cards.append((_order_value(data["created_at"]), doc.reference.path, data))
+        cards.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+        with self._lock:
+            initial = _CARDS not in self._synced
+            self._cards = cards
+            self._validators[_CARDS] = _view_validator(versions)
+            if initial:
+                self._card_tones.clear()
+                changed = list(by_id)
+            else:
+                changed = [change.document.id for change in changes]
+            for relato_id in changed:
+                self._index_card(relato_id, by_id.get(relato_id))
+            self._synced.add(_CARDS)
+
+
+_replica: Optional[PublicRelatoReplica] = None
+_replica_lock = threading.Lock()
+
+
+def get_public_relato_replica() -> PublicRelatoReplica:
+    global _replica
+    with _replica_lock:
+        if _replica is None:
+            _replica = PublicRelatoReplica()
+        return _replica
+
+
+def start_public_relato_replica() -> PublicRelatoReplica:
+    replica = get_public_relato_replica()
+    replica.start()
+    return replica
+
+
+def shutdown_public_relato_replica() -> None:
+    global _replica
+    with _replica_lock:
+        replica, _replica = _replica, None
+    if replica is not None:
+        replica.stop()
@@ -0,0 +1,227 @@
+# app/application/queries/readmodels/galeria_card.py
+"""
+Read model `galeria_public_cards`: um documento por relato visível na
+galeria pública, já no formato do card.
+
+O card é o mesmo para todo leitor anônimo, então elegibilidade, explicações
+de UX e escolha das thumbnails são calculadas uma vez — quando o relato
+muda de status, quando o enriquecimento termina ou quando as imagens mudam —
+e uma página da galeria vira uma única consulta indexada, sem joins.
+
+Signed URLs não são guardadas (expiram): o card guarda os paths das
+thumbnails e a listagem assina tudo em lote.
+
+O card também guarda as tags normalizadas e as features de tom do excerpt
+público (tone_features), para a similaridade narrativa não varrer o texto
+a cada comparação. O relato em si não é tocado: uma escrita nele
+dispararia os listeners de relatos e invalidaria o cache de relato-base.
+"""
+import logging
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from google.cloud.firestore import FieldFilter
+
+from app.application.ux.adapters.galeria_explanation import GaleriaExplanationBuilder
+from app.domain.galeria.eligibility_service import RelatoEligibilityService
+from app.domain.galeria.similarity.scorers.narrative_tone import narrative_tone_features
+from app.domain.galeria.similarity.scorers.tags_overlap import normalize_tags
+from app.domain.galeria.visibility_policy import RelatoVisibilityPolicy
+from app.domain.relato.states import RelatoStatus
+from app.firestore.client import get_firestore_client
+
+logger = logging.getLogger(__name__)
+
+GALERIA_CARDS_COLLECTION = "galeria_public_cards"
+CARD_SCHEMA_VERSION = 3
+EXCERPT_MAX_CHARS = 120
+
+# Similaridade neutra usada na exposição progressiva da galeria anônima
+PUBLIC_SIMILARITY_SCORE = 0.65
+
+
+def is_public_gallery_relato(relato: Dict[str, Any]) -> bool:
+    """Mesmo critério da consulta da galeria pública."""
+    public_visibility = relato.get("public_visibility")
+    return (
+        isinstance(public_visibility, dict)
+        and public_visibility.get("status") == RelatoStatus.APPROVED_PUBLIC.value
+    )
+
+
+def pick_thumbnail_paths(imagens: List[dict]) -> Dict[str, Optional[str]]:
+    """
+    Retorna os paths de thumbnail separados por papel clínico.
+    Prioridade:
+      - ANTES
+      - DEPOIS
+    """
+    thumbs = {
+        "antes": None,
+        "depois": None,
+    }
+
+    for img in imagens:
+        papel = img.get("papel_clinico")
+        thumb_path = img.get("storage", {}).get("thumb_path")
+
+        if not thumb_path:
+            continue
+
+        if papel == "ANTES" and thumbs["antes"] is None:
+            thumbs["antes"] = thumb_path
+
+        elif papel == "DEPOIS" and thumbs["depois"] is None:
+            thumbs["depois"] = thumb_path
+
+    return thumbs
+
+
+def _plain(value: Any) -> Any:
+    # Enums viram valores simples para poderem ir ao Firestore / JSON
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=1)
+def _public_ux_effects() -> tuple:
+    visibility_policy = RelatoVisibilityPolicy(
+        status=RelatoStatus.APPROVED_PUBLIC,
+        constraints=set(),
+    )
+    eligibility_decision = RelatoEligibilityService().decide(
+        user=None,  # galeria pública
+        relato_policy=visibility_policy,
+    )
+
+    explanation_builder = GaleriaExplanationBuilder()
+    effects = list(
+        explanation_builder.build_for_relato(
+            eligibility=eligibility_decision,
+            similarity=None,
+        )
+    )
+    effects.append(
+        explanation_builder.build_progressive_exposure(
+            similarity_score=PUBLIC_SIMILARITY_SCORE
+        )
+    )
+
+    return tuple(
+        _plain(effect.serialize() if hasattr(effect, "serialize") else effect.__dict__)
+        for effect in effects
+    )
+
+
+def public_ux_effects() -> List[dict]:
+    """
+    ux_effects de um card da galeria anônima. Não dependem do relato,
+    então são calculados uma única vez por processo.
+    """
+    return [dict(effect) for effect in _public_ux_effects()]
+
+
+def build_galeria_card(relato_id: str, relato: Dict[str, Any], imagens: List[dict]) -> Dict[str, Any]:
+    """
+    Monta o documento do card a partir do relato e das suas imagens
+    públicas aprovadas.
+    """
+    public_text = (relato.get("public_excerpt") or {}).get("text") or ""
+    tags = relato.get("tags_extraidas") or relato.get("tags") or []
+    tags_normalizadas = sorted(normalize_tags(tags))
+
+    return {
+        "relato_id": relato_id,
+        # Chave de ordenação/cursor da galeria: mesmo valor do relato
+        "created_at": relato.get("created_at") or datetime.now(timezone.utc),
+        "excerpt": public_text[:EXCERPT_MAX_CHARS],
+        "tags": tags,
+        "tags_normalizadas": tags_normalizadas,
+        # do excerpt inteiro, não do trecho truncado do card
+        "tone_features": narrative_tone_features(public_text),
+        "thumb_paths": pick_thumbnail_paths(imagens),
+        "has_images": bool(imagens),
+        "ux_effects": public_ux_effects(),
+        "schema_version": CARD_SCHEMA_VERSION,
+        "projected_at": datetime.now(timezone.utc),
+    }
+
+
+def card_to_gallery_item(card: Dict[str, Any], signed_urls: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """
+    Converte um card no item da galeria (formato do frontend Vue),
+    usando as signed URLs já geradas em lote.
+    """
+    thumb_paths = card.get("thumb_paths") or {}
+    antes = signed_urls.get(thumb_paths.get("antes")) if thumb_paths.get("antes") else None
+    depois = signed_urls.get(thumb_paths.get("depois")) if thumb_paths.get("depois") else None
+
+    created_at_raw = card.get("created_at")
+    if isinstance(created_at_raw, str):
+        created_at = created_at_raw
+    else:
+        created_at = datetime.now(timezone.utc).isoformat()
+
+    excerpt = card.get("excerpt") or ""
+
+    return {
+        "id": card.get("relato_id"),
+        "tituloRelato": "Relato de tratamento",
+        "imgAntes": antes,
+        "imgDepois": depois or antes,
+        "microdepoimento": excerpt,
+        "solucao": excerpt,
+        "tags": card.get("tags") or [],
+        "created_at": created_at,
+        "has_images": bool(card.get("has_images")),
+        "ux_effects": card.get("ux_effects") or [],
+    }
+
+
+# ============================================================
+# Projeção
+# ============================================================
+
+def project_galeria_card(relato_id: str, *, db=None) -> bool:
+    """
+    Recalcula o card do relato: grava se o relato está na galeria pública,
+    remove caso contrário. Retorna True se o card existe ao final.
+    """
+    db = db or get_firestore_client()
+    card_ref = db.collection(GALERIA_CARDS_COLLECTION).document(relato_id)
+
+    snapshot = db.collection("relatos").document(relato_id).get()
+    relato = snapshot.to_dict() if snapshot.exists else None
+
+    if not relato or not is_public_gallery_relato(relato):
+        card_ref.delete()
+        return False
+
+    imagens_query = (
+        db.collection("imagens")
+        .where(filter=FieldFilter("relato_id", "==", relato_id))
+        .where(filter=FieldFilter("status.visibilidade", "==", "public"))
+        .where(filter=FieldFilter("status.moderacao", "==", "approved"))
+    )
+    imagens = [doc.to_dict() for doc in imagens_query.stream()]
+
+    card_ref.set(build_galeria_card(relato_id, relato, imagens))
+    return True
+
+
+def refresh_galeria_card(relato_id: str) -> None:
+    """
+    Versão best-effort de project_galeria_card para ganchos de eventos:
+    uma falha na projeção não derruba a operação que a disparou.
+    """
+    try:
+        project_galeria_card(relato_id)
+    except Exception:
+        logger.exception("[galeria_cards] Falha ao projetar card | relato_id=%s", relato_id)
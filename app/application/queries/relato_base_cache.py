@@ -0,0 +1,104 @@
+# app/application/queries/relato_base_cache.py
+"""
+Cache (por processo) do relato-base resolvido de cada usuário.
+
+resolve_relato_base_for_user faz uma consulta collection_group e normaliza
+o documento, mas o resultado só muda quando um relato do próprio usuário
+muda de status. As transições invalidam a entrada do dono (adapter de
+status e listener da réplica pública, que vê as mudanças de qualquer
+processo); o TTL só limita a defasagem se alguma invalidação se perder.
+
+"Usuário sem relato-base" também é cacheado (valor None).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import RELATO_BASE_CACHE_SIZE, RELATO_BASE_CACHE_TTL_SECONDS
+
+
+class RelatoBaseCache:
+    def __init__(
+        self,
+        *,
+        max_size: int = RELATO_BASE_CACHE_SIZE,
+        ttl_seconds: float = RELATO_BASE_CACHE_TTL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # user_id -> (expires_at, relato-base ou None)
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # incrementada a cada invalidação: descarta resoluções concorrentes
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def generation(self) -> int:
+        """Capturada antes de resolver; repassada para `put`."""
+        with self._lock:
+            return self._generation
+
+    def lookup(self, user_id: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """(encontrado, relato-base). O relato-base pode ser None."""
+        if not self.enabled:
+            return False, None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or now >= entry[0]:
+                self._entries.pop(user_id, None)
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(user_id)
+            self._hits += 1
+            return True, dict(entry[1]) if entry[1] is not None else None
+
+    def put(self, user_id: str, relato_base: Optional[Dict[str, Any]], *, generation: int) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                # houve invalidação durante a resolução: o valor pode estar velho
+                return
+            value = dict(relato_base) if relato_base is not None else None
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self._invalidations,
+            }
+
+
+relato_base_cache = RelatoBaseCache()
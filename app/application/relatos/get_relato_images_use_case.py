@@ -44,21 +44,26 @@ class GetRelatoImagesUseCase:
         # Nota: Caso precisemos de metadados como width/height no futuro,
         # eles devem ser salvos no documento do relato ou inferidos.
 
-        async def _path_to_dto(path: str) -> dict:
+        # Todas as URLs saem de uma única chamada em lote (thumb e full usam a mesma)
+        visible_paths = antes_paths[:1] + durante_paths + depois_paths[:1]
+        signed_urls = await self.storage.get_signed_urls(visible_paths)
+
+        def _path_to_dto(path: str) -> dict:
+            url = signed_urls.get(path)
             return {
-                "thumb_url": await self.storage.get_signed_url(path),
-                "full_url": await self.storage.get_signed_url(path),
+                "thumb_url": url,
+                "full_url": url,
                 "storage_path": path,
                 "width": 0,  # Placeholder pois não há metadata repository
                 "height": 0,
             }
 
-        antes = await _path_to_dto(antes_paths[0]) if antes_paths else None
-        depois = await _path_to_dto(depois_paths[0]) if depois_paths else None
+        antes = _path_to_dto(antes_paths[0]) if antes_paths else None
+        depois = _path_to_dto(depois_paths[0]) if depois_paths else None
 
         durante = []
         for idx, path in enumerate(durante_paths):
-            dto = await _path_to_dto(path)
+            dto = _path_to_dto(path)
             dto["ordem"] = idx
             durante.append(dto)
 
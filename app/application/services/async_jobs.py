@@ -0,0 +1,272 @@
+# app/application/services/async_jobs.py
+"""
+Executor de jobs assíncronos (coroutines) do pipeline.
+
+Um único event loop dedicado, em uma thread própria, mantém vários jobs em
+andamento ao mesmo tempo. Um job só ocupa uma thread enquanto faz uma chamada
+bloqueante (delegada via asyncio.to_thread); esperas de backoff e de I/O não
+prendem thread nenhuma.
+
+- concorrência limitada por um asyncio.Semaphore (`concurrency`);
+- no máximo `max_pending` jobs aceitos e não concluídos: acima disso `submit`
+  lança JobRejectedError (mesmo contrato de backpressure do BackgroundWorkerPool);
+- `shutdown(drain=True)` espera os jobs aceitos terminarem;
+- métricas de fila, espera e execução no mesmo formato do pool de threads.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.application.services.background_workers import JobRejectedError, _Timing
+from app.config import (
+    ASYNC_JOB_CONCURRENCY,
+    ASYNC_JOB_MAX_PENDING,
+    BACKGROUND_WORKER_SHUTDOWN_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJobRunner:
+    def __init__(
+        self,
+        *,
+        concurrency: int = ASYNC_JOB_CONCURRENCY,
+        max_pending: int = ASYNC_JOB_MAX_PENDING,
+        name: str = "async-jobs",
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser >= 1")
+        if max_pending < 1:
+            raise ValueError("max_pending deve ser >= 1")
+
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self.name = name
+
+        self._cond = threading.Condition()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._closing = False
+
+        # --- contadores
+        self._pending = 0
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._wait = _Timing()
+        self._run_time = _Timing()
+
+    # =========================
+    # API pública
+    # =========================
+
+    def start(self) -> None:
+        ready = threading.Event()
+        with self._cond:
+            if self._thread is not None or self._closing:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run_loop,
+                args=(ready,),
+                name=self.name,
+                daemon=True,
+            )
+            self._thread.start()
+
+        ready.wait()
+        logger.info(
+            "[ASYNC_JOBS] Iniciado | concurrency=%s max_pending=%s",
+            self.concurrency,
+            self.max_pending,
+        )
+
+    def submit(
+        self,
+        coro_fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        job_name: Optional[str] = None,
+    ) -> None:
+        """
+        Agenda `await coro_fn(*args)` no loop de jobs.
+        Lança JobRejectedError se o job não puder ser aceito.
+        """
+        name = job_name or getattr(coro_fn, "__name__", "job")
+
+        # Fora do lifespan (scripts, testes) o loop sobe sob demanda
+        self.start()
+
+        with self._cond:
+            if self._closing:
+                self._rejected += 1
+                raise JobRejectedError("Executor de jobs assíncronos encerrado")
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                logger.warning(
+                    "[ASYNC_JOBS] Limite de jobs pendentes (%s), rejeitando job=%s",
+                    self.max_pending,
+                    name,
+                )
+                raise JobRejectedError(
+                    f"Fila de processamento cheia ({self.max_pending})"
+                )
+            self._pending += 1
+            self._submitted += 1
+            loop = self._loop
+
+        asyncio.run_coroutine_threadsafe(
+            self._execute(coro_fn, args, name, time.monotonic()),
+            loop,
+        )
+
+    def call(
+        self,
+        coro_fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        timeout: Optional[float] = BACKGROUND_WORKER_SHUTDOWN_TIMEOUT,
+    ) -> Any:
+        """
+        Executa `await coro_fn(*args)` no loop de jobs e bloqueia a thread
+        chamadora até o resultado. Pensado para threads do pool que precisam
+        concluir o trabalho mesmo com a fila cheia: não passa pelo limite
+        `max_pending`, pois a própria thread bloqueada já limita a concorrência.
+        Lança JobRejectedError se o executor estiver encerrado. Não chamar de
+        dentro do loop de jobs.
+        """
+        self.start()
+
+        with self._cond:
+            if self._closing:
+                self._rejected += 1
+                raise JobRejectedError("Executor de jobs assíncronos encerrado")
+            loop = self._loop
+
+        return asyncio.run_coroutine_threadsafe(coro_fn(*args), loop).result(timeout=timeout)
+
+    def shutdown(self, *, drain: bool = True, timeout: Optional[float] = BACKGROUND_WORKER_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Para de aceitar jobs. Com `drain=True` espera os jobs aceitos
+        terminarem; caso contrário cancela os que ainda estão em andamento.
+        """
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None or thread is None:
+            return
+
+        if not drain:
+            loop.call_soon_threadsafe(self._cancel_all)
+
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
+        stats = self.stats()
+        if stats["queue_depth"] or stats["running"]:
+            logger.warning("[ASYNC_JOBS] Encerrado sem drenar tudo | stats=%s", stats)
+        elif self._submitted:
+            logger.info("[ASYNC_JOBS] Encerrado | stats=%s", stats)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "queue_depth": self._pending - self._running,
+                "max_pending": self.max_pending,
+                "running": self._running,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "rejected": self._rejected,
+                "wait_time": self._wait.as_dict(),
+                "run_time": self._run_time.as_dict(),
+            }
+
+    # =========================
+    # Internos
+    # =========================
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._loop.call_soon(ready.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def _cancel_all(self) -> None:
+        # Executado dentro do loop de jobs
+        for task in asyncio.all_tasks(self._loop):
+            task.cancel()
+
+    async def _execute(self, coro_fn, args, name: str, enqueued_at: float) -> None:
+        outcome = "cancelled"
+        try:
+            async with self._semaphore:
+                with self._cond:
+                    self._running += 1
+                    self._wait.add((time.monotonic() - enqueued_at) * 1000)
+
+                start = time.perf_counter()
+                try:
+                    await coro_fn(*args)
+                    outcome = "completed"
+                except Exception:
+                    # ⚠️ Um job com falha não derruba o loop
+                    outcome = "failed"
+                    logger.exception("[ASYNC_JOBS] Falha no job=%s", name)
+                finally:
+                    run_ms = (time.perf_counter() - start) * 1000
+                    with self._cond:
+                        self._running -= 1
+                        self._run_time.add(run_ms)
+        finally:
+            with self._cond:
+                self._pending -= 1
+                if outcome == "completed":
+                    self._completed += 1
+                elif outcome == "failed":
+                    self._failed += 1
+                else:
+                    self._cancelled += 1
+                self._cond.notify_all()
+
+
+_runner: Optional[AsyncJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_async_job_runner() -> AsyncJobRunner:
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = AsyncJobRunner()
+        return _runner
+
+
+def start_async_job_runner() -> AsyncJobRunner:
+    runner = get_async_job_runner()
+    runner.start()
+    return runner
+
+
+def shutdown_async_job_runner(*, drain: bool = True) -> None:
+    global _runner
+    with _runner_lock:
+        runner, _runner = _runner, None
+    if runner is not None:
+        runner.shutdown(drain=drain)
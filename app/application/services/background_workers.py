@@ -0,0 +1,260 @@
+# app/application/services/background_workers.py
+"""
+Pool de workers em background para jobs do pipeline (ex.: enriquecimento).
+
+Substitui os ThreadPoolExecutor(max_workers=2) globais:
+- concorrência configurável (`concurrency` threads);
+- fila limitada (`max_queue_size`): com a fila cheia, `submit` espera até
+  `put_timeout_seconds` e então rejeita o job com JobRejectedError, para que
+  o chamador (CloudTasksProcessingAdapter) sinalize backpressure;
+- `shutdown(drain=True)` para de aceitar jobs e espera a fila esvaziar;
+- métricas de profundidade de fila, tempo de espera e tempo de execução.
+
+O ciclo de vida é controlado pelo lifespan da aplicação
+(start_background_workers / shutdown_background_workers).
+"""
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.config import (
+    BACKGROUND_WORKER_CONCURRENCY,
+    BACKGROUND_WORKER_MAX_QUEUE,
+    BACKGROUND_WORKER_PUT_TIMEOUT,
+    BACKGROUND_WORKER_SHUTDOWN_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JobRejectedError(RuntimeError):
+    """Job recusado pelo pool (fila cheia ou pool encerrado)."""
+
+
+@dataclass
+class _Job:
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    name: str
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class _Timing:
+    """Acumulador simples de latências (ms)."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+class BackgroundWorkerPool:
+    def __init__(
+        self,
+        *,
+        concurrency: int = BACKGROUND_WORKER_CONCURRENCY,
+        max_queue_size: int = BACKGROUND_WORKER_MAX_QUEUE,
+        put_timeout_seconds: float = BACKGROUND_WORKER_PUT_TIMEOUT,
+        name: str = "background-worker",
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser >= 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size deve ser >= 1")
+
+        self.concurrency = concurrency
+        self.max_queue_size = max_queue_size
+        self.put_timeout_seconds = put_timeout_seconds
+        self.name = name
+
+        self._queue: Deque[_Job] = deque()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._closing = False
+        self._running = 0
+
+        # --- contadores
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._discarded = 0
+        self._wait = _Timing()
+        self._run_time = _Timing()
+
+    # =========================
+    # API pública
+    # =========================
+
+    def start(self) -> None:
+        with self._cond:
+            if self._threads or self._closing:
+                return
+            for index in range(self.concurrency):
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.name}-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+        logger.info(
+            "[BACKGROUND_WORKERS] Iniciado | concurrency=%s max_queue=%s",
+            self.concurrency,
+            self.max_queue_size,
+        )
+
+    def submit(self, fn: Callable[..., Any], *args: Any, job_name: Optional[str] = None) -> None:
+        """
+        Enfileira `fn(*args)` para execução em background.
+        Lança JobRejectedError se o job não puder ser aceito.
+        """
+        job = _Job(fn=fn, args=args, name=job_name or getattr(fn, "__name__", "job"))
+
+        # Fora do lifespan (scripts, testes) o pool sobe sob demanda
+        self.start()
+
+        with self._cond:
+            if self._closing:
+                self._rejected += 1
+                raise JobRejectedError("Pool de workers encerrado")
+
+            if len(self._queue) >= self.max_queue_size:
+                self._cond.wait_for(
+                    lambda: len(self._queue) < self.max_queue_size or self._closing,
+                    timeout=self.put_timeout_seconds,
+                )
+                if len(self._queue) >= self.max_queue_size or self._closing:
+                    self._rejected += 1
+                    logger.warning(
+                        "[BACKGROUND_WORKERS] Fila cheia (%s), rejeitando job=%s",
+                        self.max_queue_size,
+                        job.name,
+                    )
+                    raise JobRejectedError(
+                        f"Fila de processamento cheia ({self.max_queue_size})"
+                    )
+
+            job.enqueued_at = time.monotonic()
+            self._queue.append(job)
+            self._submitted += 1
+            self._cond.notify_all()
+
+    def shutdown(self, *, drain: bool = True, timeout: Optional[float] = BACKGROUND_WORKER_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Para de aceitar jobs. Com `drain=True` executa o que já está na fila;
+        caso contrário descarta os jobs pendentes (os em execução terminam).
+        """
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            if not drain:
+                self._discarded += len(self._queue)
+                self._queue.clear()
+            threads = list(self._threads)
+            self._cond.notify_all()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(timeout=remaining)
+
+        stats = self.stats()
+        if stats["queue_depth"] or stats["running"]:
+            logger.warning("[BACKGROUND_WORKERS] Encerrado sem drenar tudo | stats=%s", stats)
+        elif self._submitted:
+            logger.info("[BACKGROUND_WORKERS] Encerrado | stats=%s", stats)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "queue_depth": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "running": self._running,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "discarded": self._discarded,
+                "wait_time": self._wait.as_dict(),
+                "run_time": self._run_time.as_dict(),
+            }
+
+    # =========================
+    # Internos
+    # =========================
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closing)
+                if not self._queue:
+                    # encerrando e sem trabalho pendente
+                    return
+                job = self._queue.popleft()
+                self._running += 1
+                self._wait.add((time.monotonic() - job.enqueued_at) * 1000)
+                # libera produtores bloqueados por backpressure
+                self._cond.notify_all()
+
+            start = time.perf_counter()
+            succeeded = True
+            try:
+                job.fn(*job.args)
+            except Exception:
+                # ⚠️ Um job com falha não derruba o worker
+                succeeded = False
+                logger.exception("[BACKGROUND_WORKERS] Falha no job=%s", job.name)
+
+            run_ms = (time.perf_counter() - start) * 1000
+            with self._cond:
+                self._running -= 1
+                self._run_time.add(run_ms)
+                if succeeded:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+                self._cond.notify_all()
+
+
+_pool: Optional[BackgroundWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_background_workers() -> BackgroundWorkerPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BackgroundWorkerPool()
+        return _pool
+
+
+def start_background_workers() -> BackgroundWorkerPool:
+    pool = get_background_workers()
+    pool.start()
+    return pool
+
+
+def shutdown_background_workers(*, drain: bool = True) -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(drain=drain)
@@ -2,10 +2,14 @@
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
 
 from app.application.effects.dispatcher import EffectDispatcher
+from app.application.queries.readmodels.galeria_card import refresh_galeria_card
 from app.application.relatos.mark_processed_use_case import MarkRelatoAsProcessedUseCase
+from app.application.services.async_jobs import get_async_job_runner
+from app.application.services.background_workers import JobRejectedError, get_background_workers
+from app.config import ENRICH_JOB_BACKEND
 from app.infra.event_adapter import DummyEventAdapter
 from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
 from app.jobs.enrich_metadata_job import EnrichMetadataJob
@@ -15,34 +19,102 @@ from app.repositories.relato_repository import RelatoRepository
 
 logger = logging.getLogger(__name__)
 
-# pool global de workers
-_executor = ThreadPoolExecutor(max_workers=2)
-
-def _on_job_completed(relato_id: str) -> None:
+class _WorkerContext:
     """
-    Callback chamado pelo job sincrono para iniciar a transicao de dominio assincrona.
+    Clientes, use case e jobs compartilhados por todos os relatos processados
+    neste processo. Todos sao sem estado por execucao, entao uma unica
+    instancia evita recriar clientes Firestore (e seus canais) a cada job.
     """
-    logger.info("[relato_worker] disparando transicao de dominio para PROCESSED relato_id=%s", relato_id)
-
-    loop = asyncio.new_event_loop()
-    try:
-        asyncio.set_event_loop(loop)
 
+    def __init__(self):
         from app.infra.processing_adapter import CloudTasksProcessingAdapter
 
-        repo = FirestoreRelatoRepository()
+        # roda no loop de jobs: o SDK sincrono vai para threads (offload_io)
+        # em vez do AsyncClient, que fica associado ao loop do servidor
+        repo = FirestoreRelatoRepository(offload_io=True)
         dispatcher = EffectDispatcher(
             relato_repo=repo,
             processing_port=CloudTasksProcessingAdapter(),
             event_port=DummyEventAdapter()
         )
-        use_case = MarkRelatoAsProcessedUseCase(repo, dispatcher)
+        self.mark_processed = MarkRelatoAsProcessedUseCase(repo, dispatcher)
+
+        relato_repo = RelatoRepository()
+        effect_repo = EffectResultRepository()
+        enriched_repo = EnrichedMetadataRepository()
+        # job do pool de threads: conclusao notificada via fila do loop de jobs
+        self.enrich_job = EnrichMetadataJob(
+            relato_repo=relato_repo,
+            effect_repo=effect_repo,
+            enriched_repo=enriched_repo,
+            on_completed_callback=_on_job_completed
+        )
+        # job assincrono: ja roda no loop de jobs e aguarda a transicao direto
+        self.enrich_job_async = EnrichMetadataJob(
+            relato_repo=relato_repo,
+            effect_repo=effect_repo,
+            enriched_repo=enriched_repo,
+            pipeline_manager=self.enrich_job.pipeline_manager,
+            on_completed_callback=_mark_relato_processed
+        )
+
+_context: _WorkerContext | None = None
+_context_lock = threading.Lock()
 
-        loop.run_until_complete(use_case.execute(relato_id))
+def _get_worker_context() -> _WorkerContext:
+    global _context
+    with _context_lock:
+        if _context is None:
+            _context = _WorkerContext()
+        return _context
+
+async def _mark_relato_processed(relato_id: str) -> None:
+    """
+    Transicao de dominio para PROCESSED, executada no loop de jobs.
+    """
+    logger.info("[relato_worker] disparando transicao de dominio para PROCESSED relato_id=%s", relato_id)
+
+    try:
+        context = _context or await asyncio.to_thread(_get_worker_context)
+        await context.mark_processed.execute(relato_id)
     except Exception as e:
         logger.error("[relato_worker] falha ao executar MarkRelatoAsProcessedUseCase: %s", e)
-    finally:
-        loop.close()
+
+    # Enriquecimento concluido: atualiza o card da galeria publica (se houver)
+    await asyncio.to_thread(refresh_galeria_card, relato_id)
+
+def _on_job_completed(relato_id: str) -> None:
+    """
+    Callback chamado pelo job sincrono: enfileira a transicao de dominio no
+    loop de jobs em vez de criar um event loop por relato. Com a fila cheia,
+    a thread do pool espera a transicao rodar no mesmo loop.
+    """
+    runner = get_async_job_runner()
+    try:
+        runner.submit(_mark_relato_processed, relato_id, job_name="mark_processed")
+        return
+    except JobRejectedError:
+        logger.warning(
+            "[relato_worker] fila de jobs cheia, aguardando transicao no loop de jobs relato_id=%s",
+            relato_id,
+        )
+
+    try:
+        runner.call(_mark_relato_processed, relato_id)
+    except JobRejectedError:
+        logger.error(
+            "[relato_worker] loop de jobs encerrado, transicao para PROCESSED nao executada relato_id=%s",
+            relato_id,
+        )
+
+async def _run_enrich_job_async(relato_id: str) -> None:
+    """
+    Executa o job de enriquecimento no loop de jobs assincronos.
+    """
+    logger.info("[relato_worker] iniciando processamento (async) relato_id=%s", relato_id)
+
+    context = _context or await asyncio.to_thread(_get_worker_context)
+    await context.enrich_job_async.run_async(relato_id)
 
 def _run_enrich_job(relato_id: str) -> None:
     """
@@ -51,14 +123,7 @@ def _run_enrich_job(relato_id: str) -> None:
     logger.info("[relato_worker] iniciando processamento relato_id=%s", relato_id)
 
     try:
-        job = EnrichMetadataJob(
-            relato_repo=RelatoRepository(),
-            effect_repo=EffectResultRepository(),
-            enriched_repo=EnrichedMetadataRepository(),
-            on_completed_callback=_on_job_completed
-        )
-
-        job.run(relato_id)
+        _get_worker_context().enrich_job.run(relato_id)
         
         logger.info(
             "[relato_worker] processamento concluído relato_id=%s",
@@ -80,7 +145,8 @@ def enqueue_relato_processing(relato_id: str) -> None:
     Evoluo arquitetural planejada:
 
     MVP:
-        ThreadPoolExecutor
+        AsyncJobRunner (ENRICH_JOB_BACKEND=async) ou BackgroundWorkerPool
+        (ENRICH_JOB_BACKEND=thread); ambos lançam JobRejectedError se cheios
 
     Futuro:
         Cloud Tasks / PubSub / Worker service
@@ -89,4 +155,7 @@ def enqueue_relato_processing(relato_id: str) -> None:
     logger.info("[enqueue_relato_processing] relato_id=%s", relato_id)
 
     # agenda execuo assncrona
-    _executor.submit(_run_enrich_job, relato_id)
+    if ENRICH_JOB_BACKEND == "async":
+        get_async_job_runner().submit(_run_enrich_job_async, relato_id, job_name="enrich_metadata")
+    else:
+        get_background_workers().submit(_run_enrich_job, relato_id, job_name="enrich_metadata")
@@ -0,0 +1,81 @@
+# app/auth/profile_cache.py
+"""
+Cache read-through (por processo) dos documentos users/{uid}.
+
+Evita a leitura do Firestore em toda requisição autenticada. Mudanças
+feitas fora deste processo (ex.: papel ou desativação via script) passam a
+valer em no máximo `ttl_seconds`.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import USER_PROFILE_CACHE_SIZE, USER_PROFILE_CACHE_TTL_SECONDS
+
+
+class UserProfileCache:
+    def __init__(
+        self,
+        *,
+        max_size: int = USER_PROFILE_CACHE_SIZE,
+        ttl_seconds: float = USER_PROFILE_CACHE_TTL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # uid -> (expires_at, documento)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, uid: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is None or now >= entry[0]:
+                self._entries.pop(uid, None)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(uid)
+            self._hits += 1
+            return dict(entry[1])
+
+    def put(self, uid: str, data: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[uid] = (time.monotonic() + self.ttl_seconds, dict(data))
+            self._entries.move_to_end(uid)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, uid: str) -> None:
+        with self._lock:
+            self._entries.pop(uid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+user_profile_cache = UserProfileCache()
@@ -38,8 +38,14 @@ from firebase_admin import auth
 
 
 
+from app.auth.profile_cache import user_profile_cache
+
 from app.auth.schemas import User, UserRole
 
+from app.auth.token_cache import verified_token_cache
+
+from app.config import USER_PROFILE_TOUCH_INTERVAL_SECONDS
+
 from app.core.errors import AUTH_ERROR_MESSAGES
 
 from app.firestore.client import get_firestore_client
@@ -48,6 +54,9 @@ from app.firestore.client import get_firestore_client
 import logging
 logger = logging.getLogger(__name__)
 
+# Campos do perfil sincronizados a partir do Firebase Auth
+_PROFILE_SYNC_FIELDS = ("email", "display_name", "avatar_url")
+
 
 def _utcnow() -> datetime:
 
@@ -77,6 +86,16 @@ def verify_firebase_token(provider_token: str) -> dict[str, Any]:
 
 
 
+    # 0. Token já verificado recentemente: evita a ida ao Firebase
+
+    cached = verified_token_cache.get(provider_token)
+
+    if cached is not None:
+
+        return cached
+
+
+
     # 1. Defesa contra JWTs malformados ou ataques alg: none
 
     try:
@@ -189,7 +208,7 @@ def verify_firebase_token(provider_token: str) -> dict[str, Any]:
 
 
 
-    return {
+    firebase_data = {
 
         "firebase_uid": firebase_uid,
 
@@ -201,6 +220,12 @@ def verify_firebase_token(provider_token: str) -> dict[str, Any]:
 
     }
 
+    verified_token_cache.put(provider_token, firebase_data, exp=decoded_token.get("exp"))
+
+
+
+    return firebase_data
+
 
 
 
@@ -243,27 +268,87 @@ def _build_user(uid: str, raw: dict[str, Any]) -> User:
 
 
 
-async def get_or_create_internal_user(firebase_data: dict[str, Any]) -> User:
+def _missing_integrity_fields(user_data: dict[str, Any], now: datetime) -> dict[str, Any]:
+
+    """Campos obrigatórios ausentes ou corrompidos no documento do usuário."""
+
+    fixes: dict[str, Any] = {}
+
+    if not user_data.get("created_at"):
+
+        fixes["created_at"] = now
+
+    if not user_data.get("role"):
+
+        fixes["role"] = UserRole.USUARIO_LOGADO
+
+    if "is_active" not in user_data:
+
+        fixes["is_active"] = True
+
+    return fixes
+
+
+
+
+
+def _profile_needs_write(user_data: dict[str, Any], base_data: dict[str, Any], now: datetime) -> bool:
 
     """
 
-    Resolve ou provisiona automaticamente o perfil do usurio em Firestore.
+    Um perfil existente só é regravado se algo de fato mudou ou se
+
+    `updated_at` passou do intervalo de "touch".
 
     """
 
-    db = get_firestore_client()  # Acesso explcito ao cliente
+    if any(user_data.get(field) != base_data[field] for field in _PROFILE_SYNC_FIELDS):
+
+        return True
+
+    if _missing_integrity_fields(user_data, now):
+
+        return True
+
+    updated_at = user_data.get("updated_at")
+
+    if not isinstance(updated_at, datetime):
+
+        return True
+
+    if updated_at.tzinfo is None:
+
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+
+    return (now - updated_at).total_seconds() >= USER_PROFILE_TOUCH_INTERVAL_SECONDS
+
+
 
-    uid = firebase_data["firebase_uid"]
 
-    user_ref = db.collection("users").document(uid)
 
-    user_doc = user_ref.get()
+async def get_or_create_internal_user(firebase_data: dict[str, Any]) -> User:
+
+    """
+
+    Resolve ou provisiona automaticamente o perfil do usuário em Firestore.
+
+
+
+    O perfil passa por `user_profile_cache` (read-through com TTL) e só é
 
+    regravado quando email, nome ou avatar mudaram, quando faltam campos
 
+    obrigatórios ou quando `updated_at` é mais antigo que
+
+    USER_PROFILE_TOUCH_INTERVAL_SECONDS.
+
+    """
+
+    uid = firebase_data["firebase_uid"]
 
     now = _utcnow()
 
-    # Dados bsicos sempre sincronizados com o Firebase Auth
+    # Dados básicos sempre sincronizados com o Firebase Auth
 
     base_data = {
 
@@ -281,56 +366,59 @@ async def get_or_create_internal_user(firebase_data: dict[str, Any]) -> User:
 
     }
 
+    user_data = user_profile_cache.get(uid)
 
+    if user_data is not None and not _profile_needs_write(user_data, base_data, now):
 
-    if user_doc.exists:
+        user = _build_user(uid, user_data)
 
-        user_data = user_doc.to_dict() or {}
+    else:
 
-        merged = {**user_data, **base_data}
+        db = get_firestore_client()  # Acesso explícito ao cliente
 
-        
+        user_ref = db.collection("users").document(uid)
 
-        # Garante integridade de campos obrigatrios se estiverem corrompidos
+        exists = user_data is not None
 
-        if not merged.get("created_at"):
+        if not exists:
 
-            merged["created_at"] = now
+            user_doc = user_ref.get()
 
-        if not merged.get("role"):
+            exists = user_doc.exists
 
-            merged["role"] = UserRole.USUARIO_LOGADO
+            user_data = (user_doc.to_dict() or {}) if exists else None
 
-        if "is_active" not in merged:
+        if exists:
 
-            merged["is_active"] = True
+            if _profile_needs_write(user_data, base_data, now):
 
-            
+                updates = {**base_data, **_missing_integrity_fields(user_data, now)}
 
-        user_ref.set(merged, merge=True)
+                user_ref.set(updates, merge=True)
 
-        user = _build_user(uid, merged)
+                user_data = {**user_data, **updates}
 
-    else:
+        else:
 
-        # Auto-provisionamento de novo perfil
+            # Auto-provisionamento de novo perfil
 
-        created = {
+            user_data = {
 
-            **base_data,
+                **base_data,
 
-            "role": UserRole.USUARIO_LOGADO,
+                "role": UserRole.USUARIO_LOGADO,
 
-            "is_active": True,
+                "is_active": True,
 
-            "created_at": now,
+                "created_at": now,
 
-        }
+            }
 
-        user_ref.set(created)
+            user_ref.set(user_data)
 
-        user = _build_user(uid, created)
+        user_profile_cache.put(uid, user_data)
 
+        user = _build_user(uid, user_data)
 
 
     # Validao nica de ativao
@@ -0,0 +1,107 @@
+# app/auth/token_cache.py
+"""
+Cache em memória (por processo) de Firebase ID tokens já verificados.
+
+`auth.verify_id_token(..., check_revoked=True)` faz uma chamada de rede ao
+Firebase a cada requisição. Um token verificado é reaproveitado enquanto:
+- não passou do `exp` do próprio token, e
+- não passou `revocation_recheck_seconds` desde a última verificação
+  (janela máxima em que uma revogação pode passar despercebida).
+
+A chave é o SHA-256 do token: o token em si nunca fica em memória.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import AUTH_TOKEN_CACHE_SIZE, AUTH_TOKEN_REVOCATION_RECHECK_SECONDS
+
+
+class VerifiedTokenCache:
+    def __init__(
+        self,
+        *,
+        max_size: int = AUTH_TOKEN_CACHE_SIZE,
+        revocation_recheck_seconds: float = AUTH_TOKEN_REVOCATION_RECHECK_SECONDS,
+    ):
+        self.max_size = max_size
+        self.revocation_recheck_seconds = revocation_recheck_seconds
+        # token_hash -> (valid_until, dados do token)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.revocation_recheck_seconds > 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            valid_until, data = entry
+            if now >= valid_until:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dict(data)
+
+    def put(self, token: str, data: Dict[str, Any], exp: Optional[float]) -> None:
+        """
+        Guarda o resultado de uma verificação bem-sucedida. Tokens sem `exp`
+        não são cacheados.
+        """
+        if not self.enabled or not exp:
+            return
+
+        now = time.time()
+        valid_until = min(float(exp), now + self.revocation_recheck_seconds)
+        if valid_until <= now:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (valid_until, dict(data))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+verified_token_cache = VerifiedTokenCache()
@@ -1,15 +1,9 @@
-import chromadb
-from sentence_transformers import SentenceTransformer
-
-# Inicializa ChromaDB persistente
-client = chromadb.PersistentClient(path="./app/db/dermasync_chroma")
-collection = client.get_collection(name="segmentos")
-
-# Modelo de embedding
-model = SentenceTransformer("intfloat/multilingual-e5-base")
 import unicodedata
 from typing import Literal
 
+# Cliente Chroma, coleção e modelo são carregados no primeiro uso
+from app.chroma.factory import db_factory as factory
+
 
 def normalizar_tag(tag: str) -> str:
     tag = unicodedata.normalize("NFD", tag)
@@ -18,42 +12,51 @@ def normalizar_tag(tag: str) -> str:
     return tag
 
 
+def filtro_tags(normalized_tags: list[str], modo: Literal["and", "or"]) -> dict:
+    """
+    Filtro `where` do Chroma sobre os metadados booleanos `tag_*`
+    ($and/$or exigem ao menos duas cláusulas).
+    """
+    clausulas = [{tag: {"$eq": True}} for tag in normalized_tags]
+    if len(clausulas) == 1:
+        return clausulas[0]
+    return {f"${modo}": clausulas}
+
+
 def _buscar_por_tags(
     tags: list[str],
     modo: Literal["and", "or"] = "or",
     k: int = 5,
-    collection=collection,
+    collection=None,
     log: bool = False,
+    offset: int = 0,
 ):
+    """
+    Segmentos que têm todas (`and`) ou alguma (`or`) das tags. O filtro roda
+    no Chroma e só a página pedida (`k` a partir de `offset`) é trazida,
+    com documentos e metadados.
+    """
     if collection is None:
-        raise ValueError("Collection no fornecida.")
+        collection = factory.collection
     if modo not in ("and", "or"):
         raise ValueError(f"Modo invlido: {modo}. Use 'and' ou 'or'.")
-    # Normaliza as tags
-    normalized_tags = [f"tag_{normalizar_tag(tag)}" for tag in tags]
+    # Normaliza as tags (sem repetições, mantendo a ordem)
+    normalized_tags = list(dict.fromkeys(f"tag_{normalizar_tag(tag)}" for tag in tags))
     if log:
         print(f"🔍 Buscando por tags normalizadas: {normalized_tags}")
-        print(f"📐 Modo de combinao: {modo.upper()}")
-    # Usa $in para buscar todos documentos que tenham pelo menos uma das tags
-    where_filter = {"$or": normalized_tags}  # Pseudo-operao, pois $or no  aceito
-
-    # Soluo real: fazer uma busca ampla e filtrar localmente
-    resultados_brutos = collection.get(include=["metadatas", "documents"])
-
-    # Filtragem local: mantm apenas os que contm **todas** as tags
-    resultados_filtrados = []
-    for doc, metadata in zip(
-        resultados_brutos["documents"], resultados_brutos["metadatas"]
-    ):
-        if (
-            modo == "and" and all(metadata.get(tag, False) for tag in normalized_tags)
-        ) or (
-            modo == "or" and any(metadata.get(tag, False) for tag in normalized_tags)
-        ):
-            resultados_filtrados.append((doc, metadata))
-
-        if len(resultados_filtrados) >= k:
-            break
+        print(f"📐 Modo de combinação: {modo.upper()}")
+    if not normalized_tags or k <= 0:
+        return []
+
+    resultados_brutos = collection.get(
+        where=filtro_tags(normalized_tags, modo),
+        limit=k,
+        offset=max(offset, 0),
+        include=["metadatas", "documents"],
+    )
+    resultados_filtrados = list(
+        zip(resultados_brutos["documents"], resultados_brutos["metadatas"])
+    )
 
     if log:
         print(
@@ -75,8 +78,8 @@ def _buscar_por_tags(
 
 
 def buscar_segmentos_similares(query: str, k: int = 5):
-    embedding = model.encode(query).tolist()
-    resultado = collection.query(
+    embedding = factory.encode_query(query)
+    resultado = factory.collection.query(
         query_embeddings=[embedding],
         n_results=k,
         include=["documents", "metadatas", "distances"],
@@ -98,7 +101,7 @@ def buscar_segmentos_similares(query: str, k: int = 5):
 if __name__ == "__main__":
     # Teste rpido da funo
     query = "Cremes para o rosto"
-    # Suponha que voc j tenha uma varivel `collection` pronta
+    collection = factory.collection
     res_and = _buscar_por_tags(
         ["corticoide", "hixizine", "bullying"],
         modo="and",
@@ -2,11 +2,9 @@ from collections import Counter
 
 from app.chroma.factory import db_factory as factory
 
-collection = factory.collection
-
 
 def contar_tags():
-    dados = collection.get(include=["metadatas"])
+    dados = factory.collection.get(include=["metadatas"])
     contagem = Counter()
 
     for metadado in dados["metadatas"]:
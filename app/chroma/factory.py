@@ -1,35 +1,172 @@
-# app/db/database.py
-import chromadb
-from sentence_transformers import SentenceTransformer
+# app/chroma/factory.py
+"""
+Serviço compartilhado (por processo) de embeddings e busca vetorial.
+
+Cliente Chroma, coleções e o SentenceTransformer são criados só no primeiro
+uso — importar os módulos de app/chroma não carrega nada. O lifespan pode
+antecipar a carga com `warmup()` (EMBEDDING_WARMUP_ON_STARTUP).
+
+Cada recurso existe uma única vez por processo: o modelo ocupa centenas de
+MB e leva segundos para carregar. Embeddings de consultas ficam num LRU
+(`encode_query`), então buscas repetidas não recodificam o texto.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.config import (
+    CHROMA_PERSIST_PATH,
+    CHROMA_SEGMENTOS_COLLECTION,
+    EMBEDDING_MODEL_NAME,
+    EMBEDDING_QUERY_CACHE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class DBResourceFactory:
-    def __init__(self):
-        self._client = None
-        self._collection = None
+    def __init__(
+        self,
+        *,
+        persist_path: str = CHROMA_PERSIST_PATH,
+        collection_name: str = CHROMA_SEGMENTOS_COLLECTION,
+        model_name: str = EMBEDDING_MODEL_NAME,
+        query_cache_size: int = EMBEDDING_QUERY_CACHE_SIZE,
+    ):
+        self.persist_path = persist_path
+        self.collection_name = collection_name
+        self.model_name = model_name
+        self.query_cache_size = query_cache_size
+
+        # RLock: get_collection cria o cliente com o lock adquirido
+        self._lock = threading.RLock()
+        # path -> PersistentClient; (path, nome) -> coleção
+        self._clients: Dict[str, Any] = {}
+        self._collections: Dict[Tuple[str, str], Any] = {}
+        # lock próprio: a carga do modelo leva segundos e não deve travar stats
+        self._model_lock = threading.Lock()
         self._model = None
 
+        # texto da consulta -> embedding
+        self._query_cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    # =========================
+    # Recursos
+    # =========================
+
     @property
     def client(self):
-        self._initialize_if_needed()
-        return self._client
+        return self.get_client()
 
     @property
     def collection(self):
-        self._initialize_if_needed()
-        return self._collection
+        return self.get_collection()
 
     @property
     def model(self):
-        self._initialize_if_needed()
-        return self._model
+        with self._model_lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                logger.info("[EMBEDDINGS] Carregando modelo %s", self.model_name)
+                self._model = SentenceTransformer(self.model_name)
+            return self._model
+
+    def get_client(self, path: Optional[str] = None):
+        path = path or self.persist_path
+        with self._lock:
+            client = self._clients.get(path)
+            if client is None:
+                import chromadb
+
+                client = chromadb.PersistentClient(path=path)
+                self._clients[path] = client
+            return client
+
+    def get_collection(
+        self,
+        name: Optional[str] = None,
+        *,
+        path: Optional[str] = None,
+        create: bool = False,
+    ):
+        """
+        Coleção `name` (padrão: segmentos) da base em `path`. Com `create`,
+        cria a coleção se ainda não existe.
+        """
+        name = name or self.collection_name
+        path = path or self.persist_path
+        with self._lock:
+            collection = self._collections.get((path, name))
+            if collection is None:
+                client = self.get_client(path)
+                if create:
+                    collection = client.get_or_create_collection(name=name)
+                else:
+                    collection = client.get_collection(name=name)
+                self._collections[(path, name)] = collection
+            return collection
+
+    def warmup(self) -> None:
+        """Carrega modelo e coleção padrão agora, em vez de na primeira busca."""
+        self.get_collection()
+        self.model
+
+    # =========================
+    # Embeddings
+    # =========================
+
+    def encode_query(self, text: str) -> List[float]:
+        if self.query_cache_size > 0:
+            with self._cache_lock:
+                cached = self._query_cache.get(text)
+                if cached is not None:
+                    self._query_cache.move_to_end(text)
+                    self._hits += 1
+                    return list(cached)
+                self._misses += 1
+
+        embedding = tuple(self.model.encode(text).tolist())
+
+        if self.query_cache_size > 0:
+            with self._cache_lock:
+                self._query_cache[text] = embedding
+                self._query_cache.move_to_end(text)
+                while len(self._query_cache) > self.query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return list(embedding)
+
+    def encode_documents(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embeddings de documentos em lote (sem cache: cada texto é único)."""
+        if not texts:
+            return []
+        return self.model.encode(list(texts)).tolist()
 
-    def _initialize_if_needed(self):
-        if self._client is None:
-            self._client = chromadb.PersistentClient(path="./app/db/dermasync_chroma")
-            self._collection = self._client.get_collection(name="segmentos")
-            self._model = SentenceTransformer("intfloat/multilingual-e5-base")
+    def stats(self) -> Dict[str, Any]:
+        # não dispara a carga de nenhum recurso
+        with self._lock:
+            loaded = {
+                "clients": len(self._clients),
+                "collections": len(self._collections),
+            }
+        loaded["model_loaded"] = self._model is not None
+        with self._cache_lock:
+            lookups = self._hits + self._misses
+            return {
+                **loaded,
+                "query_cache": {
+                    "size": len(self._query_cache),
+                    "max_size": self.query_cache_size,
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                },
+            }
 
 
-# Instncia singleton global
+# Instância singleton global
 db_factory = DBResourceFactory()
@@ -1,31 +1,78 @@
+"""
+Ingestão de depoimentos (JSONL, um registro por linha) na coleção Chroma.
+
+Os registros entram em lotes de até CHROMA_INGEST_BATCH_SIZE, limitados ao
+max batch size do cliente Chroma, com um encode por lote. Se um lote falha
+(ex.: `arquivo` repetido), ele é refeito registro a registro: só os
+registros problemáticos ficam de fora, não a ingestão inteira.
+"""
 import json
+import logging
+
+from app.chroma.factory import db_factory as factory
+from app.config import (
+    CHROMA_DEPOIMENTOS_COLLECTION,
+    CHROMA_DEPOIMENTOS_PATH,
+    CHROMA_INGEST_BATCH_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _add(collection, registros):
+    textos = [r["conteudo"] for r in registros]
+    collection.add(
+        ids=[r["arquivo"] for r in registros],
+        documents=textos,
+        embeddings=factory.encode_documents(textos),
+        metadatas=[
+            {"data_modificacao": r["data_modificacao"], "arquivo": r["arquivo"]}
+            for r in registros
+        ],
+    )
 
-import chromadb
-from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
 
-model = SentenceTransformer("intfloat/multilingual-e5-base")
-client = chromadb.PersistentClient(path="./app/chroma_storage")
-collection = client.get_or_create_collection(name="depoimentos")
+def _batch_size(batch_size):
+    max_batch_size = factory.get_client(CHROMA_DEPOIMENTOS_PATH).get_max_batch_size()
+    return max(1, min(batch_size, max_batch_size))
 
 
-def ingerir_jsonl(caminho_arquivo):
+def ingerir_jsonl(caminho_arquivo, batch_size=CHROMA_INGEST_BATCH_SIZE):
+    """Retorna quantos registros foram gravados."""
     registros = []
     with open(caminho_arquivo, "r", encoding="utf-8") as f:
         for linha in f:
             registros.append(json.loads(linha.strip()))
 
-    for r in registros:
-        texto = r["conteudo"]
-        id = r["arquivo"]
-        emb = model.encode(texto).tolist()
-        collection.add(
-            ids=[id],
-            documents=[texto],
-            embeddings=[emb],
-            metadatas=[
-                {"data_modificacao": r["data_modificacao"], "arquivo": r["arquivo"]}
-            ],
-        )
-
-    return len(registros)
+    if not registros:
+        return 0
+
+    collection = factory.get_collection(
+        CHROMA_DEPOIMENTOS_COLLECTION, path=CHROMA_DEPOIMENTOS_PATH, create=True
+    )
+    batch_size = _batch_size(batch_size)
+
+    gravados = 0
+    for inicio in range(0, len(registros), batch_size):
+        lote = registros[inicio:inicio + batch_size]
+        try:
+            _add(collection, lote)
+            gravados += len(lote)
+            continue
+        except Exception:
+            logger.warning(
+                "[CHROMA_INGEST] Lote %d-%d falhou; gravando registro a registro",
+                inicio, inicio + len(lote) - 1,
+            )
+
+        for registro in lote:
+            try:
+                _add(collection, [registro])
+                gravados += 1
+            except Exception as e:
+                logger.error(
+                    "[CHROMA_INGEST] Registro ignorado | arquivo=%s erro=%s",
+                    registro.get("arquivo"), e,
+                )
+
+    return gravados
@@ -21,6 +21,93 @@ FIRESTORE_EMULATOR_HOST = os.getenv("FIRESTORE_EMULATOR_HOST")
 FIREBASE_AUTH_EMULATOR_HOST = os.getenv("FIREBASE_AUTH_EMULATOR_HOST")
 FIREBASE_STORAGE_EMULATOR_HOST = os.getenv("FIREBASE_STORAGE_EMULATOR_HOST")
 
+# Repositório de relatos usado pelas rotas: "sync" (SDK bloqueante) ou "async" (AsyncClient)
+RELATO_REPOSITORY_BACKEND = os.getenv("RELATO_REPOSITORY_BACKEND", "sync").lower()
+
+
+# Galeria pública: "relatos" (monta a partir dos relatos) ou "cards" (read model
+# galeria_public_cards; ativar só depois de rodar scripts/backfill_galeria_cards.py)
+GALERIA_PUBLIC_SOURCE = os.getenv("GALERIA_PUBLIC_SOURCE", "relatos").lower()
+
+# Réplica em memória dos relatos públicos (listeners on_snapshot), usada por feed/galeria
+PUBLIC_REPLICA_ENABLED = os.getenv("PUBLIC_REPLICA_ENABLED", "true").lower() == "true"
+# Tempo máximo (s) servindo a réplica com um listener inativo antes de voltar às consultas diretas
+PUBLIC_REPLICA_MAX_STALENESS_SECONDS = float(os.getenv("PUBLIC_REPLICA_MAX_STALENESS_SECONDS", "30"))
+# Intervalo (s) do watchdog que verifica os listeners da réplica e os reinicia fora das requisições
+PUBLIC_REPLICA_WATCHDOG_INTERVAL_SECONDS = float(os.getenv("PUBLIC_REPLICA_WATCHDOG_INTERVAL_SECONDS", "5"))
+# Intervalo (s) da releitura completa dos enrichments pelo watchdog: limite de defasagem do
+# enrichment de um relato que já era público quando foi reenriquecido (0 desliga)
+PUBLIC_REPLICA_ENRICHMENTS_REFRESH_SECONDS = float(os.getenv("PUBLIC_REPLICA_ENRICHMENTS_REFRESH_SECONDS", "300"))
+
+# Leitura mediada: cache por usuário do relato-base (invalidado pelas transições dos relatos do usuário)
+RELATO_BASE_CACHE_SIZE = int(os.getenv("RELATO_BASE_CACHE_SIZE", "10000"))
+# Limite (s) de reutilização de um relato-base cacheado se uma invalidação se perder; 0 desativa o cache
+RELATO_BASE_CACHE_TTL_SECONDS = float(os.getenv("RELATO_BASE_CACHE_TTL_SECONDS", "600"))
+
+# Auditoria de efeitos (sink write-behind de EffectResult)
+EFFECT_RESULT_SINK_MAX_QUEUE = int(os.getenv("EFFECT_RESULT_SINK_MAX_QUEUE", "5000"))
+EFFECT_RESULT_SINK_BATCH_SIZE = int(os.getenv("EFFECT_RESULT_SINK_BATCH_SIZE", "500"))
+EFFECT_RESULT_SINK_FLUSH_INTERVAL = float(os.getenv("EFFECT_RESULT_SINK_FLUSH_INTERVAL", "1.0"))
+EFFECT_RESULT_SINK_PUT_TIMEOUT = float(os.getenv("EFFECT_RESULT_SINK_PUT_TIMEOUT", "0.05"))
+
+# Workers em background (enriquecimento de relatos)
+BACKGROUND_WORKER_CONCURRENCY = int(os.getenv("BACKGROUND_WORKER_CONCURRENCY", "2"))
+BACKGROUND_WORKER_MAX_QUEUE = int(os.getenv("BACKGROUND_WORKER_MAX_QUEUE", "200"))
+# Espera máxima (s) por vaga na fila antes de rejeitar o job; 0 rejeita na hora
+BACKGROUND_WORKER_PUT_TIMEOUT = float(os.getenv("BACKGROUND_WORKER_PUT_TIMEOUT", "0"))
+BACKGROUND_WORKER_SHUTDOWN_TIMEOUT = float(os.getenv("BACKGROUND_WORKER_SHUTDOWN_TIMEOUT", "30"))
+
+# Enriquecimento: "async" (jobs no loop de jobs assíncronos) ou "thread" (pool de threads)
+ENRICH_JOB_BACKEND = os.getenv("ENRICH_JOB_BACKEND", "async").lower()
+ASYNC_JOB_CONCURRENCY = int(os.getenv("ASYNC_JOB_CONCURRENCY", "32"))
+ASYNC_JOB_MAX_PENDING = int(os.getenv("ASYNC_JOB_MAX_PENDING", "500"))
+
+# Idempotência de efeitos: LRU por processo de sucessos conhecidos
+EFFECT_SUCCESS_CACHE_SIZE = int(os.getenv("EFFECT_SUCCESS_CACHE_SIZE", "10000"))
+# Sucessos gravados antes do ID determinístico (ID aleatório): consulta por relato
+# quando o get() pontual não encontra o documento. Desligada por padrão: rode
+# scripts/backfill_effect_idempotency_keys.py para regravar os sucessos antigos
+EFFECT_LEGACY_SUCCESS_LOOKUP = os.getenv("EFFECT_LEGACY_SUCCESS_LOOKUP", "false").lower() == "true"
+# Máximo de sucessos lidos por relato na consulta legada
+EFFECT_LEGACY_SUCCESS_LOOKUP_LIMIT = int(os.getenv("EFFECT_LEGACY_SUCCESS_LOOKUP_LIMIT", "200"))
+
+# Auth: cache de Firebase ID tokens verificados
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+# Janela máxima (s) em que um token revogado ainda pode ser aceito do cache; 0 desativa o cache
+AUTH_TOKEN_REVOCATION_RECHECK_SECONDS = float(os.getenv("AUTH_TOKEN_REVOCATION_RECHECK_SECONDS", "300"))
+
+# Auth: cache read-through de perfis users/{uid}
+USER_PROFILE_CACHE_SIZE = int(os.getenv("USER_PROFILE_CACHE_SIZE", "10000"))
+# Tempo (s) em que um perfil cacheado é reutilizado sem reler o Firestore; 0 desativa o cache
+USER_PROFILE_CACHE_TTL_SECONDS = float(os.getenv("USER_PROFILE_CACHE_TTL_SECONDS", "60"))
+# Idade mínima (s) de `updated_at` para regravar um perfil sem mudanças
+USER_PROFILE_TOUCH_INTERVAL_SECONDS = float(os.getenv("USER_PROFILE_TOUCH_INTERVAL_SECONDS", "86400"))
+
+# Storage: cache de signed URLs
+SIGNED_URL_CACHE_SIZE = int(os.getenv("SIGNED_URL_CACHE_SIZE", "20000"))
+# Uma URL cacheada deixa de ser servida quando faltam menos que isto (s) para expirar
+SIGNED_URL_SAFETY_MARGIN_SECONDS = float(os.getenv("SIGNED_URL_SAFETY_MARGIN_SECONDS", "300"))
+# Assinaturas simultâneas em get_signed_urls
+SIGNED_URL_SIGN_CONCURRENCY = int(os.getenv("SIGNED_URL_SIGN_CONCURRENCY", "8"))
+# Janelas alinhadas de expiração (s): dentro da mesma janela toda assinatura do
+# mesmo path gera a mesma URL, cacheável por browser/CDN. 0 desativa.
+SIGNED_URL_EXPIRY_WINDOW_SECONDS = int(os.getenv("SIGNED_URL_EXPIRY_WINDOW_SECONDS", "3600"))
+# Teto do max-age (s) das respostas que embutem signed URLs
+SIGNED_URL_RESPONSE_MAX_AGE_SECONDS = int(os.getenv("SIGNED_URL_RESPONSE_MAX_AGE_SECONDS", "300"))
+
+# Busca vetorial (app/chroma): base Chroma persistente e modelo de embedding
+CHROMA_PERSIST_PATH = os.getenv("CHROMA_PERSIST_PATH", "./app/db/dermasync_chroma")
+CHROMA_SEGMENTOS_COLLECTION = os.getenv("CHROMA_SEGMENTOS_COLLECTION", "segmentos")
+# Base e coleção dos depoimentos ingeridos de JSONL (app/chroma/ingest_from_jsonl.py)
+CHROMA_DEPOIMENTOS_PATH = os.getenv("CHROMA_DEPOIMENTOS_PATH", "./app/chroma_storage")
+CHROMA_DEPOIMENTOS_COLLECTION = os.getenv("CHROMA_DEPOIMENTOS_COLLECTION", "depoimentos")
+# Registros por collection.add na ingestão (limitado ao max batch size do cliente Chroma)
+CHROMA_INGEST_BATCH_SIZE = int(os.getenv("CHROMA_INGEST_BATCH_SIZE", "1000"))
+EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL_NAME", "intfloat/multilingual-e5-base")
+# Embeddings de consultas reaproveitados (LRU por processo); 0 desativa
+EMBEDDING_QUERY_CACHE_SIZE = int(os.getenv("EMBEDDING_QUERY_CACHE_SIZE", "1024"))
+# Carrega modelo e coleção no startup em vez de na primeira busca
+EMBEDDING_WARMUP_ON_STARTUP = os.getenv("EMBEDDING_WARMUP_ON_STARTUP", "false").lower() == "true"
 
 # Ambiente
 ENVIRONMENT = os.getenv("ENVIRONMENT", "production")
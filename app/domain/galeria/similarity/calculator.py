@@ -1,9 +1,9 @@
 # app/domain/galeria/similarity/calculator.py
 
-from typing import Dict
+from typing import Dict, Sequence, Union
 from .axes import SimilarityAxis
-from .policy import SimilarityPolicy
-from .score import SimilarityScore
+from .policy import CompiledSimilarityPolicy, SimilarityPolicy, compile_policy
+from .score import SimilarityBatch, SimilarityScore
 
 
 class SimilarityCalculator:
@@ -19,37 +19,74 @@ class SimilarityCalculator:
         policy: SimilarityPolicy,
     ) -> SimilarityScore:
 
-        policy.validate()
+        compiled = compile_policy(policy)
 
-        breakdown = {}
-        base_total = 0.0
-        active_weight_sum = 0.0  # soma dos pesos que realmente contriburam
+        return self.calculate_many(
+            partial_scores=[compiled.row(partial_scores)],
+            policy=compiled,
+        ).score(0)
 
-        for axis, weight in policy.weights.items():
-            axis_score = partial_scores.get(axis, 0.0)
+    def calculate_many(
+        self,
+        *,
+        partial_scores: Sequence[Sequence[float]],
+        policy: Union[SimilarityPolicy, CompiledSimilarityPolicy],
+    ) -> SimilarityBatch:
+        """
+        Mesmo cálculo de `calculate` para N candidatos de uma vez.
 
-            if not 0.0 <= axis_score <= 1.0:
+        `partial_scores` é uma matriz N x eixos, com as colunas na ordem de
+        `compile_policy(policy).axes` (use `compiled.row(...)` para montar
+        cada linha). As operações seguem a mesma ordem do caminho escalar,
+        então os valores são idênticos.
+        """
+        compiled = (
+            policy
+            if isinstance(policy, CompiledSimilarityPolicy)
+            else compile_policy(policy)
+        )
+
+        for row in partial_scores:
+            if len(row) != len(compiled.axes):
                 raise ValueError(
-                    f"Invalid score for axis {axis}: {axis_score}"
+                    f"Expected {len(compiled.axes)} axis scores per row (got {len(row)})"
                 )
 
-            weighted = axis_score * weight
-            breakdown[axis] = round(weighted, 4)
-            base_total += weighted
+        count = len(partial_scores)
+        breakdowns = {}
+        base_totals = [0.0] * count
+        # soma dos pesos que realmente contribuíram, por candidato
+        active_weight_sums = [0.0] * count
+
+        for column, (axis, weight) in enumerate(zip(compiled.axes, compiled.weights)):
+            axis_scores = [row[column] for row in partial_scores]
 
-            # eixo s conta como evidncia se tiver score > 0
-            if axis_score > 0.0:
-                active_weight_sum += weight
+            for axis_score in axis_scores:
+                if not 0.0 <= axis_score <= 1.0:
+                    raise ValueError(
+                        f"Invalid score for axis {axis}: {axis_score}"
+                    )
 
-        # confidence ∈ [0,1]
-        # representa quanta parte da poltica teve evidncia
-        confidence = active_weight_sum
+            weighted = [axis_score * weight for axis_score in axis_scores]
+            breakdowns[axis] = [round(value, 4) for value in weighted]
+            base_totals = [
+                total + value
+                for total, value in zip(base_totals, weighted)
+            ]
 
-        # score final ajustado por evidncia
-        final_total = round(base_total * confidence, 4)
+            # eixo só conta como evidência se tiver score > 0
+            active_weight_sums = [
+                active + weight if axis_score > 0.0 else active
+                for active, axis_score in zip(active_weight_sums, axis_scores)
+            ]
 
-        return SimilarityScore(
-            total=final_total,
-            breakdown=breakdown,
-            confidence=round(confidence, 4),
+        # confidence ∈ [0,1]: quanta parte da política teve evidência;
+        # score final ajustado por evidência
+        return SimilarityBatch(
+            totals=[
+                round(total * confidence, 4)
+                for total, confidence in zip(base_totals, active_weight_sums)
+            ],
+            breakdowns=breakdowns,
+            confidences=[round(confidence, 4) for confidence in active_weight_sums],
         )
@@ -1,6 +1,7 @@
 # app/domain/galeria/similarity/policy.py
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 from .axes import SimilarityAxis
 
 
@@ -18,6 +19,41 @@ class SimilarityPolicy:
             
 
 
+@dataclass(frozen=True)
+class CompiledSimilarityPolicy:
+    """
+    Política já validada, com eixos e pesos em tuplas na ordem de
+    `policy.weights`. É a ordem das colunas em calculate_many.
+    """
+
+    version: str
+    axes: Tuple[SimilarityAxis, ...]
+    weights: Tuple[float, ...]
+
+    def row(self, partial_scores: Dict[SimilarityAxis, float]) -> Tuple[float, ...]:
+        """Linha de scores parciais (eixos ausentes valem 0.0)."""
+        return tuple(partial_scores.get(axis, 0.0) for axis in self.axes)
+
+
+@lru_cache(maxsize=32)
+def _compile(version: str, items: Tuple[Tuple[SimilarityAxis, float], ...]) -> CompiledSimilarityPolicy:
+    policy = SimilarityPolicy(version=version, weights=dict(items))
+    policy.validate()
+    return CompiledSimilarityPolicy(
+        version=version,
+        axes=tuple(axis for axis, _ in items),
+        weights=tuple(weight for _, weight in items),
+    )
+
+
+def compile_policy(policy: SimilarityPolicy) -> CompiledSimilarityPolicy:
+    """
+    Valida e compila a política uma única vez por versão (e conjunto de
+    pesos); chamadas seguintes reaproveitam o mesmo objeto.
+    """
+    return _compile(policy.version, tuple(policy.weights.items()))
+
+
 # ============================================================
 # 📐 Similarity Policy v1
 # ============================================================
@@ -1,7 +1,7 @@
 # app/domain/galeria/similarity/score.py
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List
 from .axes import SimilarityAxis
 
 
@@ -16,3 +16,34 @@ class SimilarityScore:
     # Grau de evidncia disponvel (0–1)
     # Representa quanto da poltica realmente teve dados ativos
     confidence: float
+
+
+@dataclass(frozen=True)
+class SimilarityBatch:
+    """
+    Resultado de SimilarityCalculator.calculate_many para N candidatos.
+    Cada lista tem N posições, na ordem das linhas de entrada.
+    """
+
+    totals: List[float]
+
+    # Contribuição ponderada por eixo (coluna por eixo)
+    breakdowns: Dict[SimilarityAxis, List[float]]
+
+    confidences: List[float]
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def score(self, index: int) -> SimilarityScore:
+        return SimilarityScore(
+            total=self.totals[index],
+            breakdown={
+                axis: column[index]
+                for axis, column in self.breakdowns.items()
+            },
+            confidence=self.confidences[index],
+        )
+
+    def scores(self) -> List[SimilarityScore]:
+        return [self.score(index) for index in range(len(self))]
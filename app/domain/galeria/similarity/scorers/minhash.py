@@ -0,0 +1,118 @@
+# app/domain/galeria/similarity/scorers/minhash.py
+"""
+MinHash + LSH para gerar candidatos de similaridade por tags.
+
+A assinatura MinHash de um conjunto de tags estima o Jaccard entre dois
+relatos; o índice LSH agrupa as assinaturas em bandas e devolve só os
+relatos que colidem em alguma banda com a consulta. O Jaccard exato
+(jaccard_from_sets) roda apenas sobre essa lista curta.
+
+Assinaturas são determinísticas entre processos (hash estável, não o
+`hash()` do Python), então podem ser gravadas no Firestore.
+"""
+import hashlib
+import random
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20250101)
+_COEFFICIENTS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+)
+
+
+def _tag_hash(tag: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(tag.encode("utf-8"), digest_size=8).digest(),
+        "big",
+    )
+
+
+def minhash_signature(tags: Iterable[str]) -> List[int]:
+    """
+    Assinatura de MINHASH_PERMUTATIONS inteiros para um conjunto de tags já
+    normalizado (normalize_tags). Conjunto vazio gera assinatura vazia.
+    """
+    hashes = [_tag_hash(tag) for tag in set(tags)]
+    if not hashes:
+        return []
+
+    return [
+        min((a * value + b) % _PRIME for value in hashes)
+        for a, b in _COEFFICIENTS
+    ]
+
+
+def estimate_jaccard(signature_a: Sequence[int], signature_b: Sequence[int]) -> float:
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    equal = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return equal / len(signature_a)
+
+
+class MinHashLSHIndex:
+    """
+    Índice LSH (bandas x linhas) sobre assinaturas MinHash. Com 16 bandas de
+    4 linhas, pares com Jaccard a partir de ~0.5 colidem com alta
+    probabilidade. Sem lock próprio: quem o possui serializa o acesso.
+    """
+
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [
+            defaultdict(set) for _ in range(bands)
+        ]
+        self._keys: Dict[str, List[Tuple[int, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _band_keys(self, signature: Sequence[int]) -> List[Tuple[int, ...]]:
+        if len(signature) < self.bands * self.rows:
+            return []
+        return [
+            tuple(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def insert(self, key: str, signature: Sequence[int]) -> None:
+        self.remove(key)
+        band_keys = self._band_keys(signature)
+        if not band_keys:
+            return
+
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets[band_key].add(key)
+        self._keys[key] = band_keys
+
+    def remove(self, key: str) -> None:
+        band_keys = self._keys.pop(key, None)
+        if band_keys is None:
+            return
+
+        for buckets, band_key in zip(self._buckets, band_keys):
+            members = buckets.get(band_key)
+            if members is None:
+                continue
+            members.discard(key)
+            if not members:
+                del buckets[band_key]
+
+    def clear(self) -> None:
+        for buckets in self._buckets:
+            buckets.clear()
+        self._keys.clear()
+
+    def candidates(self, signature: Sequence[int]) -> Set[str]:
+        """Chaves que colidem com a assinatura em pelo menos uma banda."""
+        found: Set[str] = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            found.update(buckets.get(band_key, ()))
+        return found
@@ -1,5 +1,70 @@
 # app/domain/galeria/similarity/scorers/narrative_tone.py
 
+from typing import Any, Dict, Optional
+
+# Versão do formato de `tone_features`; mudar ao acrescentar dimensões
+TONE_FEATURES_VERSION = 1
+
+POSITIVE_MARKERS = [
+    "melhora",
+    "controle",
+    "evoluo",
+    "resultado",
+    "alvio",
+]
+
+
+def _score_markers(text: str) -> int:
+    text = text.lower()
+    return sum(1 for m in POSITIVE_MARKERS if m in text)
+
+
+def narrative_tone_features(text: Optional[str]) -> Dict[str, int]:
+    """
+    Features de tom do excerpt público, calculadas uma vez e guardadas no
+    card da galeria (galeria_public_cards.tone_features).
+    """
+    text = text or ""
+    return {
+        "version": TONE_FEATURES_VERSION,
+        "length": len(text),
+        "markers": _score_markers(text) if text else 0,
+    }
+
+
+def resolve_tone_features(
+    stored: Any,
+    text: Optional[str],
+) -> Dict[str, int]:
+    """
+    Features guardadas se estiverem na versão atual; senão calculadas
+    a partir do texto.
+    """
+    if isinstance(stored, dict) and stored.get("version") == TONE_FEATURES_VERSION:
+        return stored
+    return narrative_tone_features(text)
+
+
+def narrative_tone_similarity_from_features(
+    features_a: Dict[str, int],
+    features_b: Dict[str, int],
+) -> float:
+    """
+    Mesmo score de narrative_tone_similarity, só com aritmética sobre as
+    features pré-calculadas.
+    """
+    length_a = features_a.get("length") or 0
+    length_b = features_b.get("length") or 0
+    if not length_a or not length_b:
+        return 0.0
+
+    len_ratio = min(length_a, length_b) / max(length_a, length_b)
+
+    marker_score = 1.0 if features_a.get("markers") == features_b.get("markers") else 0.5
+
+    return round(0.6 * len_ratio + 0.4 * marker_score, 4)
+
+
 def narrative_tone_similarity(
     text_a: str,
     text_b: str,
@@ -12,23 +77,7 @@ def narrative_tone_similarity(
     if not text_a or not text_b:
         return 0.0
 
-    len_ratio = min(len(text_a), len(text_b)) / max(len(text_a), len(text_b))
-
-    positive_markers = [
-        "melhora",
-        "controle",
-        "evoluo",
-        "resultado",
-        "alvio",
-    ]
-
-    def score_markers(text: str) -> int:
-        text = text.lower()
-        return sum(1 for m in positive_markers if m in text)
-
-    markers_a = score_markers(text_a)
-    markers_b = score_markers(text_b)
-
-    marker_score = 1.0 if markers_a == markers_b else 0.5
-
-    return round(0.6 * len_ratio + 0.4 * marker_score, 4)
+    return narrative_tone_similarity_from_features(
+        narrative_tone_features(text_a),
+        narrative_tone_features(text_b),
+    )
@@ -1,6 +1,6 @@
 # app/domain/galeria/similarity/scorers/tags_overlap.py
 
-from typing import List, Set
+from typing import FrozenSet, Iterable, List, Set
 
 
 def _normalize(tags: List[str]) -> Set[str]:
@@ -11,6 +11,14 @@ def _normalize(tags: List[str]) -> Set[str]:
     }
 
 
+def normalize_tags(tags: Iterable[str]) -> FrozenSet[str]:
+    """
+    Conjunto normalizado de tags, calculado uma vez por relato (ex.: no card
+    da galeria) para não normalizar de novo a cada comparação.
+    """
+    return frozenset(_normalize(list(tags or [])))
+
+
 def jaccard_similarity(
     tags_a: List[str],
     tags_b: List[str],
@@ -20,8 +28,16 @@ def jaccard_similarity(
     Evita que 1 tag gere score 1.0 absoluto.
     """
 
-    set_a = _normalize(tags_a)
-    set_b = _normalize(tags_b)
+    return jaccard_from_sets(_normalize(tags_a), _normalize(tags_b))
+
+
+def jaccard_from_sets(
+    set_a: Set[str],
+    set_b: Set[str],
+) -> float:
+    """
+    Mesmo score de jaccard_similarity para conjuntos já normalizados.
+    """
 
     if not set_a or not set_b:
         return 0.0
@@ -1,7 +1,7 @@
 # app/firestore/client.py
 
 import logging
-from firebase_admin import firestore
+from firebase_admin import firestore, firestore_async
 from app.infra.firebase_app import init_firebase
 
 logger = logging.getLogger(__name__)
@@ -13,3 +13,14 @@ def get_firestore_client():
     init_firebase()
     return firestore.client()
 
+
+def get_async_firestore_client():
+    """
+    Obtém o cliente Firestore assíncrono (AsyncClient), garantindo que o
+    Firebase esteja inicializado.
+
+    O AsyncClient usa canais gRPC asyncio e fica associado ao event loop em
+    que é usado pela primeira vez: use-o apenas a partir do loop do servidor.
+    """
+    init_firebase()
+    return firestore_async.client()
@@ -1,9 +1,14 @@
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Dict, List
 
 from app.firestore.client import get_firestore_client
 from app.domain.relato.states import RelatoStatus
+from app.application.queries.readmodels.galeria_card import refresh_galeria_card
+from app.application.queries.relato_base_cache import relato_base_cache
+from app.application.services.async_jobs import get_async_job_runner
+from app.application.services.background_workers import JobRejectedError
 from app.infra.adapters.thread_processing_adapter import enqueue_relato_processing
 
 logger = logging.getLogger(__name__)
@@ -138,6 +143,36 @@ def update_relato_status_adapter(relato_id: str, new_status: RelatoStatus):
         relato_id,
     )
 
+    # Card da galeria e relato-base são derivados: atualizados no loop de
+    # jobs, fora do caminho da requisição de moderação
+    try:
+        get_async_job_runner().submit(
+            _refresh_derived_reads, relato_id, job_name="refresh_derived_reads"
+        )
+    except JobRejectedError:
+        logger.warning(
+            "ADAPTER: Loop de jobs indisponível, card e relato-base não atualizados | relato_id=%s",
+            relato_id,
+        )
+
+
+async def _refresh_derived_reads(relato_id: str) -> None:
+    """
+    Atualiza as leituras derivadas do relato após a mudança de status.
+    """
+    # Aprovação, rejeição e arquivamento mudam a presença na galeria pública
+    await asyncio.to_thread(refresh_galeria_card, relato_id)
+
+    # ...e o relato-base do dono na leitura mediada
+    try:
+        doc_ref = get_firestore_client().collection("relatos").document(relato_id)
+        snapshot = await asyncio.to_thread(doc_ref.get, field_paths=["user_id"])
+        owner = (snapshot.to_dict() or {}).get("user_id")
+        if owner:
+            relato_base_cache.invalidate(str(owner))
+    except Exception:
+        logger.exception("ADAPTER: Falha ao invalidar relato-base | relato_id=%s", relato_id)
+
 
 # =====================================================
 # Adapters ainda no implementados (intencionais)
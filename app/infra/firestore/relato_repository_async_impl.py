@@ -0,0 +1,103 @@
+# app/infra/firestore/relato_repository_async_impl.py
+"""
+Implementação de RelatoRepositoryPort sobre o AsyncClient do Firestore.
+
+Diferente de FirestoreRelatoRepository, que chama o SDK síncrono dentro de
+métodos async (bloqueando o event loop por um round trip inteiro), aqui toda
+operação de I/O é aguardada e devolve o controle ao loop enquanto espera.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Dict, List
+
+from app.firestore.client import get_async_firestore_client
+from app.domain.relato.states import RelatoStatus
+from app.ports.relato_repository_port import RelatoRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFirestoreRelatoRepository(RelatoRepositoryPort):
+
+    def __init__(self):
+        self.db = get_async_firestore_client()
+        self.collection = self.db.collection("relatos")
+
+    async def get_by_id(self, relato_id: str) -> Optional[Dict]:
+        doc = await self.collection.document(relato_id).get()
+        if not doc.exists:
+            return None
+        data = doc.to_dict()
+        data["id"] = doc.id
+        return data
+
+    async def find_similar_relatos(self, relato_id: str, top_k: int = 5) -> List[Dict]:
+        # Mesma heurística provisória do repositório síncrono:
+        # relatos com o mesmo status, mais recentes primeiro.
+        original_relato = await self.get_by_id(relato_id)
+        if not original_relato:
+            return []
+
+        status = original_relato.get("status")
+
+        query = (
+            self.collection
+            .where("status", "==", status)
+            .order_by("created_at", direction="DESCENDING")
+            .limit(top_k + 1)
+        )
+
+        similares = []
+        async for doc in query.stream():
+            if doc.id == relato_id:
+                continue
+            data = doc.to_dict()
+            data["id"] = doc.id
+            similares.append(data)
+            if len(similares) >= top_k:
+                break
+
+        return similares
+
+    async def update_status(self, relato_id: str, status: RelatoStatus) -> None:
+        logger.info("INFRA: Atualizando status do relato %s para %s", relato_id, status)
+        await self.collection.document(relato_id).update({
+            "status": status.value,
+            "updated_at": datetime.now(timezone.utc),
+        })
+
+    async def save_image_refs(self, relato_id: str, image_refs: Dict[str, List[str]]) -> None:
+        logger.info("INFRA: Salvando image_refs para relato %s", relato_id)
+        await self.collection.document(relato_id).update({
+            "image_refs": image_refs,
+            "updated_at": datetime.now(timezone.utc),
+        })
+
+    async def save(self, relato_id: str, data: Dict) -> None:
+        logger.info("INFRA: Salvando relato %s", relato_id)
+
+        data_to_save = {**data}
+
+        if isinstance(data_to_save.get("status"), RelatoStatus):
+            data_to_save["status"] = data_to_save["status"].value
+        if "updated_at" not in data_to_save:
+            data_to_save["updated_at"] = datetime.now(timezone.utc)
+        if "created_at" not in data_to_save:
+            data_to_save["created_at"] = datetime.now(timezone.utc)
+
+        await self.collection.document(relato_id).set(data_to_save, merge=True)
+
+    async def update_conteudo_anonimizado(
+        self,
+        relato_id: str,
+        conteudo: str,
+    ) -> None:
+        """
+        Persiste o conteúdo anonimizado gerado pela LLM.
+        """
+        await self.collection.document(relato_id).update(
+            {
+                "processamento.conteudo_anonimizado": conteudo,
+                "updated_at": datetime.now(timezone.utc),
+            }
+        )
@@ -0,0 +1,31 @@
+# app/infra/firestore/relato_repository_factory.py
+"""
+Seleção, na inicialização, da implementação de RelatoRepositoryPort usada
+pelas rotas HTTP (variável de ambiente RELATO_REPOSITORY_BACKEND).
+"""
+from app.config import RELATO_REPOSITORY_BACKEND
+from app.ports.relato_repository_port import RelatoRepositoryPort
+
+SUPPORTED_BACKENDS = ("sync", "async")
+
+
+def get_relato_repository(backend: str = RELATO_REPOSITORY_BACKEND) -> RelatoRepositoryPort:
+    """
+    Retorna o repositório de relatos configurado.
+
+    - "sync": FirestoreRelatoRepository (SDK bloqueante, padrão)
+    - "async": AsyncFirestoreRelatoRepository (AsyncClient, não bloqueia o loop)
+
+    Workers que rodam fora do event loop do servidor (ex.: loop de jobs)
+    devem usar FirestoreRelatoRepository(offload_io=True) diretamente: o
+    AsyncClient é compartilhado e fica associado ao loop do servidor.
+    """
+    if backend == "async":
+        from app.infra.firestore.relato_repository_async_impl import AsyncFirestoreRelatoRepository
+        return AsyncFirestoreRelatoRepository()
+    if backend == "sync":
+        from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
+        return FirestoreRelatoRepository()
+    raise ValueError(
+        f"RELATO_REPOSITORY_BACKEND inválido: {backend!r} (esperado um de {SUPPORTED_BACKENDS})"
+    )
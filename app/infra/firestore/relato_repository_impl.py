@@ -1,3 +1,5 @@
+import asyncio
+
 import logging
 
 from datetime import datetime, timezone
@@ -20,21 +22,33 @@ logger = logging.getLogger(__name__)
 
 class FirestoreRelatoRepository(RelatoRepositoryPort):
 
-    def __init__(self):
+    def __init__(self, offload_io: bool = False):
 
         self.db = get_firestore_client()
 
         self.collection = self.db.collection("relatos")
 
+        # offload_io=True: cada chamada do SDK sincrono roda via asyncio.to_thread,
+        # para uso em loops compartilhados (ex.: loop de jobs) sem bloquea-los
+        self.offload_io = offload_io
+
+    async def _io(self, fn, *args, **kwargs):
+
+        if self.offload_io:
+
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+        return fn(*args, **kwargs)
+
 
 
     async def get_by_id(self, relato_id: str) -> Optional[Dict]:
 
         doc_ref = self.collection.document(relato_id)
 
-        # Firestore SDK sync, for high volume consider asyncio.to_thread
+        # Firestore SDK sync: com offload_io a leitura vai para uma thread
 
-        doc = doc_ref.get()
+        doc = await self._io(doc_ref.get)
 
         if not doc.exists:
 
@@ -58,7 +72,7 @@ class FirestoreRelatoRepository(RelatoRepositoryPort):
 
         query = self.collection.where("status", "==", status).order_by("created_at", direction="DESCENDING").limit(top_k + 1)
 
-        results = query.stream()
+        results = await self._io(lambda: list(query.stream()))
 
         similares = []
         for doc in results:
@@ -78,7 +92,7 @@ class FirestoreRelatoRepository(RelatoRepositoryPort):
 
         doc_ref = self.collection.document(relato_id)
 
-        doc_ref.update({
+        await self._io(doc_ref.update, {
 
             "status": status.value,
             "updated_at": datetime.now(timezone.utc)
@@ -93,7 +107,7 @@ class FirestoreRelatoRepository(RelatoRepositoryPort):
 
         doc_ref = self.collection.document(relato_id)
 
-        doc_ref.update({
+        await self._io(doc_ref.update, {
 
             "image_refs": image_refs,
 
@@ -125,7 +139,7 @@ class FirestoreRelatoRepository(RelatoRepositoryPort):
 
             data_to_save["created_at"] = datetime.now(timezone.utc)
 
-        doc_ref.set(data_to_save, merge=True)
+        await self._io(doc_ref.set, data_to_save, merge=True)
 
 
     from google.cloud import firestore
@@ -146,7 +160,8 @@ class FirestoreRelatoRepository(RelatoRepositoryPort):
             .document(relato_id)
         )
 
-        doc_ref.update(
+        await self._io(
+            doc_ref.update,
             {
                 "processamento.conteudo_anonimizado": conteudo,
                 "updated_at": datetime.now(timezone.utc),
@@ -1,7 +1,7 @@
 import logging
+from app.application.services.background_workers import JobRejectedError
 from app.application.services.processing_dispatcher import enqueue_relato_processing
-from app.ports.processing_port import ProcessingPort
-
+from app.ports.processing_port import ProcessingBackpressureError, ProcessingPort
 
 logger = logging.getLogger(__name__)
 
@@ -9,4 +9,12 @@ class CloudTasksProcessingAdapter(ProcessingPort):
     async def enqueue_relato_processing(self, relato_id: str) -> None:
         logger.info("INFRA: Enfileirando processamento para relato %s via Adapter", relato_id)
         # Reusa a lógica existente no service que já lida com o detalhe técnico
-        enqueue_relato_processing(relato_id)
+        try:
+            enqueue_relato_processing(relato_id)
+        except JobRejectedError as exc:
+            logger.warning(
+                "INFRA: Processamento recusado para relato %s (backpressure): %s",
+                relato_id,
+                exc,
+            )
+            raise ProcessingBackpressureError(str(exc)) from exc
@@ -6,6 +6,7 @@ from app.application.effects.result import EffectResult, EffectStatus
 from app.application.effects.retry_engine import RetryEngine
 from app.application.effects.persist_firestore import persist_effect_result_firestore
 from app.application.effects.relato_executor import RelatoEffectExecutor
+from app.application.effects.idempotency import prefetch_effect_successes
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +39,23 @@ class RetryScheduler:
 
         logger.info("RetryScheduler | falhas encontradas=%d", len(failed_results))
 
+        decisions = []
         for result in failed_results:
 
             enriched = self._retry_engine.decide(result)
 
             # Persistimos a deciso, SEMPRE
             persist_effect_result_firestore(enriched)
+            decisions.append(enriched)
+
+        # Idempotência do ciclo inteiro em uma única leitura em lote
+        known_successes = prefetch_effect_successes(
+            (r.relato_id, r.effect_type, str(r.metadata["effect_ref"]))
+            for r in decisions
+            if r.status == EffectStatus.RETRYING and r.metadata and r.metadata.get("effect_ref")
+        )
+
+        for enriched in decisions:
 
             if enriched.status == EffectStatus.RETRYING:
                 logger.info(
@@ -58,6 +70,7 @@ class RetryScheduler:
                     self._executor.execute_by_result(
                         effect_result=enriched,
                         attempt=attempt,
+                        known_successes=known_successes,
                     )
 
                 except Exception:
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from app.adapters.firebase_storage_adapter import FirebaseStorageAdapter
 
 logger = logging.getLogger(__name__)
@@ -22,6 +22,17 @@ class StorageAdapter:
             logger.error(f"Erro ao gerar signed URL para {storage_path}: {e}")
             return None
 
+    def get_signed_urls(self, storage_paths: Iterable[str], expires_seconds: int = 3600) -> Dict[str, Optional[str]]:
+        """
+        Gera signed URLs em lote (cache + assinatura paralela dos misses).
+        Retorna {path: url ou None}; paths vazios são ignorados.
+        """
+        try:
+            return self._adapter._get_signed_urls_sync(storage_paths, expires_seconds)
+        except Exception as e:
+            logger.error(f"Erro ao gerar signed URLs em lote: {e}")
+            return {}
+
     def upload_bytes(self, storage_path: str, content: bytes, content_type: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """Realiza o upload de bytes para um caminho específico e retorna o caminho salvo."""
         try:
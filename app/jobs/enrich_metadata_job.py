@@ -1,8 +1,10 @@
 # app/jobs/enrich_metadata_job.py
 from datetime import datetime
 import logging
+import random
 import time
 import socket
+from typing import Any, Awaitable, Callable
 
 from app.repositories.relato_repository import RelatoRepository
 from app.repositories.effect_result_repository import EffectResultRepository
@@ -29,6 +31,7 @@ class EnrichMetadataJob:
 
     MAX_ATTEMPTS = 3
     RETRY_DELAY_SECONDS = 2
+    RETRY_MAX_DELAY_SECONDS = 30
     from typing import Callable
     def __init__(
         self,
@@ -37,6 +40,8 @@ class EnrichMetadataJob:
         enriched_repo: EnrichedMetadataRepository,
         pipeline_manager: PipelineManager | None = None,
         on_completed_callback: Callable[..., None] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ):
         self.relato_repo = relato_repo
         self.effect_repo = effect_repo
@@ -44,35 +49,77 @@ class EnrichMetadataJob:
         self.pipeline_manager = pipeline_manager or PipelineManager()
         self.worker_id = f"worker-{socket.gethostname()}"
         self.on_completed_callback = on_completed_callback
+        # espera entre tentativas (run / run_async); injetável para testes
+        self.sleep = sleep
+        self.async_sleep = async_sleep
+
+    def retry_delay(self, attempt: int) -> float:
+        """
+        Backoff exponencial com jitter: metade fixa + metade aleatória, para
+        que jobs que falharam juntos não voltem ao LLM no mesmo instante.
+        """
+        delay = min(self.RETRY_MAX_DELAY_SECONDS, self.RETRY_DELAY_SECONDS * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
 
     def run(self, relato_id: str) -> None:
         """
-        Versão síncrona do Job para rodar no ThreadPoolExecutor legado.
+        Versão síncrona do Job, para o pool de threads (BackgroundWorkerPool).
+
+        Mesmo fluxo de run_async, num loop próprio da thread do pool: as
+        chamadas síncronas rodam direto e o backoff usa `sleep`.
+        """
+        async def sleep(seconds: float) -> None:
+            self.sleep(seconds)
+
+        asyncio.run(self._execute(relato_id, call=_call_inline, sleep=sleep))
+
+    async def run_async(self, relato_id: str) -> None:
+        """
+        Versão assíncrona do Job, executada no loop de jobs (AsyncJobRunner).
+
+        Repositórios e LLM continuam síncronos: cada chamada vai para
+        asyncio.to_thread e o backoff usa `async_sleep`, então o job só ocupa
+        uma thread durante a chamada em si.
+        """
+        await self._execute(relato_id, call=asyncio.to_thread, sleep=self.async_sleep)
+
+    async def _execute(
+        self,
+        relato_id: str,
+        *,
+        call: Callable[..., Awaitable[Any]],
+        sleep: Callable[[float], Awaitable[None]],
+    ) -> None:
+        """
+        Fluxo único do job. `call(fn, *args)` executa as chamadas síncronas
+        (direto ou via asyncio.to_thread) e `sleep` faz a espera do backoff.
         """
         logger.info("[enrich_metadata_job] start | relato_id=%s", relato_id)
-        
-        # FASE 2: Claim da tarefa (Síncrono)
-        claimed = self.pipeline_manager.claim_task(
+
+        # FASE 2: Claim da tarefa
+        claimed = await call(
+            self.pipeline_manager.claim_task,
             relato_id=relato_id,
             task_name=self.EFFECT_TYPE,
-            worker_id=self.worker_id
+            worker_id=self.worker_id,
         )
 
         if not claimed:
             logger.info("[enrich_metadata_job] skip | já em execução ou concluída | %s", relato_id)
             return
 
-        relato = self.relato_repo.get_by_id(relato_id)
+        relato = await call(self.relato_repo.get_by_id, relato_id)
         if not relato:
-            self.pipeline_manager.fail_task(relato_id, self.EFFECT_TYPE, "Relato não encontrado")
+            await call(self.pipeline_manager.fail_task, relato_id, self.EFFECT_TYPE, "Relato não encontrado")
             return
 
-        self.effect_repo.register_success(
+        await call(
+            self.effect_repo.register_success,
             EffectResult.started(
                 relato_id=relato_id,
                 effect_type=self.EFFECT_TYPE,
                 metadata={"worker_id": self.worker_id},
-            )
+            ),
         )
 
         try:
@@ -80,23 +127,26 @@ class EnrichMetadataJob:
             attempt = 1
             while attempt <= self.MAX_ATTEMPTS:
                 try:
-                    enriched_data = run_enrich_metadata_llm(
+                    enriched_data = await call(
+                        run_enrich_metadata_llm,
                         relato_text=relato['conteudo_original'],
                     )
                     break
                 except Exception as exc:
                     if attempt >= self.MAX_ATTEMPTS: raise
-                    self.effect_repo.register_success(
+                    await call(
+                        self.effect_repo.register_success,
                         EffectResult.retrying(
                             relato_id=relato_id,
                             effect_type=self.EFFECT_TYPE,
                             metadata={"attempt": attempt, "error": str(exc)},
-                        )
+                        ),
                     )
+                    await sleep(self.retry_delay(attempt))
                     attempt += 1
-                    time.sleep(self.RETRY_DELAY_SECONDS)
 
-            self.enriched_repo.save(
+            await call(
+                self.enriched_repo.save,
                 relato_id=relato_id,
                 data=enriched_data,
                 created_at=datetime.utcnow(),
@@ -110,31 +160,33 @@ class EnrichMetadataJob:
                 "enrichment": enriched_data,
             }
 
-            conteudo_anonimizado = asyncio.run(
-                generate_anonymous_content(payload)
-            )
+            conteudo_anonimizado = await generate_anonymous_content(payload)
 
-            self.enriched_repo.collection.document(relato_id).update(
+            await call(
+                self.enriched_repo.collection.document(relato_id).update,
                 {
                     "data.conteudo_anonimizado": conteudo_anonimizado,
-                }
+                },
             )
 
-            # FASE 2: Sucesso no Pipeline (Síncrono)
-            self.pipeline_manager.complete_task(relato_id, self.EFFECT_TYPE)
+            # FASE 2: Sucesso no Pipeline
+            await call(self.pipeline_manager.complete_task, relato_id, self.EFFECT_TYPE)
 
-            self.effect_repo.register_success(
+            await call(
+                self.effect_repo.register_success,
                 EffectResult.success(
                     relato_id=relato_id,
                     effect_type=self.EFFECT_TYPE,
                     metadata={"fields": list(enriched_data.keys())},
-                )
+                ),
             )
 
             # Notifica conclusão para disparar transições de domínio
             if self.on_completed_callback:
                 try:
-                    self.on_completed_callback(relato_id)
+                    result = self.on_completed_callback(relato_id)
+                    if asyncio.iscoroutine(result):
+                        await result
                 except Exception as e:
                     logger.error(f"[enrich_metadata_job] erro no callback de conclusão: {e}")
 
@@ -142,12 +194,20 @@ class EnrichMetadataJob:
 
         except Exception as exc:
             logger.exception("[enrich_metadata_job] failed | relato_id=%s", relato_id)
-            # FASE 2: Falha no Pipeline (Síncrono)
-            self.pipeline_manager.fail_task(relato_id, self.EFFECT_TYPE, str(exc), self.MAX_ATTEMPTS)
-            self.effect_repo.register_failure(
+            # FASE 2: Falha no Pipeline
+            await call(
+                self.pipeline_manager.fail_task, relato_id, self.EFFECT_TYPE, str(exc), self.MAX_ATTEMPTS
+            )
+            await call(
+                self.effect_repo.register_failure,
                 EffectResult.error(
                     relato_id=relato_id,
                     effect_type=self.EFFECT_TYPE,
                     error_message=str(exc),
-                )
+                ),
             )
+
+
+async def _call_inline(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    # adaptador de `call` para run(): a thread do pool já pode bloquear
+    return fn(*args, **kwargs)
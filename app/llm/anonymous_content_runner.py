@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from app.application.parsers.llm.parser import LLMOutputParser
@@ -30,6 +31,9 @@ async def generate_anonymous_content(
 ):
     """
     Gera uma descricao publica do relato utilizando a porta de inferencia de LLM.
+
+    A porta de inferencia e sincrona: a chamada (e o eventual reparo de JSON
+    feito pelo parser) roda em thread para nao bloquear o event loop.
     """
 
     prompt = build_prompt(relato)
@@ -42,15 +46,16 @@ async def generate_anonymous_content(
         prompt,
     )
 
-    response = inference.generate(
+    response = await asyncio.to_thread(
+        inference.generate,
         LLMRequest(
             task=LLMTask.ANONYMIZE_CONTENT,
             prompt=prompt,
             response_format="json",
-        )
+        ),
     )
 
-    parsed_response = parser.parse_anonymous_content(response.text)
+    parsed_response = await asyncio.to_thread(parser.parse_anonymous_content, response.text)
 
     logger.debug(
         "[anonymous_content] parsing response from LLM: %s",
@@ -23,10 +23,22 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import (
-    ALLOWED_ORIGINS, ENVIRONMENT
+    ALLOWED_ORIGINS, EMBEDDING_WARMUP_ON_STARTUP, ENVIRONMENT, PUBLIC_REPLICA_ENABLED,
+    RELATO_REPOSITORY_BACKEND
 )
 
 from app.application.effects.register_effects import register_all_effect_executors
+from app.application.effects.result_sink import shutdown_effect_result_sink
+from app.application.queries.public_relato_replica import (
+    shutdown_public_relato_replica, start_public_relato_replica
+)
+from app.application.services.async_jobs import (
+    shutdown_async_job_runner, start_async_job_runner
+)
+from app.application.services.background_workers import (
+    shutdown_background_workers, start_background_workers
+)
+from app.chroma.factory import db_factory
 
 
 # Import de rotas (agora seguro, pois o env j est carregado)
@@ -42,6 +54,7 @@ from app.infra.firebase_app import init_firebase
 async def lifespan(app: FastAPI):
     # Inicializao explcita e controlada
     logging.info(f"DermaSync API iniciando em: {ENVIRONMENT}")
+    logging.info(f"Repositório de relatos: {RELATO_REPOSITORY_BACKEND}")
     
     # Centralização da inicialização do Firebase
     init_firebase()
@@ -49,8 +62,30 @@ async def lifespan(app: FastAPI):
     # Registrar executores de efeitos
     register_all_effect_executors()
     
+    # Workers de processamento em background (enriquecimento)
+    start_background_workers()
+    start_async_job_runner()
+
+    # Réplica em memória dos relatos públicos (feed anônimo / galeria)
+    if PUBLIC_REPLICA_ENABLED:
+        start_public_relato_replica()
+
+    # Modelo de embedding e Chroma: por padrão só no primeiro uso
+    if EMBEDDING_WARMUP_ON_STARTUP:
+        try:
+            db_factory.warmup()
+        except Exception:
+            logging.exception("Falha no warmup de embeddings; carga fica para o primeiro uso")
+    
     yield
     logging.info("DermaSync API encerrando.")
+    shutdown_public_relato_replica()
+    # Termina os jobs já enfileirados antes de drenar a auditoria que eles geram
+    shutdown_background_workers()
+    shutdown_async_job_runner()
+
+    # Drena a auditoria de efeitos ainda pendente na fila
+    shutdown_effect_result_sink()
 
 app = FastAPI(
     title="DermaSync API",
@@ -1,8 +1,15 @@
 from typing import Protocol
 
+class ProcessingBackpressureError(RuntimeError):
+    """
+    O backend de processamento recusou o relato (fila cheia ou encerrando).
+    O chamador deve tentar novamente mais tarde.
+    """
+
 class ProcessingPort(Protocol):
     async def enqueue_relato_processing(self, relato_id: str) -> None:
         """
         Enfileira um relato para processamento assíncrono (enriquecimento, etc).
+        Lança ProcessingBackpressureError quando não há capacidade.
         """
         ...
@@ -1,4 +1,4 @@
-from typing import Protocol, Optional, Dict
+from typing import Protocol, Optional, Dict, Iterable
 from dataclasses import dataclass
 
 @dataclass
@@ -32,6 +32,9 @@ class StoragePort(Protocol):
     async def get_signed_url(self, path: str, expires_seconds: int = 3600) -> Optional[str]:
         ...
 
+    async def get_signed_urls(self, paths: Iterable[str], expires_seconds: int = 3600) -> Dict[str, Optional[str]]:
+        ...
+
     async def download_bytes(self, path: str) -> bytes:
         ...
 
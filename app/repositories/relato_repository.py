@@ -1,6 +1,6 @@
 # app/repositories/relato_repository.py
 
-from typing import Optional, List, Dict
+from typing import Iterable, Optional, List, Dict
 from datetime import datetime
 
 from google.cloud.firestore import FieldFilter
@@ -9,6 +9,57 @@ from app.firestore.client import get_firestore_client
 from app.domain.relato.states import RelatoStatus
 
 
+def build_tags_from_enrichment(enrichment_payload: Dict) -> List[str]:
+    """
+    Deriva tags para UI a partir do enrichment.
+    """
+
+    tags = []
+
+    tags.extend(
+        enrichment_payload.get("sintomas", [])
+    )
+
+    tags.extend(
+        enrichment_payload.get(
+            "tratamentos_mencionados",
+            []
+        )
+    )
+
+    # remove duplicados preservando ordem
+    return list(dict.fromkeys(tags))
+
+
+def build_relato_dict(
+    relato_id: str,
+    raw: Optional[Dict],
+    enrichment_payload: Optional[Dict] = None,
+) -> Dict:
+    """
+    Formato de saída do repositório a partir do documento bruto.
+    Também usado pela réplica em memória dos relatos públicos.
+    """
+
+    data = dict(raw or {})
+
+    data["id"] = relato_id
+
+    # mantém compatibilidade com código existente
+    if "data" in data and isinstance(data["data"], dict):
+        data.update(data["data"])
+
+    if enrichment_payload is not None:
+
+        data["enrichment"] = enrichment_payload
+
+        data["tags"] = build_tags_from_enrichment(
+            enrichment_payload
+        )
+
+    return data
+
+
 class RelatoRepository:
     """
     Camada de acesso a dados para relatos armazenados no Firestore.
@@ -26,75 +77,83 @@ class RelatoRepository:
     # HELPERS
     # ==========================================================
 
-    def _get_enrichment(self, relato_id: str) -> Dict:
+    def _get_enrichments(self, relato_ids: Iterable[str]) -> Dict[str, Dict]:
         """
-        Busca o enrichment relacionado ao relato.
+        Busca os enrichments de vários relatos em uma única chamada
+        (get_all). EnrichedMetadataRepository grava cada enrichment com
+        o id do relato como id do documento.
+
+        Retorna {relato_id: payload}; relatos sem enrichment ficam com {}.
         """
 
-        enrichment_query = (
-            self.enrichment_collection
-            .where(filter=FieldFilter("relato_id", "==", relato_id))
-            .limit(1)
-        )
+        relato_ids = list(dict.fromkeys(relato_ids))
+        enrichments: Dict[str, Dict] = {relato_id: {} for relato_id in relato_ids}
 
-        enrichment_docs = list(enrichment_query.stream())
+        if not relato_ids:
+            return enrichments
 
-        if not enrichment_docs:
-            return {}
+        refs = [
+            self.enrichment_collection.document(relato_id)
+            for relato_id in relato_ids
+        ]
 
-        enrichment_data = enrichment_docs[0].to_dict() or {}
+        # get_all não garante a ordem: o id do snapshot é o relato_id
+        for snapshot in self.db.get_all(refs):
+            if snapshot.exists:
+                enrichments[snapshot.id] = (snapshot.to_dict() or {}).get("data", {})
 
-        return enrichment_data.get("data", {})
+        return enrichments
 
-    def _build_tags_from_enrichment(
-        self,
-        enrichment_payload: Dict,
-    ) -> List[str]:
+    def _get_enrichment(self, relato_id: str) -> Dict:
         """
-        Deriva tags para UI a partir do enrichment.
+        Busca o enrichment relacionado ao relato.
         """
 
-        tags = []
+        return self._get_enrichments([relato_id])[relato_id]
 
-        tags.extend(
-            enrichment_payload.get("sintomas", [])
-        )
-
-        tags.extend(
-            enrichment_payload.get(
-                "tratamentos_mencionados",
-                []
-            )
-        )
-
-        # remove duplicados preservando ordem
-        return list(dict.fromkeys(tags))
+    def _build_tags_from_enrichment(
+        self,
+        enrichment_payload: Dict,
+    ) -> List[str]:
+        return build_tags_from_enrichment(enrichment_payload)
 
     def _build_relato(
         self,
         doc,
         include_enrichment: bool = True,
+        enrichment_payload: Optional[Dict] = None,
     ) -> Dict:
+        """
+        Monta o relato. `enrichment_payload` vem pré-carregado quando o
+        relato faz parte de uma página (ver _build_relatos); sem ele o
+        enrichment é buscado individualmente.
+        """
 
-        data = doc.to_dict() or {}
-
-        data["id"] = doc.id
-
-        # mantém compatibilidade com código existente
-        if "data" in data and isinstance(data["data"], dict):
-            data.update(data["data"])
-
-        if include_enrichment:
-
+        if include_enrichment and enrichment_payload is None:
             enrichment_payload = self._get_enrichment(doc.id)
 
-            data["enrichment"] = enrichment_payload
+        return build_relato_dict(
+            doc.id,
+            doc.to_dict(),
+            enrichment_payload if include_enrichment else None,
+        )
 
-            data["tags"] = self._build_tags_from_enrichment(
-                enrichment_payload
-            )
+    def _build_relatos(
+        self,
+        docs: Iterable,
+    ) -> List[Dict]:
+        """
+        Monta uma página de relatos com uma única leitura em lote dos
+        enrichments (em vez de uma consulta por relato).
+        """
 
-        return data
+        docs = list(docs)
+        enrichments = self._get_enrichments(doc.id for doc in docs)
+
+        return [
+            self._build_relato(doc, enrichment_payload=enrichments[doc.id])
+            for doc in docs
+        ]
 
     # ==========================================================
     # QUERIES
@@ -139,12 +198,7 @@ class RelatoRepository:
             .limit(limit)
         )
 
-        docs = query.stream()
-
-        return [
-            self._build_relato(doc)
-            for doc in docs
-        ]
+        return self._build_relatos(query.stream())
 
     def get_by_owner(
         self,
@@ -164,12 +218,7 @@ class RelatoRepository:
             .limit(limit)
         )
 
-        docs = query.stream()
-
-        return [
-            self._build_relato(doc)
-            for doc in docs
-        ]
+        return self._build_relatos(query.stream())
 
     # ==========================================================
     # COMMANDS
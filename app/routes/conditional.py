@@ -0,0 +1,120 @@
+# app/routes/conditional.py
+"""
+GET condicional (ETag / Last-Modified -> 304) para as leituras públicas.
+
+Os validadores vêm da versão da réplica pública (ReplicaValidator) mais os
+parâmetros da requisição. Respostas que embutem signed URLs também mudam a
+cada janela de assinatura (expiry_window), então o início da janela entra
+no ETag e no Last-Modified; sem janelas alinhadas as URLs não são estáveis
+e essas rotas não usam GET condicional.
+
+A verificação roda antes de qualquer montagem de resposta: um 304 não toca
+o Firestore nem assina URLs.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+
+from fastapi import Request, Response, status
+
+from app.adapters.signed_url_cache import expiry_window
+
+# Respostas sem signed URLs: qualquer cache pode guardar, mas revalida
+# sempre (a revalidação é barata: 304 direto da réplica)
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+# Conteúdo que não é comprovadamente público (ex.: imagens de relato privado)
+NO_STORE_CACHE_CONTROL = "private, no-store"
+
+
+class ConditionalValidators(NamedTuple):
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def build_validators(
+    *parts: Any,
+    last_modified: Optional[datetime] = None,
+    signed_urls: bool = False,
+    now: Optional[float] = None,
+) -> Optional[ConditionalValidators]:
+    """
+    ETag fraco sobre `parts` (versão da réplica + parâmetros). Com
+    `signed_urls`, inclui a janela de assinatura atual; None quando as
+    janelas estão desativadas.
+    """
+    if signed_urls:
+        window = expiry_window(now)
+        if window is None:
+            return None
+        parts = (*parts, window[0])
+        window_start = datetime.fromtimestamp(window[0], tz=timezone.utc)
+        last_modified = max(last_modified, window_start) if last_modified else window_start
+
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return ConditionalValidators(f'W/"{digest}"', last_modified)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # comparação fraca (RFC 9110 §13.1.2): ignora o prefixo W/
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def is_not_modified(request: Request, validators: ConditionalValidators) -> bool:
+    """
+    True se o cliente já tem a versão atual. If-None-Match tem precedência;
+    If-Modified-Since só é avaliado na ausência dele.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or validators.last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    # Last-Modified trafega com precisão de segundos
+    return validators.last_modified.replace(microsecond=0) <= since
+
+
+def apply_validators(
+    response: Response,
+    validators: ConditionalValidators,
+    *,
+    cache_control: Optional[str] = None,
+    vary: Optional[str] = None,
+) -> None:
+    response.headers["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            validators.last_modified.astimezone(timezone.utc),
+            usegmt=True,
+        )
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
+    if vary:
+        response.headers["Vary"] = vary
+
+
+def not_modified_response(
+    validators: ConditionalValidators,
+    *,
+    cache_control: Optional[str] = None,
+    vary: Optional[str] = None,
+) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    apply_validators(response, validators, cache_control=cache_control, vary=vary)
+    return response
@@ -1,14 +1,22 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.auth.dependencies import get_optional_user as get_current_user_optional
 from app.auth.schemas import User
 from app.repositories.relato_repository import RelatoRepository
-from app.application.queries.feed_relato_query import LegacyFeedRelatoQuery
+from app.application.queries.feed_relato_query import LegacyFeedRelatoQuery, ReplicaFeedRelatoQuery
+from app.application.queries.public_relato_replica import get_public_relato_replica
 from app.application.queries.feed_query import FeedService
 from app.schema.feed import FeedResponseDTO
+from app.routes.conditional import (
+    REVALIDATE_CACHE_CONTROL,
+    apply_validators,
+    build_validators,
+    is_not_modified,
+    not_modified_response,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -17,16 +25,44 @@ logger = logging.getLogger(__name__)
 
 @router.get("/feed", response_model=FeedResponseDTO)
 async def get_feed(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     limit: int = Query(12, ge=1, le=50),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
+    replica = get_public_relato_replica()
+
+    # Feed anônimo: mesmo conteúdo para todos, versionado pela réplica.
+    # O feed de quem está logado depende do usuário e não é cacheado.
+    validators = None
+    if not current_user or current_user.role == "anon":
+        replica_validator = replica.feed_validator()
+        if replica_validator is not None:
+            validators = build_validators(
+                "feed_anon",
+                replica_validator.version,
+                page,
+                limit,
+                last_modified=replica_validator.last_modified,
+            )
+
+    cache_options = {"cache_control": REVALIDATE_CACHE_CONTROL, "vary": "Authorization"}
+    if validators is not None and is_not_modified(request, validators):
+        return not_modified_response(validators, **cache_options)
+
     relato_repo = RelatoRepository()
-    relato_query = LegacyFeedRelatoQuery(relato_repo)
+    relato_query = ReplicaFeedRelatoQuery(
+        replica,
+        LegacyFeedRelatoQuery(relato_repo),
+    )
     service = FeedService(relato_query)
 
     feed = await service.get_feed(current_user, page, limit)
 
+    if validators is not None:
+        apply_validators(response, validators, **cache_options)
+
     return {
         "meta": {
             "page": page,
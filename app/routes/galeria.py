@@ -12,7 +12,7 @@ from typing import Optional
 
 
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
 
 
 
@@ -21,8 +21,18 @@ from app.auth.dependencies import get_current_user, require_admin
 from app.auth.schemas import User
 
 
+from app.adapters.signed_url_cache import signed_url_cache_control
+
+from app.config import GALERIA_PUBLIC_SOURCE
+
+from app.application.queries.galeria_cursor import InvalidCursorError
+
 from app.application.queries.galeria_query import listar_galeria_publica_v3
 
+from app.application.queries.public_relato_replica import get_public_relato_replica
+
+from app.routes.conditional import apply_validators, build_validators, is_not_modified, not_modified_response
+
 
 
 router = APIRouter()
@@ -90,23 +100,96 @@ async def listar_relatos_preview_admin(
 
 async def listar_galeria_publica_route(
 
+    request: Request,
+
+    response: Response,
+
     limit: int = Query(12, ge=1, le=24),
 
     page: int = Query(1, ge=1),
 
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em meta.next_cursor"),
+
 ):
 
     """
 
     Retorna a lista de relatos pblicos para a galeria (v3 oficial).
 
+    Use `cursor` (meta.next_cursor da página anterior) para paginar; `page`
+
+    segue aceito por compatibilidade, mas o custo cresce com a profundidade.
+
+    Responde 304 quando o cliente já tem a versão atual dos cards.
+
     """
 
-    return await listar_galeria_publica_v3(
+    validators = None
 
-        limit=limit,
+    replica_validator = get_public_relato_replica().galeria_validator(GALERIA_PUBLIC_SOURCE)
 
-        page=page
+    if replica_validator is not None:
 
-    )
+        validators = build_validators(
+
+            "galeria_public",
+
+            GALERIA_PUBLIC_SOURCE,
+
+            replica_validator.version,
+
+            limit,
+
+            page,
+
+            cursor,
+
+            last_modified=replica_validator.last_modified,
+
+            signed_urls=True,
+
+        )
+
+
+    # As thumbnails são signed URLs estáveis até o fim da janela atual
+
+    cache_control = signed_url_cache_control()
+
+    if validators is not None and is_not_modified(request, validators):
+
+        return not_modified_response(validators, cache_control=cache_control)
+
+
+    try:
+
+        result = await listar_galeria_publica_v3(
+
+            limit=limit,
+
+            page=page,
+
+            cursor=cursor,
+
+        )
+
+    except InvalidCursorError as exc:
+
+        raise HTTPException(
+
+            status_code=status.HTTP_400_BAD_REQUEST,
+
+            detail=str(exc),
+
+        ) from exc
+
+
+    if validators is not None:
+
+        apply_validators(response, validators)
+
+    if cache_control:
+
+        response.headers["Cache-Control"] = cache_control
+
+    return result
 
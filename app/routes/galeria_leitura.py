@@ -1,16 +1,18 @@
 # app/routes/galeria_leitura.py
 # Endpoint de leitura mediada de relatos na galeria pblica.
 
+import asyncio
 import logging
 from typing import Optional, Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.auth.dependencies import get_optional_user
 from app.auth.schemas import User
 from app.firestore.client import get_firestore_client
 
 from app.application.queries.galeria_query import resolve_relato_base_for_user
+from app.application.queries.public_relato_replica import get_public_relato_replica
 from app.domain.relato.normalizer import normalize_relato_document
 from app.application.ux.adapters.galeria_explanation import (
     GaleriaExplanationBuilder,
@@ -31,14 +33,24 @@ from app.domain.galeria.similarity.calculator import SimilarityCalculator
 from app.domain.galeria.similarity.policy import SIMILARITY_POLICY_V1
 from app.domain.galeria.similarity.axes import SimilarityAxis
 from app.domain.galeria.similarity.scorers.tags_overlap import (
-    jaccard_similarity,
+    jaccard_from_sets,
+    normalize_tags,
 )
 from app.domain.galeria.similarity.scorers.narrative_tone import (
-    narrative_tone_similarity,
+    narrative_tone_features,
+    narrative_tone_similarity_from_features,
+    resolve_tone_features,
 )
 
 
 from app.infra.storage.adapter import StorageAdapter
+from app.adapters.signed_url_cache import signed_url_cache_control
+from app.routes.conditional import (
+    apply_validators,
+    build_validators,
+    is_not_modified,
+    not_modified_response,
+)
 
 
 router = APIRouter()
@@ -55,10 +67,33 @@ _storage = StorageAdapter()
 )
 async def ler_relato(
     relato_id: str,
+    request: Request,
+    http_response: Response,
     intent: str = "read",
     current_user: Optional[User] = Depends(get_optional_user),
 ) -> Dict[str, Any]:
 
+    # Resposta depende do leitor: só o cache do próprio cliente
+    cache_control = signed_url_cache_control(private=True)
+
+    # Leitura anônima de relato público: só depende da versão do relato
+    # (e da janela das signed URLs), então admite GET condicional
+    validators = None
+    if current_user is None:
+        replica_validator = get_public_relato_replica().relato_validator(relato_id)
+        if replica_validator is not None:
+            validators = build_validators(
+                "galeria_leitura",
+                relato_id,
+                intent,
+                replica_validator.version,
+                last_modified=replica_validator.last_modified,
+                signed_urls=True,
+            )
+
+    if validators is not None and is_not_modified(request, validators):
+        return not_modified_response(validators, cache_control=cache_control, vary="Authorization")
+
     db = get_firestore_client()
 
     eligibility_service = RelatoEligibilityService()
@@ -92,16 +127,21 @@ async def ler_relato(
     # ============================================================
     # 2️⃣ Carregar relato alvo
     # ============================================================
-    doc_ref = db.collection("relatos").document(relato_id)
-    doc_snap = doc_ref.get()
+    # Relatos públicos vêm da réplica em memória; o resto, do Firestore
+    relato = get_public_relato_replica().get_relato(relato_id)
 
-    if not doc_snap.exists:
-        raise HTTPException(
-            status_code=404,
-            detail="Relato no encontrado",
-        )
+    if relato is None:
+        doc_ref = db.collection("relatos").document(relato_id)
+        doc_snap = doc_ref.get()
+
+        if not doc_snap.exists:
+            raise HTTPException(
+                status_code=404,
+                detail="Relato no encontrado",
+            )
+
+        relato = doc_snap.to_dict()
 
-    relato = doc_snap.to_dict()
     relato = normalize_relato_document(relato)
 
     # ============================================================
@@ -153,18 +193,24 @@ async def ler_relato(
 
     if user_profile and relato_base:
 
+        # Sintomas e resposta terapêutica usam o mesmo Jaccard das tags:
+        # calculado uma vez, com o conjunto do relato-base já normalizado
+        tags_score = jaccard_from_sets(
+            relato_base.get("tags_normalizadas")
+            or normalize_tags(relato_base["tags_extraidas"]),
+            normalize_tags(relato.get("tags_extraidas") or []),
+        )
+
         partial_scores = {
-            SimilarityAxis.SYMPTOMS: jaccard_similarity(
-                relato_base["tags_extraidas"],
-                relato.get("tags_extraidas") or [],
-            ),
-            SimilarityAxis.THERAPY_RESPONSE: jaccard_similarity(
-                relato_base["tags_extraidas"],
-                relato.get("tags_extraidas") or [],
-            ),
-            SimilarityAxis.NARRATIVE_TONE: narrative_tone_similarity(
-                relato_base["excerpt"],
-                relato.get("public_excerpt", {}).get("text") or "",
+            SimilarityAxis.SYMPTOMS: tags_score,
+            SimilarityAxis.THERAPY_RESPONSE: tags_score,
+            SimilarityAxis.NARRATIVE_TONE: narrative_tone_similarity_from_features(
+                relato_base.get("tone_features")
+                or narrative_tone_features(relato_base["excerpt"]),
+                resolve_tone_features(
+                    get_public_relato_replica().card_tone_features([relato_id]).get(relato_id),
+                    relato["public_excerpt"].get("text"),
+                ),
             ),
         }
 
@@ -252,11 +298,16 @@ async def ler_relato(
     else:
         visible_images = image_refs
 
+    signed_urls = await asyncio.to_thread(
+        _storage.get_signed_urls,
+        [img.get("path") for img in visible_images],
+    )
+
     images = []
     for img in visible_images:
         images.append({
             "type": img.get("type"),
-            "url": _storage.get_signed_url(img.get("path")),
+            "url": signed_urls.get(img.get("path")),
         })
 
     # ============================================================
@@ -307,5 +358,10 @@ async def ler_relato(
     if expand_effect:
         response["ux_effects"].append(expand_effect)
 
+    if validators is not None:
+        apply_validators(http_response, validators, vary="Authorization")
+    if cache_control:
+        http_response.headers["Cache-Control"] = cache_control
+
     return response
 
@@ -26,6 +26,15 @@ from fastapi.responses import JSONResponse
 from app.archlog_sync.logger import registrar_log
 from app.core.logger import setup_logger
 from app.adapters.firebase_storage_adapter import FirebaseStorageAdapter
+from app.application.effects.result_sink import get_effect_result_sink
+from app.application.queries.public_relato_replica import get_public_relato_replica
+from app.application.queries.relato_base_cache import relato_base_cache
+from app.application.services.async_jobs import get_async_job_runner
+from app.application.services.background_workers import get_background_workers
+from app.auth.profile_cache import user_profile_cache
+from app.auth.token_cache import verified_token_cache
+from app.chroma.factory import db_factory
+from app.adapters.signed_url_cache import signed_url_cache
 
 # =============================================================================
 # Global state
@@ -107,6 +116,15 @@ async def full_healthcheck():
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "uptime_seconds": int(time.time() - APP_START_TIME),
         "services": services,
+        "effect_result_sink": get_effect_result_sink().stats(),
+        "background_workers": get_background_workers().stats(),
+        "async_jobs": get_async_job_runner().stats(),
+        "auth_token_cache": verified_token_cache.stats(),
+        "user_profile_cache": user_profile_cache.stats(),
+        "signed_url_cache": signed_url_cache.stats(),
+        "public_relato_replica": get_public_relato_replica().stats(),
+        "relato_base_cache": relato_base_cache.stats(),
+        "embeddings": db_factory.stats(),
     }
     
     status_code = status.HTTP_200_OK if all_ok else status.HTTP_503_SERVICE_UNAVAILABLE
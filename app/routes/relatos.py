@@ -5,11 +5,20 @@ Routes para relatos (depoimentos de tratamento de dermatite atpica).
 import logging
 import uuid
 from typing import Optional, List
-from fastapi import APIRouter, Depends, Form, File, Query, UploadFile, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, Form, File, Query, UploadFile, HTTPException, Request, Response, status, BackgroundTasks
 from app.auth.dependencies import get_current_user, get_optional_user
 from app.auth.schemas import User
 from app.ports.storage_port import StoragePort
 from app.adapters.firebase_storage_adapter import FirebaseStorageAdapter
+from app.adapters.signed_url_cache import signed_url_cache_control
+from app.application.queries.public_relato_replica import get_public_relato_replica
+from app.routes.conditional import (
+    NO_STORE_CACHE_CONTROL,
+    apply_validators,
+    build_validators,
+    is_not_modified,
+    not_modified_response,
+)
 from app.application.uploads.upload_images import salvar_uploads_e_retornar_refs
 from app.application.parsers.parse_payload import parse_payload_json
 
@@ -36,7 +45,7 @@ async def criar_e_enviar_relato(
     storage: StoragePort = Depends(get_storage_port),
     current_user=Depends(get_current_user),
 ):
-    from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
+    from app.infra.firestore.relato_repository_factory import get_relato_repository
     from app.infra.processing_adapter import CloudTasksProcessingAdapter
     from app.infra.event_adapter import DummyEventAdapter
     from app.application.effects.dispatcher import EffectDispatcher
@@ -81,7 +90,7 @@ async def criar_e_enviar_relato(
         "regioes_afetadas": regioes_afetadas,
     }
 
-    relato_repo = FirestoreRelatoRepository()
+    relato_repo = get_relato_repository()
     dispatcher = EffectDispatcher(
         relato_repo=relato_repo,
         processing_port=CloudTasksProcessingAdapter(),
@@ -121,13 +130,13 @@ async def submit_relato(
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
 ):
-    from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
+    from app.infra.firestore.relato_repository_factory import get_relato_repository
     from app.infra.processing_adapter import CloudTasksProcessingAdapter
     from app.infra.event_adapter import DummyEventAdapter
     from app.application.effects.dispatcher import EffectDispatcher
     from app.application.relatos.submit_relato_use_case import SubmitRelatoUseCase
 
-    relato_repo = FirestoreRelatoRepository()
+    relato_repo = get_relato_repository()
     processing_port = CloudTasksProcessingAdapter()
     event_port = DummyEventAdapter()
 
@@ -162,10 +171,10 @@ async def get_relato(
     current_user: User = Depends(get_current_user),
     tags=["Relatos"],
 ):
-    from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
+    from app.infra.firestore.relato_repository_factory import get_relato_repository
     from app.application.relatos.get_relato_use_case import GetRelatoUseCase
 
-    relato_repo = FirestoreRelatoRepository()
+    relato_repo = get_relato_repository()
     use_case = GetRelatoUseCase(relato_repo=relato_repo)
     
     relato = await use_case.execute(relato_id=relato_id, requesting_user=current_user)
@@ -230,13 +239,35 @@ async def list_pending_moderation(
 )
 async def get_imagens_relato(
     relato_id: str,
+    request: Request,
+    response: Response,
     storage: StoragePort = Depends(get_storage_port),
     current_user: Optional[User] = Depends(get_optional_user)
 ):
-    from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
+    # Relatos públicos têm versão na réplica: 304 sem ler o relato nem assinar URLs
+    validators = None
+    replica_validator = get_public_relato_replica().relato_validator(relato_id)
+    if replica_validator is not None:
+        validators = build_validators(
+            "relato_imagens",
+            relato_id,
+            replica_validator.version,
+            last_modified=replica_validator.last_modified,
+            signed_urls=True,
+        )
+        cache_control = signed_url_cache_control()
+    else:
+        # O use case não filtra visibilidade: sem a réplica confirmar que o
+        # relato é approved_public, as signed URLs não vão para cache compartilhado
+        cache_control = NO_STORE_CACHE_CONTROL
+
+    if validators is not None and is_not_modified(request, validators):
+        return not_modified_response(validators, cache_control=cache_control)
+
+    from app.infra.firestore.relato_repository_factory import get_relato_repository
     from app.application.relatos.get_relato_images_use_case import GetRelatoImagesUseCase
 
-    relato_repo = FirestoreRelatoRepository()
+    relato_repo = get_relato_repository()
     use_case = GetRelatoImagesUseCase(
         relato_repo=relato_repo,
         storage=storage
@@ -249,6 +280,11 @@ async def get_imagens_relato(
         include_private=include_private
     )
 
+    if validators is not None:
+        apply_validators(response, validators)
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
+
     return imagens
 
 
@@ -276,9 +312,9 @@ async def buscar_relatos_similares(
     current_user: User = Depends(get_current_user)
 ):
     from app.application.relatos.find_similar_relatos_use_case import FindSimilarRelatosUseCase
-    from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
+    from app.infra.firestore.relato_repository_factory import get_relato_repository
 
-    relato_repo = FirestoreRelatoRepository()
+    relato_repo = get_relato_repository()
     use_case = FindSimilarRelatosUseCase(relato_repo=relato_repo)
     similares = await use_case.execute(
         relato_id=relato_id,
@@ -296,14 +332,12 @@ async def gerar_conteudo_anonimizado(
     relato_id: str,
     current_user: User = Depends(get_current_user),
 ):
-    from app.infra.firestore.relato_repository_impl import (
-        FirestoreRelatoRepository,
-    )
+    from app.infra.firestore.relato_repository_factory import get_relato_repository
     from app.application.relatos.generate_anonymous_content_use_case import (
         GenerateAnonymousContentUseCase,
     )
 
-    relato_repo = FirestoreRelatoRepository()
+    relato_repo = get_relato_repository()
 
     use_case = GenerateAnonymousContentUseCase(
         relato_repo=relato_repo,
@@ -0,0 +1,108 @@
+"""
+Backfill idempotente dos sucessos legados em `effect_results`.
+
+- Regrava cada EffectResult SUCCESS com ID aleatório sob a chave
+  determinística (effect_idempotency_key) e remove o documento antigo
+- Se a chave já existir, só remove o documento legado (redundante)
+- Cópia e remoção vão no mesmo batch: ou as duas acontecem, ou nenhuma
+- Depois de executado, a consulta legada pode ficar desligada
+  (EFFECT_LEGACY_SUCCESS_LOOKUP=false, o padrão)
+
+Flags:
+--limit N
+--dry-run
+"""
+
+import argparse
+import os
+import sys
+
+# Adiciona o diretório raiz ao path para permitir imports da 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google.cloud.firestore import FieldFilter
+
+from app.application.effects.result import EffectStatus, effect_idempotency_key
+from app.firestore.client import get_firestore_client
+
+# ========= INIT =========
+
+db = get_firestore_client()
+collection = db.collection("effect_results")
+
+# Limite de operações por batch do Firestore (cada sucesso usa até duas)
+BATCH_SIZE = 400
+
+# ========= BATCH =========
+
+def _idempotency_key(data: dict) -> str | None:
+    effect_ref = (data.get("metadata") or {}).get("effect_ref", data.get("effect_ref"))
+    if effect_ref is None or not data.get("relato_id") or not data.get("effect_type"):
+        return None
+    return effect_idempotency_key(data["relato_id"], data["effect_type"], str(effect_ref))
+
+
+def run_backfill(limit: int | None, dry_run: bool):
+    query = collection.where(filter=FieldFilter("status", "==", EffectStatus.SUCCESS.value))
+    if limit:
+        query = query.limit(limit)
+
+    legacy = []
+    skipped = 0
+    for doc in query.stream():
+        key = _idempotency_key(doc.to_dict())
+        if key is None:
+            skipped += 1
+        elif key != doc.id:
+            legacy.append((doc, key))
+
+    print(f"Sucessos legados: {len(legacy)} | sem effect_ref: {skipped}")
+    if dry_run:
+        print("⚠️ DRY-RUN ATIVO: nenhuma alteração será feita.")
+        return
+    if not legacy:
+        return
+
+    existing = {
+        snapshot.id
+        for snapshot in db.get_all([collection.document(key) for _, key in legacy])
+        if snapshot.exists
+    }
+
+    rewritten = 0
+    removed = 0
+    errors = 0
+
+    for start in range(0, len(legacy), BATCH_SIZE):
+        chunk = legacy[start:start + BATCH_SIZE]
+        batch = db.batch()
+        written = set()
+        for doc, key in chunk:
+            if key not in existing and key not in written:
+                batch.set(collection.document(key), doc.to_dict())
+                written.add(key)
+            batch.delete(doc.reference)
+        try:
+            batch.commit()
+        except Exception as e:
+            print(f"[ERROR] batch {start // BATCH_SIZE}: {e}")
+            errors += len(chunk)
+            continue
+        existing |= written
+        rewritten += len(written)
+        removed += len(chunk)
+
+    print("\n===== RESUMO =====")
+    print(f"Regravados: {rewritten}")
+    print(f"Legados removidos: {removed}")
+    print(f"Erros:      {errors}")
+
+# ========= CLI =========
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, help="Limite de sucessos lidos")
+    parser.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    run_backfill(args.limit, args.dry_run)
@@ -0,0 +1,79 @@
+"""
+Backfill idempotente do read model `galeria_public_cards`.
+
+- Projeta o card de cada relato com public_visibility.status == approved_public
+- Remove cards órfãos (relato que saiu da galeria pública)
+- Pode ser executado a qualquer momento: a projeção sempre parte do estado atual
+
+Flags:
+--limit N
+--dry-run
+"""
+
+import argparse
+import os
+import sys
+
+# Adiciona o diretório raiz ao path para permitir imports da 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google.cloud.firestore import FieldFilter
+
+from app.application.queries.readmodels.galeria_card import (
+    GALERIA_CARDS_COLLECTION,
+    project_galeria_card,
+)
+from app.domain.relato.states import RelatoStatus
+from app.firestore.client import get_firestore_client
+
+# ========= INIT =========
+
+db = get_firestore_client()
+
+# ========= BATCH =========
+
+def run_backfill(limit: int | None, dry_run: bool):
+    query = db.collection("relatos").where(
+        filter=FieldFilter("public_visibility.status", "==", RelatoStatus.APPROVED_PUBLIC.value)
+    )
+    if limit:
+        query = query.limit(limit)
+
+    relato_ids = [doc.id for doc in query.stream()]
+    card_ids = [doc.id for doc in db.collection(GALERIA_CARDS_COLLECTION).select([]).stream()]
+    # Cards sem relato público correspondente também passam pela projeção (que os remove)
+    orphan_ids = [] if limit else sorted(set(card_ids) - set(relato_ids))
+
+    print(f"Relatos públicos: {len(relato_ids)} | cards possivelmente órfãos: {len(orphan_ids)}")
+    if dry_run:
+        print("⚠️ DRY-RUN ATIVO: nenhuma alteração será feita.")
+        return
+
+    projected = 0
+    removed = 0
+    errors = 0
+
+    for relato_id in relato_ids + orphan_ids:
+        try:
+            if project_galeria_card(relato_id, db=db):
+                projected += 1
+            else:
+                removed += 1
+        except Exception as e:
+            print(f"[ERROR] {relato_id}: {e}")
+            errors += 1
+
+    print("\n===== RESUMO =====")
+    print(f"Projetados: {projected}")
+    print(f"Removidos:  {removed}")
+    print(f"Erros:      {errors}")
+
+# ========= CLI =========
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, help="Limite de relatos")
+    parser.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    run_backfill(args.limit, args.dry_run)
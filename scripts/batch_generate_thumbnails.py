@@ -22,6 +22,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.firestore.client import get_firestore_client
 from app.adapters.firebase_storage_adapter import FirebaseStorageAdapter
+from app.application.queries.readmodels.galeria_card import refresh_galeria_card
 from PIL import Image, ImageOps
 
 # ========= CONFIG =========
@@ -125,6 +126,10 @@ def run_batch(limit: int | None, dry_run: bool):
                 "timestamps.updated_at": now_iso()
             })
 
+            # Thumbnail nova muda o card do relato na galeria pública
+            if data.get("relato_id"):
+                refresh_galeria_card(data["relato_id"])
+
             print(f"[DONE] thumbnail criada")
             processed += 1
 
@@ -0,0 +1,120 @@
+# scripts/bench_feed_queries.py
+"""
+Mede latência e número de chamadas ao Firestore de RelatoRepository.get_aprovados
+(feed admin): enrichment por relato ("por_relato") vs. em lote ("lote").
+
+Cada relato aprovado tem um enrichment em relato_enrichments. No modo
+"por_relato" cada relato busca o próprio enrichment (1 + N chamadas); no
+modo "lote" a página inteira usa um único get_all (2 chamadas).
+
+Uso (com o emulador do Firestore rodando):
+    FIREBASE_MODE=local FIRESTORE_EMULATOR_HOST=localhost:8080 \
+        python scripts/bench_feed_queries.py --relatos 100
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from google.cloud.firestore import FieldFilter  # noqa: E402
+from google.cloud.firestore_v1.client import Client  # noqa: E402
+from google.cloud.firestore_v1.query import Query  # noqa: E402
+
+from app.domain.relato.states import RelatoStatus  # noqa: E402
+from app.repositories.relato_repository import RelatoRepository  # noqa: E402
+
+_chamadas = {"total": 0}
+
+
+def _contar(fn):
+    def wrapper(*args, **kwargs):
+        _chamadas["total"] += 1
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def _em_lotes(repo: RelatoRepository, ids: list, escrever) -> None:
+    # WriteBatch aceita até 500 operações; cada relato usa 2
+    for inicio in range(0, len(ids), 200):
+        batch = repo.db.batch()
+        for relato_id in ids[inicio:inicio + 200]:
+            escrever(batch, relato_id)
+        batch.commit()
+
+
+def _popular(repo: RelatoRepository, total: int) -> list:
+    ids = [f"bench-feed-{uuid.uuid4().hex}" for _ in range(total)]
+
+    def escrever(batch, relato_id):
+        batch.set(repo.collection.document(relato_id), {
+            "status": RelatoStatus.APPROVED_PUBLIC.value,
+            "updated_at": datetime.now(timezone.utc),
+        })
+        batch.set(repo.enrichment_collection.document(relato_id), {
+            "relato_id": relato_id,
+            "data": {"sintomas": ["prurido"], "tratamentos_mencionados": ["hidratante"]},
+        })
+
+    _em_lotes(repo, ids, escrever)
+    return ids
+
+
+def _limpar(repo: RelatoRepository, ids: list) -> None:
+    def apagar(batch, relato_id):
+        batch.delete(repo.collection.document(relato_id))
+        batch.delete(repo.enrichment_collection.document(relato_id))
+
+    _em_lotes(repo, ids, apagar)
+
+
+def _por_relato(repo: RelatoRepository, limit: int) -> list:
+    # Caminho antigo: o enrichment de cada relato é buscado individualmente
+    query = (
+        repo.collection
+        .where(filter=FieldFilter("status", "==", RelatoStatus.APPROVED_PUBLIC.value))
+        .order_by("updated_at", direction="DESCENDING")
+        .limit(limit)
+    )
+    docs = list(query.stream())
+    return [repo._build_relato(doc) for doc in docs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--relatos", type=int, default=100)
+    parser.add_argument("--rodadas", type=int, default=10)
+    args = parser.parse_args()
+
+    repo = RelatoRepository()
+    ids = _popular(repo, args.relatos)
+
+    Query.stream = _contar(Query.stream)
+    Client.get_all = _contar(Client.get_all)
+
+    try:
+        modos = {
+            "por_relato": lambda: _por_relato(repo, args.relatos),
+            "lote": lambda: repo.get_aprovados(limit=args.relatos),
+        }
+        for nome, fn in modos.items():
+            duracoes = []
+            for _ in range(args.rodadas):
+                _chamadas["total"] = 0
+                inicio = time.perf_counter()
+                fn()
+                duracoes.append((time.perf_counter() - inicio) * 1000)
+            print(
+                f"{nome:>10}: chamadas={_chamadas['total']} "
+                f"p50={statistics.median(duracoes):.1f}ms max={max(duracoes):.1f}ms"
+            )
+    finally:
+        _limpar(repo, ids)
+
+
+if __name__ == "__main__":
+    main()
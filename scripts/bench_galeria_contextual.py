@@ -0,0 +1,159 @@
+# scripts/bench_galeria_contextual.py
+"""
+Mede a etapa de similaridade da galeria contextual (listar_galeria_contextual)
+com 1k e 10k candidatos, em memória (sem Firestore).
+
+- "por_candidato": caminho antigo — política e elegibilidade reconstruídas
+  por candidato, um SimilarityCalculator.calculate por par e sort completo;
+- "lote": rank_contextual_candidates — tags normalizadas uma vez, um único
+  calculate_many e seleção da página com heap.
+
+Uso:
+    python scripts/bench_galeria_contextual.py --candidatos 1000 10000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.application.queries.galeria_query import rank_contextual_candidates  # noqa: E402
+from app.domain.galeria.eligibility_service import RelatoEligibilityService  # noqa: E402
+from app.domain.galeria.similarity.axes import SimilarityAxis  # noqa: E402
+from app.domain.galeria.similarity.calculator import SimilarityCalculator  # noqa: E402
+from app.domain.galeria.similarity.policy import SIMILARITY_POLICY_V1  # noqa: E402
+from app.domain.galeria.similarity.scorers.narrative_tone import (  # noqa: E402
+    narrative_tone_features,
+    narrative_tone_similarity,
+)
+from app.domain.galeria.similarity.scorers.tags_overlap import jaccard_similarity  # noqa: E402
+from app.domain.galeria.user_profile import ExposureLevel, UserCognitiveProfile, UserRole  # noqa: E402
+from app.domain.galeria.visibility_policy import (  # noqa: E402
+    RelatoStatus,
+    RelatoVisibilityPolicy,
+    VisibilityConstraint,
+)
+
+TAGS = [f"sintoma_{index}" for index in range(40)]
+TEXTOS = [
+    "tive melhora depois de meses",
+    "ainda sem controle, muita coceira",
+    "resultado veio com a evolução do tratamento",
+    "alívio parcial",
+]
+LIMIT = 12
+
+USER = UserCognitiveProfile(
+    user_id="bench",
+    role=UserRole.USER,
+    relato_base_id="base",
+    exposure_level=ExposureLevel.EXPLORATORY,
+)
+
+
+def _candidatos(total: int) -> tuple:
+    rng = random.Random(total)
+    relatos = []
+    tones = {}
+    for index in range(total):
+        text = rng.choice(TEXTOS) * rng.randint(1, 4)
+        relatos.append((
+            f"relato-{index}",
+            {
+                "tags_extraidas": rng.sample(TAGS, rng.randint(2, 8)),
+                "public_excerpt": {"text": text},
+            },
+        ))
+        # como gravado pela projeção do card
+        tones[f"relato-{index}"] = narrative_tone_features(text)
+    return relatos, tones
+
+
+def _por_candidato(relato_base: dict, relatos: list) -> list:
+    eligibility_service = RelatoEligibilityService()
+    calculator = SimilarityCalculator()
+    scored = []
+
+    for relato_id, relato in relatos:
+        eligibility = eligibility_service.decide(
+            user=USER,
+            relato_policy=RelatoVisibilityPolicy(
+                status=RelatoStatus.APPROVED_PUBLIC,
+                constraints={VisibilityConstraint.REQUIRE_SIMILARITY},
+            ),
+        )
+        score = calculator.calculate(
+            partial_scores={
+                SimilarityAxis.SYMPTOMS: jaccard_similarity(
+                    relato_base["tags_extraidas"], relato["tags_extraidas"]
+                ),
+                SimilarityAxis.THERAPY_RESPONSE: jaccard_similarity(
+                    relato_base["tags_extraidas"], relato["tags_extraidas"]
+                ),
+                SimilarityAxis.NARRATIVE_TONE: narrative_tone_similarity(
+                    relato_base["excerpt"], relato["public_excerpt"]["text"]
+                ),
+            },
+            policy=SIMILARITY_POLICY_V1,
+        )
+        if score.total >= eligibility.min_similarity:
+            scored.append((relato_id, relato, score))
+
+    scored.sort(key=lambda item: item[2].total, reverse=True)
+    return scored[:LIMIT]
+
+
+def _lote(relato_base: dict, relatos: list, tones: dict) -> list:
+    eligibility = RelatoEligibilityService().decide(
+        user=USER,
+        relato_policy=RelatoVisibilityPolicy(
+            status=RelatoStatus.APPROVED_PUBLIC,
+            constraints={VisibilityConstraint.REQUIRE_SIMILARITY},
+        ),
+    )
+    return rank_contextual_candidates(
+        relato_base=relato_base,
+        relatos=relatos,
+        min_similarity=eligibility.min_similarity,
+        limit=LIMIT,
+        tone_features=tones,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidatos", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--rodadas", type=int, default=5)
+    args = parser.parse_args()
+
+    relato_base = {
+        "id": "base",
+        "tags_extraidas": TAGS[:6],
+        "excerpt": "tive melhora e controle depois de meses",
+    }
+
+    for total in args.candidatos:
+        relatos, tones = _candidatos(total)
+        esperado = _por_candidato(relato_base, relatos)
+        assert _lote(relato_base, relatos, tones) == esperado, "resultados divergentes"
+
+        for nome, fn in (
+            ("por_candidato", lambda: _por_candidato(relato_base, relatos)),
+            ("lote", lambda: _lote(relato_base, relatos, tones)),
+        ):
+            duracoes = []
+            for _ in range(args.rodadas):
+                inicio = time.perf_counter()
+                fn()
+                duracoes.append((time.perf_counter() - inicio) * 1000)
+            print(
+                f"{total:>6} candidatos {nome:>13}: "
+                f"p50={statistics.median(duracoes):.1f}ms max={max(duracoes):.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# scripts/bench_relato_repository_loop.py
+"""
+Mede quanto tempo o event loop fica bloqueado pelas implementações de
+RelatoRepositoryPort ("sync" vs "async") sob leituras/escritas concorrentes.
+
+Um "heartbeat" acorda a cada INTERVALO segundos; todo atraso acima do
+intervalo esperado é tempo em que o loop não conseguiu atender outras
+requisições.
+
+Uso (com o emulador do Firestore rodando):
+    FIREBASE_MODE=local FIRESTORE_EMULATOR_HOST=localhost:8080 \
+        python scripts/bench_relato_repository_loop.py --requests 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.domain.relato.states import RelatoStatus  # noqa: E402
+from app.infra.firestore.relato_repository_factory import get_relato_repository  # noqa: E402
+
+INTERVALO = 0.005
+
+
+async def _heartbeat(stop: asyncio.Event, atrasos: list):
+    while not stop.is_set():
+        inicio = time.perf_counter()
+        await asyncio.sleep(INTERVALO)
+        atrasos.append(max(0.0, time.perf_counter() - inicio - INTERVALO))
+
+
+async def _rodar(backend: str, total: int, concorrencia: int) -> dict:
+    repo = get_relato_repository(backend)
+    ids = [f"bench-{uuid.uuid4().hex}" for _ in range(total)]
+    sem = asyncio.Semaphore(concorrencia)
+
+    async def _uma(relato_id: str):
+        async with sem:
+            await repo.save(relato_id, {"owner_id": "bench", "status": RelatoStatus.CREATED})
+            await repo.get_by_id(relato_id)
+            await repo.update_status(relato_id, RelatoStatus.PROCESSING)
+
+    stop = asyncio.Event()
+    atrasos: list = []
+    hb = asyncio.create_task(_heartbeat(stop, atrasos))
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_uma(i) for i in ids))
+    duracao = time.perf_counter() - inicio
+
+    stop.set()
+    await hb
+
+    return {
+        "backend": backend,
+        "duracao_s": duracao,
+        "loop_bloqueado_s": sum(atrasos),
+        "maior_bloqueio_ms": max(atrasos, default=0.0) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concorrencia", type=int, default=20)
+    args = parser.parse_args()
+
+    for backend in ("sync", "async"):
+        r = asyncio.run(_rodar(backend, args.requests, args.concorrencia))
+        print(
+            f"{r['backend']:>5}: total={r['duracao_s']:.2f}s "
+            f"loop bloqueado={r['loop_bloqueado_s']:.2f}s "
+            f"maior bloqueio={r['maior_bloqueio_ms']:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import storage as gcs_storage
+from google.oauth2 import service_account
+
+from app.adapters.firebase_storage_adapter import FirebaseStorageAdapter
+from app.adapters.signed_url_cache import (
+    SignedUrlCache,
+    expiry_window,
+    signed_url_cache,
+    signed_url_cache_control,
+)
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self._bucket = bucket
+        self.name = name
+
+    def generate_signed_url(self, **_kwargs):
+        with self._bucket.lock:
+            self._bucket.signatures += 1
+        return f"https://signed/{self.name}?sig={self._bucket.signatures}"
+
+
+class FakeBucket:
+    name = "fake-bucket"
+
+    def __init__(self):
+        self.signatures = 0
+        self.lock = threading.Lock()
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    monkeypatch.delenv("FIREBASE_STORAGE_EMULATOR_HOST", raising=False)
+    # FakeBlob só implementa generate_signed_url (assinatura sem janela)
+    monkeypatch.setattr("app.adapters.signed_url_cache.SIGNED_URL_EXPIRY_WINDOW_SECONDS", 0)
+    signed_url_cache.clear()
+    adapter = FirebaseStorageAdapter()
+    adapter._bucket_instance = FakeBucket()
+    yield adapter
+    signed_url_cache.clear()
+
+
+def test_repeat_signing_is_served_from_cache(adapter):
+    first = adapter._get_signed_url_sync("relatos/r1/thumb.jpg")
+    second = adapter._get_signed_url_sync("/relatos/r1/thumb.jpg")
+
+    assert first == second
+    assert adapter._bucket_instance.signatures == 1
+
+
+def test_bulk_signing_signs_only_misses(adapter):
+    adapter._get_signed_url_sync("relatos/r1/thumb.jpg")
+    paths = [f"relatos/r{index}/thumb.jpg" for index in range(1, 25)]
+
+    urls = adapter._get_signed_urls_sync(paths + ["relatos/r2/thumb.jpg", None])
+
+    assert set(urls) == set(paths)
+    assert all(urls.values())
+    assert adapter._bucket_instance.signatures == 24
+
+    adapter._get_signed_urls_sync(paths)
+    assert adapter._bucket_instance.signatures == 24
+
+
+def test_entries_stop_being_served_inside_safety_margin(monkeypatch):
+    cache = SignedUrlCache(max_size=10, safety_margin_seconds=300)
+    now = 1_000_000.0
+    monkeypatch.setattr("app.adapters.signed_url_cache.time.time", lambda: now)
+    key = ("bucket", "path", 3600, 0)
+    cache.put(key, "https://signed/path", expires_at=now + 3600)
+
+    assert cache.get(key) == "https://signed/path"
+
+    monkeypatch.setattr("app.adapters.signed_url_cache.time.time", lambda: now + 3301)
+    assert cache.get(key) is None
+
+
+def _service_account_credentials():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    return service_account.Credentials.from_service_account_info({
+        "type": "service_account",
+        "client_email": "signer@test-project.iam.gserviceaccount.com",
+        "private_key": pem,
+        "token_uri": "https://oauth2.googleapis.com/token",
+    })
+
+
+@pytest.fixture
+def windowed_adapters(monkeypatch):
+    monkeypatch.delenv("FIREBASE_STORAGE_EMULATOR_HOST", raising=False)
+    monkeypatch.setattr("app.adapters.signed_url_cache.SIGNED_URL_EXPIRY_WINDOW_SECONDS", 3600)
+    signed_url_cache.clear()
+
+    client = gcs_storage.Client(project="test-project", credentials=AnonymousCredentials())
+    client._credentials = _service_account_credentials()
+
+    adapters = []
+    for _ in range(2):
+        adapter = FirebaseStorageAdapter()
+        adapter._bucket_instance = client.bucket("fake-bucket")
+        adapters.append(adapter)
+    yield adapters
+    signed_url_cache.clear()
+
+
+def test_same_window_yields_byte_identical_urls(windowed_adapters, monkeypatch):
+    first, second = windowed_adapters
+    window_start = 490_000 * 3600
+
+    monkeypatch.setattr("app.adapters.signed_url_cache.time.time", lambda: window_start + 10)
+    url_a = first._get_signed_url_sync("relatos/r1/thumb.jpg")
+
+    # outra "instância": sem cache, mais tarde na mesma janela
+    signed_url_cache.clear()
+    monkeypatch.setattr("app.adapters.signed_url_cache.time.time", lambda: window_start + 3000)
+    url_b = second._get_signed_url_sync("relatos/r1/thumb.jpg")
+
+    assert url_a == url_b
+    query = parse_qs(urlparse(url_a).query)
+    assert query["X-Goog-Date"] == ["20251124T160000Z"]
+    assert query["X-Goog-Expires"] == ["7200"]
+
+    signed_url_cache.clear()
+    monkeypatch.setattr("app.adapters.signed_url_cache.time.time", lambda: window_start + 3600)
+    assert second._get_signed_url_sync("relatos/r1/thumb.jpg") != url_a
+
+
+def test_cache_control_follows_window(monkeypatch):
+    monkeypatch.setattr("app.adapters.signed_url_cache.SIGNED_URL_EXPIRY_WINDOW_SECONDS", 3600)
+    monkeypatch.setattr("app.adapters.signed_url_cache.SIGNED_URL_RESPONSE_MAX_AGE_SECONDS", 300)
+
+    assert expiry_window(7300) == (7200, 10800)
+    assert signed_url_cache_control(now=7300) == "public, max-age=300"
+    assert signed_url_cache_control(private=True, now=10700) == "private, max-age=100"
+
+    monkeypatch.setattr("app.adapters.signed_url_cache.SIGNED_URL_EXPIRY_WINDOW_SECONDS", 0)
+    assert signed_url_cache_control(now=7300) is None
@@ -68,3 +68,35 @@ async def test_dispatcher_persists_effect_result_for_success(monkeypatch):
     assert persisted_results[0].relato_id == "relato-123"
     assert persisted_results[0].effect_type == "PERSIST_RELATO"
     assert persisted_results[0].metadata["effect_ref"] == "relato-123"
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_records_backpressure_and_keeps_going(monkeypatch):
+    from app.application.effects.build_result import build_effect_result
+    from app.application.effects.result import EffectStatus
+    from app.domain.relato.effects.emit_event import EmitDomainEventEffect
+    from app.domain.relato.effects.enqueue import EnqueueProcessingEffect
+    from app.ports.processing_port import ProcessingBackpressureError
+
+    monkeypatch.setattr(
+        "app.application.effects.dispatcher.record_effect_result",
+        build_effect_result,
+    )
+
+    processing_port = FakeProcessingPort()
+    processing_port.enqueue_relato_processing.side_effect = ProcessingBackpressureError("Fila cheia")
+    event_port = FakeEventPort()
+    dispatcher = EffectDispatcher(
+        relato_repo=FakeRelatoRepository(),
+        processing_port=processing_port,
+        event_port=event_port,
+    )
+
+    effect_results = await dispatcher.dispatch([
+        EnqueueProcessingEffect(relato_id="relato-123"),
+        EmitDomainEventEffect(relato_id="relato-123", event_name="relato_submitted", payload={}),
+    ])
+
+    assert [r.status for r in effect_results] == [EffectStatus.RETRYING, EffectStatus.SUCCESS]
+    assert effect_results[0].effect_type == "ENQUEUE_PROCESSING"
+    event_port.emit.assert_awaited_once()
@@ -0,0 +1,142 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.effects.dispatcher import EffectDispatcher
+from app.application.effects.plan import compile_effect_plan
+from app.application.effects.result import EffectResult
+from app.domain.relato.effects.emit_event import EmitDomainEventEffect
+from app.domain.relato.effects.enqueue import EnqueueProcessingEffect
+from app.domain.relato.effects.persist import PersistRelatoEffect
+from app.domain.relato.effects.update_status import UpdateRelatoStatusEffect
+from app.domain.relato.effects.upload import PersistImageRefsEffect
+from app.domain.relato.states import RelatoStatus
+
+IMAGE_REFS = {"antes": ["img-1"], "durante": [], "depois": []}
+
+
+def _persist(relato_id="relato-123"):
+    return PersistRelatoEffect(
+        relato_id=relato_id,
+        owner_id="user-123",
+        status=RelatoStatus.CREATED,
+        conteudo="Meu relato",
+        metadados={},
+        image_refs={"antes": [], "durante": [], "depois": []},
+    )
+
+
+def test_create_flow_coalesces_persist_and_image_refs():
+    effects = [
+        _persist(),
+        PersistImageRefsEffect(relato_id="relato-123", image_refs=IMAGE_REFS),
+        EmitDomainEventEffect(relato_id="relato-123", event_name="relato_created"),
+    ]
+
+    steps = compile_effect_plan(effects)
+
+    assert len(steps) == 2
+    assert steps[0].coalesced
+    assert steps[0].effects == tuple(effects[:2])
+    assert steps[0].document_data["image_refs"] == IMAGE_REFS
+    assert not steps[1].coalesced
+
+
+def test_plan_does_not_reorder_across_non_write_effects():
+    effects = [
+        _persist(),
+        EnqueueProcessingEffect(relato_id="relato-123"),
+        UpdateRelatoStatusEffect(relato_id="relato-123", new_status=RelatoStatus.PROCESSING),
+    ]
+
+    steps = compile_effect_plan(effects)
+
+    assert [len(step.effects) for step in steps] == [1, 1, 1]
+    assert not any(step.coalesced for step in steps)
+
+
+def test_plan_does_not_merge_writes_to_other_documents():
+    effects = [
+        _persist("relato-a"),
+        PersistImageRefsEffect(relato_id="relato-b", image_refs=IMAGE_REFS),
+    ]
+
+    steps = compile_effect_plan(effects)
+
+    assert len(steps) == 2
+
+
+def test_status_update_after_persist_is_folded_into_save():
+    effects = [
+        _persist(),
+        UpdateRelatoStatusEffect(relato_id="relato-123", new_status=RelatoStatus.PROCESSING),
+    ]
+
+    steps = compile_effect_plan(effects)
+
+    assert len(steps) == 1
+    assert steps[0].document_data["status"] == RelatoStatus.PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_runs_coalesced_write_once_and_reports_each_effect(monkeypatch):
+    monkeypatch.setattr(
+        "app.application.effects.dispatcher.record_effect_result",
+        lambda **kwargs: EffectResult.success(
+            relato_id=kwargs["relato_id"],
+            effect_type=kwargs["effect_type"],
+        ),
+    )
+
+    relato_repo = AsyncMock()
+    event_port = AsyncMock()
+    dispatcher = EffectDispatcher(
+        relato_repo=relato_repo,
+        processing_port=AsyncMock(),
+        event_port=event_port,
+    )
+
+    results = await dispatcher.dispatch([
+        _persist(),
+        PersistImageRefsEffect(relato_id="relato-123", image_refs=IMAGE_REFS),
+        EmitDomainEventEffect(relato_id="relato-123", event_name="relato_created"),
+    ])
+
+    relato_repo.save.assert_awaited_once()
+    assert relato_repo.save.await_args.kwargs["data"]["image_refs"] == IMAGE_REFS
+    relato_repo.save_image_refs.assert_not_awaited()
+    event_port.emit.assert_awaited_once()
+    assert [r.effect_type for r in results] == ["PERSIST_RELATO", "PERSIST_IMAGE_REFS", "EMIT_EVENT"]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_reports_error_for_every_effect_of_failed_step(monkeypatch):
+    recorded = []
+
+    def fake_record_effect_result(**kwargs):
+        recorded.append(kwargs)
+        return None
+
+    monkeypatch.setattr(
+        "app.application.effects.dispatcher.record_effect_result",
+        fake_record_effect_result,
+    )
+
+    relato_repo = AsyncMock()
+    relato_repo.save.side_effect = RuntimeError("firestore indisponível")
+    dispatcher = EffectDispatcher(
+        relato_repo=relato_repo,
+        processing_port=AsyncMock(),
+        event_port=AsyncMock(),
+    )
+
+    with pytest.raises(RuntimeError):
+        await dispatcher.dispatch([
+            _persist(),
+            PersistImageRefsEffect(relato_id="relato-123", image_refs=IMAGE_REFS),
+        ])
+
+    assert [(r["effect_type"], r["success"]) for r in recorded] == [
+        ("PERSIST_RELATO", False),
+        ("PERSIST_IMAGE_REFS", False),
+    ]
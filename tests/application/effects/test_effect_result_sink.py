@@ -0,0 +1,167 @@
+import threading
+
+from app.application.effects import idempotency
+from app.application.effects.result import EffectResult, effect_idempotency_key
+from app.application.effects.result_sink import EffectResultSink
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self._db = db
+        self._ops = []
+
+    def set(self, doc_ref, data):
+        self._ops.append((doc_ref, data))
+
+    def commit(self):
+        self._db.gate.wait(timeout=5)
+        if self._db.fail:
+            raise RuntimeError("firestore indisponível")
+        self._db.commits.append(list(self._ops))
+
+
+class FakeCollection:
+    def document(self, doc_id):
+        return doc_id
+
+
+class FakeFirestore:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.commits = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def collection(self, _name):
+        return FakeCollection()
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+def _result(i=0):
+    return EffectResult.success(
+        relato_id=f"relato-{i}",
+        effect_type="PERSIST_RELATO",
+        metadata={"effect_ref": f"relato-{i}"},
+    )
+
+
+def _sink(db, **kwargs):
+    params = {
+        "max_queue_size": 100,
+        "batch_size": 500,
+        "flush_interval_seconds": 60,
+        "put_timeout_seconds": 0.01,
+    }
+    params.update(kwargs)
+    return EffectResultSink(db_factory=lambda: db, **params)
+
+
+def test_flush_writes_queued_results_in_a_single_batch():
+    db = FakeFirestore()
+    sink = _sink(db)
+
+    for i in range(3):
+        assert sink.submit(_result(i)) is True
+
+    assert sink.flush(timeout=2) is True
+
+    assert len(db.commits) == 1
+    assert [data["relato_id"] for _, data in db.commits[0]] == ["relato-0", "relato-1", "relato-2"]
+    stats = sink.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["flushed"] == 3
+    assert stats["flush_count"] == 1
+    sink.shutdown()
+
+
+def test_batches_are_split_by_batch_size():
+    db = FakeFirestore()
+    db.gate.clear()
+    sink = _sink(db, batch_size=2)
+
+    for i in range(5):
+        sink.submit(_result(i))
+    db.gate.set()
+
+    assert sink.flush(timeout=2) is True
+    assert sorted(len(ops) for ops in db.commits) == [1, 2, 2]
+    sink.shutdown()
+
+
+def test_full_queue_applies_backpressure_then_drops():
+    db = FakeFirestore()
+    db.gate.clear()
+    sink = _sink(db, max_queue_size=2, batch_size=1)
+
+    # o primeiro item fica preso no commit; os dois seguintes enchem a fila
+    sink.submit(_result(0))
+    sink.flush(timeout=0.2)
+    assert sink.submit(_result(1)) is True
+    assert sink.submit(_result(2)) is True
+
+    assert sink.submit(_result(3)) is False
+    assert sink.stats()["dropped"] == 1
+
+    db.gate.set()
+    sink.shutdown()
+    assert sink.stats()["flushed"] == 3
+
+
+def test_shutdown_drains_pending_results():
+    db = FakeFirestore()
+    sink = _sink(db)
+
+    for i in range(4):
+        sink.submit(_result(i))
+    sink.shutdown()
+
+    assert sum(len(ops) for ops in db.commits) == 4
+    assert sink.submit(_result(99)) is False
+
+
+def test_commit_failure_is_counted_and_never_raises():
+    db = FakeFirestore(fail=True)
+    sink = _sink(db)
+
+    sink.submit(_result())
+    sink.flush(timeout=2)
+
+    stats = sink.stats()
+    assert stats["failed"] == 1
+    assert stats["flushed"] == 0
+    sink.shutdown()
+
+
+def _known(i=0):
+    key = effect_idempotency_key(f"relato-{i}", "PERSIST_RELATO", f"relato-{i}")
+    return key in idempotency._known_successes
+
+
+def test_success_is_remembered_only_after_commit():
+    idempotency._known_successes.clear()
+    db = FakeFirestore()
+    db.gate.clear()
+    sink = _sink(db)
+
+    sink.submit(_result(0))
+    assert not _known(0)
+
+    db.gate.set()
+    assert sink.flush(timeout=2) is True
+    assert _known(0)
+    sink.shutdown()
+    idempotency._known_successes.clear()
+
+
+def test_failed_commit_does_not_remember_success():
+    idempotency._known_successes.clear()
+    db = FakeFirestore(fail=True)
+    sink = _sink(db)
+
+    sink.submit(_result(0))
+    sink.flush(timeout=2)
+
+    assert not _known(0)
+    sink.shutdown()
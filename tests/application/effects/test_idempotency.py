@@ -0,0 +1,216 @@
+import pytest
+
+from app.application.effects import fetch_firestore, idempotency
+from app.application.effects.persist_firestore import effect_result_doc_id
+from app.application.effects.relato_executor import RelatoEffectExecutor
+from app.application.effects.result import EffectResult, effect_idempotency_key
+from app.domain.relato.effects import EmitDomainEventEffect, UpdateRelatoStatusEffect
+from app.domain.relato.states import RelatoStatus
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeDocRef:
+    def __init__(self, db, doc_id):
+        self._db = db
+        self.id = doc_id
+
+    def get(self):
+        self._db.gets += 1
+        return FakeSnapshot(self.id, self._db.docs.get(self.id))
+
+
+class FakeQuery:
+    def __init__(self, db, filters):
+        self._db = db
+        self._filters = filters
+        self._limit = None
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def stream(self):
+        self._db.queries += 1
+        matches = [
+            FakeSnapshot(doc_id, data)
+            for doc_id, data in self._db.docs.items()
+            if all(data.get(f.field_path) == f.value for f in self._filters)
+        ]
+        self._db.limits.append(self._limit)
+        return iter(matches[:self._limit])
+
+
+class FakeCollection:
+    def __init__(self, db):
+        self._db = db
+
+    def document(self, doc_id):
+        return FakeDocRef(self._db, doc_id)
+
+    def where(self, *, filter):
+        return FakeQuery(self._db, filter.filters)
+
+
+class FakeFirestore:
+    def __init__(self, docs=None):
+        self.docs = docs or {}
+        self.gets = 0
+        self.get_all_calls = 0
+        self.queries = 0
+        self.limits = []
+
+    def collection(self, _name):
+        return FakeCollection(self)
+
+    def get_all(self, refs):
+        self.get_all_calls += 1
+        return [FakeSnapshot(ref.id, self.docs.get(ref.id)) for ref in refs]
+
+
+def _success_doc(relato_id, effect_type, effect_ref):
+    return {
+        "relato_id": relato_id,
+        "effect_type": effect_type,
+        "status": "success",
+        "metadata": {"effect_ref": effect_ref},
+    }
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeFirestore()
+    monkeypatch.setattr(
+        "app.application.effects.fetch_firestore.get_firestore_client",
+        lambda: db,
+    )
+    idempotency._known_successes.clear()
+    yield db
+    idempotency._known_successes.clear()
+
+
+def test_success_results_use_deterministic_doc_id():
+    result = EffectResult.success(
+        relato_id="relato-1",
+        effect_type="UPDATE_STATUS",
+        metadata={"effect_ref": "public"},
+    )
+
+    assert effect_result_doc_id(result) == effect_idempotency_key("relato-1", "UPDATE_STATUS", "public")
+    assert effect_result_doc_id(result) == effect_result_doc_id(result)
+
+
+def test_error_results_keep_append_only_ids():
+    result = EffectResult.error(
+        relato_id="relato-1",
+        effect_type="UPDATE_STATUS",
+        error_message="boom",
+        metadata={"effect_ref": "public"},
+    )
+
+    assert effect_result_doc_id(result) != effect_result_doc_id(result)
+
+
+def test_effect_already_succeeded_is_a_point_lookup_cached_in_lru(fake_db):
+    key = effect_idempotency_key("relato-1", "UPDATE_STATUS", "public")
+    fake_db.docs[key] = _success_doc("relato-1", "UPDATE_STATUS", "public")
+
+    kwargs = {"relato_id": "relato-1", "effect_type": "UPDATE_STATUS", "effect_ref": "public"}
+    assert idempotency.effect_already_succeeded(**kwargs) is True
+    assert idempotency.effect_already_succeeded(**kwargs) is True
+
+    assert fake_db.gets == 1
+
+
+def test_prefetch_resolves_whole_list_with_one_batched_read(fake_db):
+    done = ("relato-1", "UPDATE_STATUS", "public")
+    pending = ("relato-1", "EMIT_EVENT", "relato_approved")
+    fake_db.docs[effect_idempotency_key(*done)] = _success_doc(*done)
+
+    known = idempotency.prefetch_effect_successes([done, pending])
+
+    assert known == {done: True, pending: False}
+    assert fake_db.get_all_calls == 1
+    assert fake_db.gets == 0
+
+
+def test_executor_skips_prefetched_successes_without_per_effect_reads(fake_db, monkeypatch):
+    monkeypatch.setattr(
+        "app.application.effects.relato_executor.persist_effect_result_firestore",
+        lambda _result: None,
+    )
+    done = ("relato-1", "UPDATE_STATUS", RelatoStatus.APPROVED_PUBLIC.value)
+    fake_db.docs[effect_idempotency_key(*done)] = _success_doc(*done)
+
+    status_calls = []
+    emitted = []
+    executor = RelatoEffectExecutor(
+        persist_relato=lambda **_: None,
+        enqueue_processing=lambda *_: None,
+        emit_event=lambda *args, **kwargs: emitted.append(kwargs or args),
+        upload_images=lambda *_: None,
+        update_relato_status=lambda *args, **kwargs: status_calls.append(kwargs or args),
+    )
+
+    executor.execute([
+        UpdateRelatoStatusEffect(relato_id="relato-1", new_status=RelatoStatus.APPROVED_PUBLIC),
+        EmitDomainEventEffect(relato_id="relato-1", event_name="relato_approved"),
+    ])
+
+    assert status_calls == []
+    assert len(emitted) == 1
+    assert fake_db.get_all_calls == 1
+    assert fake_db.gets == 0
+
+
+def test_legacy_lookup_is_disabled_by_default(fake_db):
+    fake_db.docs["legacy-random-id"] = _success_doc("relato-1", "UPDATE_STATUS", "public")
+
+    assert idempotency.effect_already_succeeded(
+        relato_id="relato-1", effect_type="UPDATE_STATUS", effect_ref="public"
+    ) is False
+    assert fake_db.queries == 0
+
+
+def test_legacy_success_with_random_id_is_still_found(fake_db, monkeypatch):
+    monkeypatch.setattr(fetch_firestore, "EFFECT_LEGACY_SUCCESS_LOOKUP", True)
+    fake_db.docs["legacy-random-id"] = _success_doc("relato-1", "UPDATE_STATUS", "public")
+
+    assert idempotency.effect_already_succeeded(
+        relato_id="relato-1", effect_type="UPDATE_STATUS", effect_ref="public"
+    ) is True
+    assert idempotency.effect_already_succeeded(
+        relato_id="relato-1", effect_type="UPDATE_STATUS", effect_ref="private"
+    ) is False
+
+
+def test_prefetch_falls_back_to_one_legacy_query_per_relato(fake_db, monkeypatch):
+    monkeypatch.setattr(fetch_firestore, "EFFECT_LEGACY_SUCCESS_LOOKUP", True)
+    monkeypatch.setattr(fetch_firestore, "EFFECT_LEGACY_SUCCESS_LOOKUP_LIMIT", 50)
+    done = ("relato-1", "UPDATE_STATUS", "public")
+    pending = ("relato-1", "EMIT_EVENT", "relato_approved")
+    fake_db.docs["legacy-random-id"] = _success_doc(*done)
+
+    known = idempotency.prefetch_effect_successes([done, pending])
+
+    assert known == {done: True, pending: False}
+    assert fake_db.get_all_calls == 1
+    assert fake_db.queries == 1
+    assert fake_db.limits == [50]
+
+
+def test_legacy_lookup_can_be_disabled(fake_db, monkeypatch):
+    monkeypatch.setattr(fetch_firestore, "EFFECT_LEGACY_SUCCESS_LOOKUP", False)
+    done = ("relato-1", "UPDATE_STATUS", "public")
+    fake_db.docs["legacy-random-id"] = _success_doc(*done)
+
+    assert idempotency.prefetch_effect_successes([done]) == {done: False}
+    assert fake_db.queries == 0
@@ -0,0 +1,52 @@
+from app.application.queries.feed_candidate_index import (
+    FeedCandidateIndex,
+    faixa_etaria_de,
+    feed_index_keys,
+)
+
+
+def _index(relatos):
+    index = FeedCandidateIndex()
+    for recency, (relato_id, relato) in enumerate(relatos.items()):
+        index.upsert(relato_id, feed_index_keys(relato), recency)
+    return index
+
+
+RELATOS = {
+    "antigo": {"regioes_afetadas": ["rosto"], "enrichment": {"idade": "34"}, "sintomas": ["prurido"]},
+    "so_regiao": {"regioes_afetadas": ["rosto"], "enrichment": {"idade": "70"}},
+    "so_idade": {"regioes_afetadas": ["pernas"], "metadados": {"idade": 30}},
+    "nada": {"regioes_afetadas": ["costas"], "enrichment": {"idade": "abc"}},
+}
+
+
+def test_keys_follow_feed_normalization():
+    assert feed_index_keys(RELATOS["antigo"]) == (frozenset({"rosto"}), "18-39", frozenset({"prurido"}))
+    assert feed_index_keys({"tags": ["eczema"], "enrichment": {"regioes_afetadas": ["maos"]}}) == (
+        frozenset({"maos"}),
+        None,
+        frozenset({"eczema"}),
+    )
+    assert faixa_etaria_de(None) is None
+
+
+def test_candidates_are_ranked_by_match_weight_then_recency():
+    index = _index(RELATOS)
+
+    result = index.candidates(regioes=["rosto"], faixa_etaria="18-39", sintomas=["prurido"], limit=10)
+
+    # o relato mais antigo é o que mais casa com o perfil
+    assert result == ["antigo", "so_regiao", "so_idade"]
+    assert index.candidates(regioes=["rosto"], faixa_etaria=None, sintomas=[], limit=1) == ["so_regiao"]
+
+
+def test_upsert_and_remove_update_postings_incrementally():
+    index = _index(RELATOS)
+
+    index.upsert("nada", feed_index_keys({"regioes_afetadas": ["rosto"]}), 99)
+    assert index.candidates(regioes=["rosto"], limit=1) == ["nada"]
+
+    index.remove("nada")
+    index.remove("so_regiao")
+    assert index.candidates(regioes=["rosto"], limit=10) == ["antigo"]
+    assert index.stats()["regioes"] == 2
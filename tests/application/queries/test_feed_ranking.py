@@ -0,0 +1,76 @@
+import random
+from datetime import datetime, timezone
+
+from app.application.queries.feed_ranking import FeedRankingPolicy, top_k_by_score
+from app.auth.schemas import User
+from app.schema.relato import RelatoFullOutput
+
+REGIOES = ["rosto", "bracos", "pernas", "costas", "maos", "couro_cabeludo"]
+IDADES = [None, "", "abc", "18", "25", "30", "34", "41", "60"]
+
+
+def _relato(relato_id, regioes, idade):
+    return RelatoFullOutput(
+        id=relato_id,
+        owner_id="owner",
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        conteudo_original="texto",
+        idade=idade,
+        image_refs={},
+        regioes_afetadas=regioes,
+        status="approved_public",
+    )
+
+
+def _pool(size, seed=7):
+    rng = random.Random(seed)
+    return [
+        _relato(f"r{index}", rng.sample(REGIOES, rng.randint(0, 3)), rng.choice(IDADES))
+        for index in range(size)
+    ]
+
+
+def _user(**overrides):
+    data = {"id": "usr_1", "firebase_uid": "uid", "idade_aprox": 32, "principais_areas_pele": ["rosto", "maos"]}
+    data.update(overrides)
+    return User(**data)
+
+
+def _score_by_item(policy, user, relato):
+    # heuristica original, relato a relato
+    score = 0.0
+    if set(user.principais_areas_pele or []).intersection(relato.regioes_afetadas or []):
+        score += 0.6
+    if user.idade_aprox and relato.idade:
+        try:
+            if abs(user.idade_aprox - int(relato.idade)) <= 5:
+                score += 0.3
+        except (TypeError, ValueError):
+            pass
+    return score + 0.1
+
+
+def test_batch_scores_match_the_per_relato_heuristic():
+    policy = FeedRankingPolicy()
+    relatos = _pool(200)
+
+    for user in [_user(), _user(idade_aprox=None), _user(principais_areas_pele=["inexistente"])]:
+        scores = policy.score_batch(user, policy.prepare(relatos))
+
+        assert scores == [_score_by_item(policy, user, relato) for relato in relatos]
+        assert [policy.score(user, relato) for relato in relatos] == scores
+
+
+def test_top_k_matches_a_stable_full_sort():
+    policy = FeedRankingPolicy()
+    user = _user()
+    relatos = _pool(500)
+
+    expected = sorted(relatos, key=lambda relato: policy.score(user, relato), reverse=True)
+
+    for k in [0, 1, 10, 80, 600]:
+        assert policy.top_k(user, relatos, k) == expected[:k]
+
+
+def test_top_k_by_score_keeps_original_order_on_ties():
+    assert top_k_by_score(["a", "b", "c", "d"], [0.1, 0.7, 0.1, 0.7], 3) == ["b", "d", "a"]
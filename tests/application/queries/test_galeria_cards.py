@@ -0,0 +1,160 @@
+import pytest
+
+from app.application.queries import galeria_query
+from app.application.queries.readmodels.galeria_card import (
+    GALERIA_CARDS_COLLECTION,
+    build_galeria_card,
+    project_galeria_card,
+)
+
+PUBLIC_RELATO = {
+    "created_at": "2026-01-01T00:00:00+00:00",
+    "public_visibility": {"status": "approved_public"},
+    "public_excerpt": {"text": "x" * 200},
+    "tags_extraidas": ["eczema"],
+}
+
+IMAGENS = [
+    {"relato_id": "r1", "papel_clinico": "DEPOIS", "storage": {"thumb_path": "relatos/r1/depois.jpg"}},
+    {"relato_id": "r1", "papel_clinico": "ANTES", "storage": {"thumb_path": "relatos/r1/antes.jpg"}},
+]
+
+
+class FakeRef:
+    def __init__(self, store, path):
+        self._store = store
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def get(self):
+        return FakeSnapshot(self, self._store.docs.get(self.path))
+
+    def set(self, data):
+        self._store.docs[self.path] = dict(data)
+
+    def delete(self):
+        self._store.docs.pop(self.path, None)
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeCollection:
+    """Coleção simples: filtros são ignorados, ordenação/paginação registradas."""
+
+    def __init__(self, store, name):
+        self._store = store
+        self._name = name
+        self.calls = []
+
+    def document(self, doc_id):
+        return FakeRef(self._store, f"{self._name}/{doc_id}")
+
+    def _record(self, name, *args):
+        self.calls.append((name, args))
+        return self
+
+    def where(self, *args, **kwargs):
+        return self._record("where")
+
+    def order_by(self, *args, **kwargs):
+        return self._record("order_by")
+
+    def start_after(self, *args):
+        return self._record("start_after", *args)
+
+    def offset(self, *args):
+        return self._record("offset", *args)
+
+    def limit(self, count):
+        self._limit = count
+        return self._record("limit", count)
+
+    def stream(self):
+        if self._name == "imagens":
+            return iter(FakeSnapshot(FakeRef(self._store, "imagens/x"), img) for img in self._store.imagens)
+        prefix = f"{self._name}/"
+        docs = [
+            FakeSnapshot(FakeRef(self._store, path), data)
+            for path, data in sorted(self._store.docs.items())
+            if path.startswith(prefix)
+        ]
+        return iter(docs[: getattr(self, "_limit", len(docs))])
+
+
+class FakeDb:
+    def __init__(self):
+        self.docs = {}
+        self.imagens = []
+        self.collections = {}
+
+    def collection(self, name):
+        return self.collections.setdefault(name, FakeCollection(self, name))
+
+    def collection_group(self, _name):
+        raise AssertionError("a galeria por cards não deve consultar os relatos")
+
+    def document(self, path):
+        return FakeRef(self, path)
+
+
+class FakeStorage:
+    def get_signed_urls(self, paths, expires_seconds=3600):
+        return {path: f"https://signed/{path}" for path in paths}
+
+
+def test_card_holds_card_ready_fields():
+    card = build_galeria_card("r1", PUBLIC_RELATO, IMAGENS)
+
+    assert card["excerpt"] == "x" * 120
+    assert card["tags"] == ["eczema"]
+    assert card["thumb_paths"] == {"antes": "relatos/r1/antes.jpg", "depois": "relatos/r1/depois.jpg"}
+    assert card["created_at"] == PUBLIC_RELATO["created_at"]
+    assert card["tags_normalizadas"] == ["eczema"]
+    assert card["ux_effects"] and all(isinstance(effect["severity"], str) for effect in card["ux_effects"])
+
+
+def test_projection_writes_public_card_and_removes_it_when_no_longer_public():
+    db = FakeDb()
+    db.imagens = IMAGENS
+    db.docs["relatos/r1"] = dict(PUBLIC_RELATO)
+
+    assert project_galeria_card("r1", db=db) is True
+    assert db.docs[f"{GALERIA_CARDS_COLLECTION}/r1"]["has_images"] is True
+    # features de tom do excerpt inteiro ficam no card; o relato não é tocado
+    card = db.docs[f"{GALERIA_CARDS_COLLECTION}/r1"]
+    assert card["tone_features"] == {"version": 1, "length": 200, "markers": 0}
+    assert db.docs["relatos/r1"] == PUBLIC_RELATO
+
+    db.docs["relatos/r1"]["public_visibility"] = {"status": "rejected"}
+
+    assert project_galeria_card("r1", db=db) is False
+    assert f"{GALERIA_CARDS_COLLECTION}/r1" not in db.docs
+
+
+@pytest.mark.asyncio
+async def test_public_gallery_reads_only_the_cards(monkeypatch):
+    db = FakeDb()
+    db.imagens = IMAGENS
+    for index in range(3):
+        db.docs[f"relatos/r{index}"] = dict(PUBLIC_RELATO)
+        project_galeria_card(f"r{index}", db=db)
+
+    monkeypatch.setattr(galeria_query, "get_firestore_client", lambda: db)
+    monkeypatch.setattr(galeria_query, "StorageAdapter", FakeStorage)
+    monkeypatch.setattr(galeria_query, "GALERIA_PUBLIC_SOURCE", "cards")
+
+    result = await galeria_query.listar_galeria_publica_v3(limit=2, page=1)
+
+    assert [item["id"] for item in result["dados"]] == ["r0", "r1"]
+    assert result["dados"][0]["imgAntes"] == "https://signed/relatos/r1/antes.jpg"
+    assert result["dados"][0]["created_at"] == "2026-01-01T00:00:00+00:00"
+    assert result["meta"]["next_cursor"] is not None
@@ -0,0 +1,214 @@
+import random
+
+import pytest
+
+from app.application.queries import galeria_query
+from app.application.queries.galeria_query import rank_contextual_candidates
+from app.application.queries.relato_base_cache import RelatoBaseCache
+from app.domain.galeria.similarity.axes import SimilarityAxis
+from app.domain.galeria.similarity.calculator import SimilarityCalculator
+from app.domain.galeria.similarity.policy import SIMILARITY_POLICY_V1
+from app.domain.galeria.similarity.scorers.narrative_tone import narrative_tone_similarity
+from app.domain.galeria.similarity.scorers.tags_overlap import jaccard_similarity
+
+TAGS = ["coceira", "ardor", "descamação", "insônia", "vermelhidão", "bolhas", "hidratante"]
+TEXTOS = ["melhora com hidratante", "sem controle ainda", "resultado após meses de evolução", ""]
+
+BASE = {"id": "base", "tags_extraidas": TAGS[:4], "excerpt": "tive melhora e controle"}
+
+
+def _candidatos(total, seed=11):
+    rng = random.Random(seed)
+    return [
+        (
+            f"r{index}",
+            {
+                "tags_extraidas": rng.sample(TAGS, rng.randint(0, 5)),
+                "public_excerpt": {"text": rng.choice(TEXTOS)},
+            },
+        )
+        for index in range(total)
+    ]
+
+
+def _scalar(relatos, min_similarity, limit):
+    # caminho antigo: um calculate por candidato e sort completo
+    calculator = SimilarityCalculator()
+    scored = []
+    for relato_id, relato in relatos:
+        tags = jaccard_similarity(BASE["tags_extraidas"], relato["tags_extraidas"])
+        score = calculator.calculate(
+            partial_scores={
+                SimilarityAxis.SYMPTOMS: tags,
+                SimilarityAxis.THERAPY_RESPONSE: tags,
+                SimilarityAxis.NARRATIVE_TONE: narrative_tone_similarity(
+                    BASE["excerpt"], relato["public_excerpt"]["text"]
+                ),
+            },
+            policy=SIMILARITY_POLICY_V1,
+        )
+        if score.total >= min_similarity:
+            scored.append((relato_id, relato, score))
+    scored.sort(key=lambda item: item[2].total, reverse=True)
+    return scored[:limit]
+
+
+def test_batch_ranking_matches_per_candidate_scoring():
+    relatos = _candidatos(500)
+
+    for min_similarity in [0.0, 0.2]:
+        assert rank_contextual_candidates(
+            relato_base=BASE,
+            relatos=relatos,
+            min_similarity=min_similarity,
+            limit=12,
+        ) == _scalar(relatos, min_similarity, 12)
+
+
+def test_without_base_relato_nothing_passes_the_threshold():
+    assert rank_contextual_candidates(
+        relato_base=None,
+        relatos=_candidatos(10),
+        min_similarity=0.7,
+        limit=5,
+    ) == []
+
+
+class FakeRef:
+    def __init__(self, path):
+        self.path = path
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.reference = FakeRef(f"relatos/{doc_id}")
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+def _field(data, path):
+    for part in path.split("."):
+        data = data.get(part) if isinstance(data, dict) else None
+    return data
+
+
+class FakeRelatosQuery:
+    def __init__(self, docs):
+        self._docs = docs
+        self._filters = []
+        self._limit = None
+
+    def where(self, *, filter):
+        self._filters.append(filter)
+        return self
+
+    def order_by(self, field, direction=None):
+        # FieldPath.document_id() ("__name__"): desempate irrelevante aqui
+        if field != "__name__":
+            self._docs = sorted(self._docs, key=lambda item: item[1][field], reverse=direction == "DESCENDING")
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def stream(self):
+        matches = [
+            FakeSnapshot(doc_id, data)
+            for doc_id, data in self._docs
+            if all(_field(data, f.field_path) == f.value for f in self._filters)
+        ]
+        return iter(matches[: self._limit])
+
+
+class FakeDb:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def collection_group(self, name):
+        assert name == "relatos"
+        query = FakeRelatosQuery(list(self.docs.items()))
+        self.queries.append(query)
+        return query
+
+
+class FakeReplica:
+    """Réplica atualizada com o índice LSH dos cards."""
+
+    def __init__(self, docs, shortlist):
+        self.docs = docs
+        self.shortlist = shortlist
+        self.similar_calls = []
+
+    def similar_relatos(self, tags, *, limit, exclude=()):
+        self.similar_calls.append((sorted(tags), limit, list(exclude)))
+        return [(relato_id, 1.0) for relato_id in self.shortlist if relato_id not in exclude][:limit]
+
+    def get_relatos(self, relato_ids):
+        return [(relato_id, dict(self.docs[relato_id])) for relato_id in relato_ids]
+
+    def card_tone_features(self, relato_ids):
+        return {}
+
+
+def _relato(user_id, created_at, tags, text):
+    return {
+        "user_id": user_id,
+        "status": "approved_public",
+        "public_visibility": {"status": "approved_public"},
+        "created_at": created_at,
+        "tags_extraidas": tags,
+        "public_excerpt": {"text": text},
+    }
+
+
+@pytest.mark.asyncio
+async def test_contextual_gallery_end_to_end(monkeypatch):
+    db = FakeDb({
+        "base": _relato("u1", "2026-01-01", ["coceira", "ardor", "insônia"], "tive melhora com hidratante"),
+        "parecido": _relato("u2", "2026-01-02", ["coceira", "ardor", "insônia"], "melhora com hidratante"),
+        "distante": _relato("u3", "2026-01-03", ["bolhas"], "sem controle ainda"),
+    })
+    monkeypatch.setattr(galeria_query, "get_firestore_client", lambda: db)
+    monkeypatch.setattr(galeria_query, "relato_base_cache", RelatoBaseCache(max_size=10, ttl_seconds=600))
+    monkeypatch.setattr(galeria_query, "get_public_relato_replica", lambda: FakeReplica(db.docs, []))
+    # réplica sem lista curta: cai no overfetch do Firestore
+    monkeypatch.setattr(galeria_query, "_lsh_candidates", lambda *_args, **_kwargs: None)
+
+    resposta = await galeria_query.listar_galeria_contextual(user_id="u1", limit=5, page=1)
+
+    ids = [item["id"] for item in resposta["dados"]]
+    assert "parecido" in ids
+    assert "distante" not in ids
+    assert resposta["meta"]["count"] == len(ids)
+    scores = [item["similarity_score"] for item in resposta["dados"]]
+    assert scores == sorted(scores, reverse=True)
+    assert all(effect["type"] for item in resposta["dados"] for effect in item["ux_effects"])
+
+
+@pytest.mark.asyncio
+async def test_contextual_candidates_come_from_the_lsh_shortlist(monkeypatch):
+    db = FakeDb({
+        "base": _relato("u1", "2026-01-01", ["coceira", "ardor", "insônia"], "tive melhora com hidratante"),
+        "parecido": _relato("u2", "2026-01-02", ["coceira", "ardor", "insônia"], "melhora com hidratante"),
+        "quase": _relato("u3", "2026-01-03", ["coceira", "ardor", "insônia", "bolhas"], "melhora"),
+        "fora-da-lista": _relato("u4", "2026-01-04", ["coceira", "ardor", "insônia"], "melhora com hidratante"),
+    })
+    replica = FakeReplica(db.docs, ["quase", "parecido", "base"])
+    monkeypatch.setattr(galeria_query, "get_firestore_client", lambda: db)
+    monkeypatch.setattr(galeria_query, "relato_base_cache", RelatoBaseCache(max_size=10, ttl_seconds=600))
+    monkeypatch.setattr(galeria_query, "get_public_relato_replica", lambda: replica)
+
+    primeira = await galeria_query.listar_galeria_contextual(user_id="u1", limit=1, page=1)
+    segunda = await galeria_query.listar_galeria_contextual(user_id="u1", limit=1, page=2)
+
+    # só a consulta do relato-base vai ao Firestore; o próprio relato-base fica de fora
+    assert len(db.queries) == 1
+    assert replica.similar_calls[0] == (["ardor", "coceira", "insônia"], 3, ["base"])
+    assert [item["id"] for item in primeira["dados"]] == ["parecido"]
+    assert [item["id"] for item in segunda["dados"]] == ["quase"]
+    assert primeira["meta"]["next_cursor"] is None
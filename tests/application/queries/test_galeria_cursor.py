@@ -0,0 +1,169 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.application.queries import galeria_query
+from app.application.queries.galeria_cursor import (
+    InvalidCursorError,
+    decode_galeria_cursor,
+    encode_galeria_cursor,
+)
+
+
+class FakeRef:
+    def __init__(self, path):
+        self.path = path
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.reference = FakeRef(f"relatos/{doc_id}")
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeQuery:
+    def __init__(self, db, docs):
+        self._db = db
+        self._docs = docs
+        self.calls = []
+
+    def _record(self, name, *args, **kwargs):
+        self.calls.append((name, args, kwargs))
+        return self
+
+    def where(self, *args, **kwargs):
+        return self._record("where", *args, **kwargs)
+
+    def order_by(self, *args, **kwargs):
+        return self._record("order_by", *args, **kwargs)
+
+    def start_after(self, *args, **kwargs):
+        return self._record("start_after", *args, **kwargs)
+
+    def offset(self, *args, **kwargs):
+        return self._record("offset", *args, **kwargs)
+
+    def limit(self, count):
+        self._limit = count
+        return self._record("limit", count)
+
+    def stream(self):
+        return iter(self._docs[: self._limit] if hasattr(self, "_limit") else self._docs)
+
+
+class FakeDb:
+    def __init__(self, relatos):
+        self.relatos_query = FakeQuery(self, relatos)
+        self.imagens_query = FakeQuery(self, [])
+
+    def collection(self, name):
+        return self.relatos_query if name == "relatos" else self.imagens_query
+
+    def document(self, path):
+        return FakeRef(path)
+
+
+class FakeStorage:
+    def get_signed_urls(self, paths, expires_seconds=3600):
+        return {path: f"https://signed/{path}" for path in paths}
+
+
+def _relatos(count):
+    return [
+        FakeSnapshot(
+            f"r{index}",
+            {
+                "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat(),
+                "public_excerpt": {"text": f"relato {index}"},
+            },
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDb(_relatos(5))
+    monkeypatch.setattr(galeria_query, "get_firestore_client", lambda: db)
+    monkeypatch.setattr(galeria_query, "StorageAdapter", FakeStorage)
+    # Paginação sobre os relatos (caminho sem o read model)
+    monkeypatch.setattr(galeria_query, "GALERIA_PUBLIC_SOURCE", "relatos")
+    return db
+
+
+def test_cursor_round_trip_preserves_datetime_and_path():
+    created_at = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+    cursor = encode_galeria_cursor(created_at, "relatos/abc")
+
+    assert decode_galeria_cursor(cursor) == (created_at, "relatos/abc")
+
+
+def test_cursor_round_trip_preserves_string_created_at():
+    cursor = encode_galeria_cursor("2026-03-01T12:30:00+00:00", "relatos/abc")
+
+    assert decode_galeria_cursor(cursor) == ("2026-03-01T12:30:00+00:00", "relatos/abc")
+
+
+@pytest.mark.parametrize("cursor", ["nao-e-cursor", "e30", "!!!"])
+def test_invalid_cursor_raises(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_galeria_cursor(cursor)
+
+
+@pytest.mark.parametrize("doc_path", ["relatos", "relatos/abc/fotos", "relatos//abc", "/relatos/abc", "galeria_public_cards/abc"])
+def test_cursor_with_invalid_doc_path_raises(doc_path):
+    cursor = encode_galeria_cursor("2026-03-01T12:30:00+00:00", doc_path)
+
+    with pytest.raises(InvalidCursorError):
+        decode_galeria_cursor(cursor, "relatos")
+
+
+def test_cursor_accepts_nested_path_of_the_expected_collection():
+    cursor = encode_galeria_cursor("2026-03-01T12:30:00+00:00", "usuarios/u1/relatos/abc")
+
+    assert decode_galeria_cursor(cursor, "relatos")[1] == "usuarios/u1/relatos/abc"
+
+
+@pytest.mark.asyncio
+async def test_first_page_returns_next_cursor_without_offset(fake_db):
+    result = await galeria_query.listar_galeria_publica_v3(limit=2, page=1)
+
+    assert [item["id"] for item in result["dados"]] == ["r0", "r1"]
+    assert result["meta"]["next_cursor"] is not None
+    names = [name for name, _, _ in fake_db.relatos_query.calls]
+    assert "offset" not in names
+    assert ("limit", (3,), {}) in fake_db.relatos_query.calls
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_uses_start_after(fake_db):
+    cursor = encode_galeria_cursor("2026-01-01T00:00:00+00:00", "relatos/r1")
+
+    await galeria_query.listar_galeria_publica_v3(limit=2, page=1, cursor=cursor)
+
+    start_after = [args for name, args, _ in fake_db.relatos_query.calls if name == "start_after"]
+    assert len(start_after) == 1
+    position = start_after[0][0]
+    assert position["created_at"] == "2026-01-01T00:00:00+00:00"
+    assert position["__name__"].path == "relatos/r1"
+    assert "offset" not in [name for name, _, _ in fake_db.relatos_query.calls]
+
+
+@pytest.mark.asyncio
+async def test_page_parameter_still_falls_back_to_offset(fake_db):
+    await galeria_query.listar_galeria_publica_v3(limit=2, page=3)
+
+    assert ("offset", (4,), {}) in fake_db.relatos_query.calls
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_next_cursor(fake_db):
+    result = await galeria_query.listar_galeria_publica_v3(limit=10, page=1)
+
+    assert result["meta"]["count"] == 5
+    assert result["meta"]["next_cursor"] is None
@@ -0,0 +1,395 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.queries.feed_relato_query import ReplicaFeedRelatoQuery
+from app.application.queries.galeria_cursor import encode_galeria_cursor
+from app.application.queries.public_relato_replica import PublicRelatoReplica
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeRef:
+    def __init__(self, path):
+        self.path = path
+
+
+class FakeDoc:
+    def __init__(self, collection, doc_id, data):
+        self.id = doc_id
+        self.reference = FakeRef(f"{collection}/{doc_id}")
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeWatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.is_active = True
+
+    def unsubscribe(self):
+        self.is_active = False
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeQuery:
+    def __init__(self, db, name):
+        self._db = db
+        self._name = name
+
+    def where(self, *args, **kwargs):
+        return self
+
+    def document(self, doc_id):
+        return FakeRef(f"{self._name}/{doc_id}")
+
+    def on_snapshot(self, callback):
+        watch = FakeWatch(callback)
+        self._db.watches[self._name] = watch
+        return watch
+
+
+class FakeDb:
+    def __init__(self):
+        self.watches = {}
+        # relato_enrichments, lidos sob demanda pela réplica
+        self.enrichments = {}
+        self.enrichment_reads = []
+        self.fail_reads = False
+
+    def collection(self, name):
+        return FakeQuery(self, name)
+
+    def get_all(self, refs):
+        if self.fail_reads:
+            raise RuntimeError("firestore indisponível")
+        doc_ids = [ref.path.split("/", 1)[1] for ref in refs]
+        self.enrichment_reads.append(doc_ids)
+        return [FakeSnapshot(doc_id, self.enrichments.get(doc_id)) for doc_id in doc_ids]
+
+
+class FallbackQuery:
+    def __init__(self):
+        self.calls = []
+
+    def list_public_candidates(self, limit):
+        self.calls.append(("public", limit))
+        return [{"id": "from-firestore"}]
+
+    def list_owner_relatos(self, owner_user_id, limit):
+        self.calls.append(("owner", owner_user_id))
+        return []
+
+
+class FakeChange:
+    def __init__(self, document):
+        self.document = document
+
+
+def _push(db, name, collection, docs, changed=None):
+    snapshot = [FakeDoc(collection, doc_id, data) for doc_id, data in docs.items()]
+    changes = [
+        FakeChange(FakeDoc(collection, doc_id, docs.get(doc_id, {})))
+        for doc_id in (docs if changed is None else changed)
+    ]
+    db.watches[name].callback(snapshot, changes, None)
+
+
+@pytest.fixture
+def synced(monkeypatch):
+    db = FakeDb()
+    # o watchdog é exercitado via _check_listeners, sem depender do relógio
+    replica = PublicRelatoReplica(max_staleness_seconds=30, watchdog_interval_seconds=3600, db=db)
+    replica.start()
+
+    db.enrichments = {
+        "r2": {"data": {"sintomas": ["prurido"]}},
+        "privado": {"data": {"sintomas": ["ardor"]}},
+    }
+    _push(db, "relatos", "relatos", {
+        "r1": {"status": "approved_public", "updated_at": BASE},
+        "r2": {"status": "approved_public", "updated_at": BASE + timedelta(days=1)},
+        "r3": {"status": "processed", "public_visibility": {"status": "approved_public"}},
+    })
+    _push(db, "galeria_public_cards", "galeria_public_cards", {
+        f"c{index}": {"relato_id": f"c{index}", "created_at": (BASE + timedelta(hours=index)).isoformat()}
+        for index in range(5)
+    })
+    return replica, db
+
+
+def test_not_used_before_initial_snapshot():
+    db = FakeDb()
+    replica = PublicRelatoReplica(db=db)
+    replica.start()
+    _push(db, "relatos", "relatos", {"r1": {"status": "approved_public", "updated_at": BASE}})
+
+    assert replica.list_public_candidates(limit=10) is None
+
+
+def test_enrichments_are_read_only_for_public_relatos(synced):
+    replica, db = synced
+
+    # leitura inicial: só os relatos públicos, nunca a coleção inteira
+    assert db.enrichment_reads == [["r1", "r2", "r3"]]
+    assert replica.stats()["enrichments"] == 1
+
+    # snapshots seguintes: só os relatos que mudaram
+    db.enrichments["r1"] = {"data": {"sintomas": ["ardor"]}}
+    _push(db, "relatos", "relatos", {
+        "r1": {"status": "approved_public", "updated_at": BASE + timedelta(days=2)},
+        "r2": {"status": "approved_public", "updated_at": BASE + timedelta(days=1)},
+    }, changed=["r1", "r3"])
+
+    assert db.enrichment_reads[1:] == [["r1"]]
+    relatos = replica.list_public_candidates(limit=10)
+    assert [relato["tags"] for relato in relatos] == [["ardor"], ["prurido"]]
+    assert replica.stats()["enrichments"] == 2
+
+
+def test_failed_enrichment_read_falls_back_until_a_full_read(synced):
+    replica, db = synced
+    relatos = {
+        "r1": {"status": "approved_public", "updated_at": BASE},
+        "r2": {"status": "approved_public", "updated_at": BASE + timedelta(days=1)},
+    }
+
+    db.fail_reads = True
+    _push(db, "relatos", "relatos", relatos, changed=["r1"])
+    assert replica.list_public_candidates(limit=10) is None
+
+    db.fail_reads = False
+    _push(db, "relatos", "relatos", relatos, changed=[])
+    assert db.enrichment_reads[-1] == ["r1", "r2"]
+    assert [relato["id"] for relato in replica.list_public_candidates(limit=10)] == ["r2", "r1"]
+
+
+def test_watchdog_resyncs_enrichments_after_a_failed_read(synced):
+    replica, db = synced
+
+    db.fail_reads = True
+    _push(db, "relatos", "relatos", {
+        "r1": {"status": "approved_public", "updated_at": BASE},
+    }, changed=["r1"])
+    assert replica.list_public_candidates(limit=10) is None
+
+    db.fail_reads = False
+    replica._check_listeners(0.0)
+
+    assert db.enrichment_reads[-1] == ["r1"]
+    assert [relato["id"] for relato in replica.list_public_candidates(limit=10)] == ["r1"]
+
+
+def test_watchdog_rereads_enrichments_of_unchanged_public_relatos(synced):
+    replica, db = synced
+    replica.enrichments_refresh_seconds = 60
+    reads = len(db.enrichment_reads)
+
+    # reenriquecimento de um relato já público: o listener não vê mudança
+    db.enrichments["r1"] = {"data": {"sintomas": ["ardor"]}}
+    replica._check_listeners(time.monotonic())
+    assert len(db.enrichment_reads) == reads
+
+    replica._check_listeners(time.monotonic() + 60)
+
+    assert db.enrichment_reads[-1] == ["r1", "r2", "r3"]
+    relatos = replica.list_public_candidates(limit=10)
+    assert [relato["tags"] for relato in relatos] == [["prurido"], ["ardor"]]
+
+def test_watchdog_thread_restarts_dead_listeners():
+    db = FakeDb()
+    replica = PublicRelatoReplica(max_staleness_seconds=0, watchdog_interval_seconds=0.01, db=db)
+    replica.start()
+    dead = db.watches["relatos"]
+    dead.is_active = False
+
+    deadline = time.monotonic() + 2
+    while db.watches["relatos"] is dead and time.monotonic() < deadline:
+        time.sleep(0.01)
+    replica.stop()
+
+    assert db.watches["relatos"] is not dead
+    assert replica.stats()["restarts"] >= 1
+
+
+def test_feed_candidates_follow_get_aprovados(synced):
+    replica, _ = synced
+
+    relatos = replica.list_public_candidates(limit=10)
+
+    assert [relato["id"] for relato in relatos] == ["r2", "r1"]
+    assert relatos[0]["tags"] == ["prurido"]
+    assert relatos[1]["enrichment"] == {}
+
+
+def test_gallery_cards_paginate_like_the_keyset_query(synced):
+    replica, _ = synced
+
+    first = replica.list_galeria_cards(limit=2, page=1, cursor=None)
+    assert [card["relato_id"] for _, card in first] == ["c4", "c3", "c2"]
+
+    path, card = first[1]
+    cursor = encode_galeria_cursor(card["created_at"], path)
+    second = replica.list_galeria_cards(limit=2, page=1, cursor=cursor)
+    assert [card["relato_id"] for _, card in second] == ["c2", "c1", "c0"]
+
+    third = replica.list_galeria_cards(limit=2, page=3, cursor=None)
+    assert [card["relato_id"] for _, card in third] == ["c0"]
+
+
+def test_matching_candidates_search_the_whole_corpus_and_follow_changes(synced):
+    replica, db = synced
+    relatos = {
+        "r1": {"status": "approved_public", "updated_at": BASE, "regioes_afetadas": ["rosto"]},
+        "r2": {"status": "approved_public", "updated_at": BASE + timedelta(days=1)},
+    }
+    _push(db, "relatos", "relatos", relatos, changed=[])
+
+    def matching():
+        result = replica.list_matching_candidates(
+            regioes=["rosto"], faixa_etaria=None, sintomas=[], limit=1,
+        )
+        return [relato["id"] for relato in result]
+
+    # r1 já estava no índice, mas sem região: não casa até ser alterado
+    assert matching() == ["r2"]
+
+    _push(db, "relatos", "relatos", relatos, changed=["r1"])
+    assert matching() == ["r1"]
+
+    del relatos["r1"]
+    _push(db, "relatos", "relatos", relatos, changed=["r1"])
+    assert matching() == ["r2"]
+    assert replica.stats()["candidate_index"]["relatos"] == 1
+
+
+def test_similar_relatos_come_from_the_lsh_shortlist(synced):
+    replica, db = synced
+    tags = ["coceira", "ardor", "descamação", "insônia"]
+    publico = {"status": "approved_public", "public_visibility": {"status": "approved_public"}}
+    # sem nenhum card: o índice vem dos próprios relatos públicos
+    relatos = {
+        "parecido": {**publico, "tags_extraidas": tags[:3] + ["bolhas"]},
+        "igual": {**publico, "tags_extraidas": tags},
+        "outro": {**publico, "tags_extraidas": ["acne", "oleosidade"]},
+        "fora-da-galeria": {"status": "approved_public", "tags_extraidas": tags},
+    }
+    _push(db, "relatos", "relatos", relatos, changed=list(relatos))
+
+    result = replica.similar_relatos([tag.upper() for tag in tags], limit=5, exclude=["igual"])
+
+    assert [relato_id for relato_id, _ in result] == ["parecido"]
+    assert result[0][1] == 0.6
+
+    # relato que sai da galeria sai do índice
+    del relatos["parecido"]
+    _push(db, "relatos", "relatos", relatos, changed=["parecido"])
+    assert replica.similar_relatos(tags, limit=5, exclude=["igual"]) == []
+
+
+def test_card_tone_features_come_from_the_cards(synced):
+    replica, db = synced
+    tone = {"version": 1, "length": 12, "markers": 1}
+    _push(db, "galeria_public_cards", "galeria_public_cards", {
+        "com-tom": {"created_at": BASE.isoformat(), "tone_features": tone},
+        "sem-tom": {"created_at": BASE.isoformat()},
+    }, changed=["com-tom", "sem-tom"])
+
+    assert replica.card_tone_features(["com-tom", "sem-tom", "sem-card"]) == {"com-tom": tone}
+
+    _push(db, "galeria_public_cards", "galeria_public_cards", {}, changed=["com-tom"])
+    assert replica.card_tone_features(["com-tom"]) == {}
+
+
+def test_leitura_gets_any_public_relato(synced):
+    replica, _ = synced
+
+    assert replica.get_relato("r3")["status"] == "processed"
+    assert replica.get_relato("missing") is None
+
+
+def test_inactive_listener_is_served_only_within_staleness_bound(synced, monkeypatch):
+    replica, db = synced
+    fallback = FallbackQuery()
+    query = ReplicaFeedRelatoQuery(replica, fallback)
+    now = 1000.0
+    monkeypatch.setattr("app.application.queries.public_relato_replica.time.monotonic", lambda: now)
+
+    db.watches["relatos"].is_active = False
+    assert [relato["id"] for relato in query.list_public_candidates(limit=10)] == ["r2", "r1"]
+
+    now += 31
+    assert query.list_public_candidates(limit=10) == [{"id": "from-firestore"}]
+    assert fallback.calls == [("public", 10)]
+    # a leitura não reinicia nada: isso fica com o watchdog
+    assert replica.stats()["restarts"] == 0
+
+    replica._check_listeners(now)
+    assert replica.stats()["restarts"] == 1
+    assert db.watches["relatos"].is_active is True
+
+
+def test_validators_track_view_versions(synced):
+    replica, db = synced
+
+    feed = replica.feed_validator()
+    galeria = replica.galeria_validator()
+    assert feed.last_modified == BASE + timedelta(days=1)
+    assert replica.relato_validator("r1").last_modified == BASE
+    assert replica.relato_validator("nao-publico") is None
+
+    # snapshot sem mudança de versão mantém o validador
+    _push(db, "relatos", "relatos", {
+        "r1": {"status": "approved_public", "updated_at": BASE},
+        "r2": {"status": "approved_public", "updated_at": BASE + timedelta(days=1)},
+        "r3": {"status": "processed", "public_visibility": {"status": "approved_public"}},
+    }, changed=[])
+    assert replica.feed_validator() == feed
+
+    db.enrichments["r2"] = {"data": {"sintomas": ["prurido"]}, "updated_at": BASE + timedelta(days=2)}
+    _push(db, "relatos", "relatos", {
+        "r1": {"status": "approved_public", "updated_at": BASE},
+        "r2": {"status": "approved_public", "updated_at": BASE + timedelta(days=1)},
+        "r3": {"status": "processed", "public_visibility": {"status": "approved_public"}},
+    }, changed=["r2"])
+    assert replica.feed_validator().version != feed.version
+    assert replica.galeria_validator() == galeria
+
+
+def test_validators_unavailable_when_stale(synced):
+    replica, db = synced
+    replica.max_staleness_seconds = 0
+    db.watches["relatos"].is_active = False
+
+    assert replica.feed_validator() is None
+    assert replica.relato_validator("r1") is None
+
+
+def test_galeria_validator_follows_public_source(synced):
+    replica, db = synced
+    cards = replica.galeria_validator("cards")
+    relatos = replica.galeria_validator("relatos")
+
+    # aprovação sem card: muda a galeria montada dos relatos, não a dos cards
+    _push(db, "relatos", "relatos", {
+        "r1": {"status": "approved_public", "updated_at": BASE},
+        "r2": {"status": "approved_public", "updated_at": BASE + timedelta(days=1)},
+        "r3": {"status": "processed", "public_visibility": {"status": "approved_public"}},
+        "r4": {"public_visibility": {"status": "approved_public"}, "updated_at": BASE + timedelta(days=3)},
+    }, changed=["r4"])
+
+    assert replica.galeria_validator("cards") == cards
+    assert replica.galeria_validator("relatos").version != relatos.version
+    assert replica.galeria_validator("relatos").last_modified == BASE + timedelta(days=3)
@@ -0,0 +1,153 @@
+import pytest
+
+from app.application.queries import galeria_query, public_relato_replica
+from app.application.queries.relato_base_cache import RelatoBaseCache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = RelatoBaseCache(max_size=10, ttl_seconds=600)
+    monkeypatch.setattr(galeria_query, "relato_base_cache", cache)
+    monkeypatch.setattr(public_relato_replica, "relato_base_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    calls = []
+
+    async def fake_load(user_id):
+        calls.append(user_id)
+        return {"id": f"base-{user_id}", "tags_extraidas": ["coceira"], "excerpt": ""} if user_id != "sem-base" else None
+
+    monkeypatch.setattr(galeria_query, "_load_relato_base_for_user", fake_load)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_browsing_costs_one_base_lookup(cache, loads):
+    for _ in range(10):
+        base = await galeria_query.resolve_relato_base_for_user(user_id="u1")
+        assert base["id"] == "base-u1"
+
+    assert loads == ["u1"]
+
+    # usuário sem relato-base também é cacheado
+    assert await galeria_query.resolve_relato_base_for_user(user_id="sem-base") is None
+    assert await galeria_query.resolve_relato_base_for_user(user_id="sem-base") is None
+    assert loads == ["u1", "sem-base"]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_forces_a_new_lookup(cache, loads):
+    await galeria_query.resolve_relato_base_for_user(user_id="u1")
+    cache.invalidate("u1")
+    await galeria_query.resolve_relato_base_for_user(user_id="u1")
+
+    assert loads == ["u1", "u1"]
+
+
+def test_put_after_concurrent_invalidation_is_dropped(cache):
+    generation = cache.generation()
+    cache.invalidate("u1")
+    cache.put("u1", {"id": "velho"}, generation=generation)
+
+    assert cache.lookup("u1") == (False, None)
+
+
+def test_replica_changes_invalidate_the_owner(cache):
+    class Doc:
+        def __init__(self, doc_id, data):
+            self.id = doc_id
+            self._data = data
+
+        def to_dict(self):
+            return dict(self._data)
+
+    class Change:
+        def __init__(self, document):
+            self.document = document
+
+    replica = public_relato_replica.PublicRelatoReplica()
+    replica._on_relatos([], [], None)
+
+    cache.put("u1", {"id": "base"}, generation=cache.generation())
+    cache.put("u2", {"id": "base"}, generation=cache.generation())
+
+    # relato do u1 saiu do conjunto aprovado
+    replica._on_relatos([], [Change(Doc("r1", {"user_id": "u1"}))], None)
+
+    assert cache.lookup("u1") == (False, None)
+    assert cache.lookup("u2")[0] is True
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeRelatosQuery:
+    def __init__(self, docs):
+        self._docs = docs
+        self._filters = []
+        self._limit = None
+
+    def where(self, *, filter):
+        self._filters.append(filter)
+        return self
+
+    def order_by(self, field, direction=None):
+        self._docs = sorted(self._docs, key=lambda item: item[1][field], reverse=direction == "DESCENDING")
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def stream(self):
+        matches = [
+            FakeSnapshot(doc_id, data)
+            for doc_id, data in self._docs
+            if all(data.get(f.field_path) == f.value for f in self._filters)
+        ]
+        return iter(matches[: self._limit])
+
+
+class FakeDb:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def collection_group(self, name):
+        assert name == "relatos"
+        return FakeRelatosQuery(list(self.docs.items()))
+
+
+@pytest.mark.asyncio
+async def test_real_loader_picks_latest_approved_relato(cache, monkeypatch):
+    db = FakeDb({
+        "antigo": {
+            "user_id": "u1", "status": "approved_public", "created_at": "2026-01-01",
+            "tags_extraidas": ["ardor"], "public_excerpt": {"text": "antes"},
+        },
+        "recente": {
+            "user_id": "u1", "status": "approved_public", "created_at": "2026-02-01",
+            "tags_extraidas": ["Coceira"], "public_excerpt": {"text": "tive melhora"},
+        },
+        "pendente": {
+            "user_id": "u1", "status": "processed", "created_at": "2026-03-01",
+            "tags_extraidas": ["insônia"],
+        },
+    })
+    monkeypatch.setattr(galeria_query, "get_firestore_client", lambda: db)
+
+    base = await galeria_query.resolve_relato_base_for_user(user_id="u1")
+
+    assert base["id"] == "recente"
+    assert base["tags_extraidas"] == ["Coceira"]
+    assert base["excerpt"] == "tive melhora"
+    assert base["tone_features"] is not None
+    assert await galeria_query.resolve_relato_base_for_user(user_id="u2") is None
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.application.services.async_jobs import AsyncJobRunner
+from app.application.services.background_workers import JobRejectedError
+
+
+def test_keeps_many_jobs_in_flight_up_to_concurrency():
+    runner = AsyncJobRunner(concurrency=20, max_pending=50)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def job():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        with lock:
+            in_flight -= 1
+
+    for _ in range(40):
+        runner.submit(job)
+    runner.shutdown(drain=True, timeout=5)
+
+    stats = runner.stats()
+    assert stats["completed"] == 40
+    assert peak == 20
+
+
+def test_rejects_above_max_pending():
+    runner = AsyncJobRunner(concurrency=1, max_pending=2)
+    release = threading.Event()
+
+    async def job():
+        await asyncio.to_thread(release.wait, 5)
+
+    runner.submit(job)
+    runner.submit(job)
+    with pytest.raises(JobRejectedError):
+        runner.submit(job)
+
+    release.set()
+    runner.shutdown(drain=True, timeout=5)
+    assert runner.stats()["rejected"] == 1
+    assert runner.stats()["completed"] == 2
+
+
+def test_call_runs_on_the_job_loop_even_when_queue_is_full():
+    runner = AsyncJobRunner(concurrency=1, max_pending=1)
+    release = threading.Event()
+
+    async def job():
+        await asyncio.to_thread(release.wait, 5)
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    runner.submit(job)
+    with pytest.raises(JobRejectedError):
+        runner.submit(job)
+
+    assert runner.call(current_loop) is runner._loop
+
+    release.set()
+    runner.shutdown(drain=True, timeout=5)
+    with pytest.raises(JobRejectedError):
+        runner.call(current_loop)
+
+def test_failed_job_is_counted_and_loop_keeps_running():
+    runner = AsyncJobRunner(concurrency=2, max_pending=10)
+    done = []
+
+    async def boom():
+        raise RuntimeError("falha no job")
+
+    async def ok():
+        done.append("ok")
+
+    runner.submit(boom)
+    runner.submit(ok)
+    runner.shutdown(drain=True, timeout=5)
+
+    assert done == ["ok"]
+    assert runner.stats()["failed"] == 1
+    with pytest.raises(JobRejectedError):
+        runner.submit(ok)
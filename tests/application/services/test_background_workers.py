@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.application.services.background_workers import BackgroundWorkerPool, JobRejectedError
+from app.infra.processing_adapter import CloudTasksProcessingAdapter
+from app.ports.processing_port import ProcessingBackpressureError
+
+
+def test_runs_jobs_concurrently_and_reports_metrics():
+    pool = BackgroundWorkerPool(concurrency=3, max_queue_size=10, put_timeout_seconds=0)
+    barrier = threading.Barrier(3, timeout=5)
+    pool.start()
+
+    for _ in range(3):
+        pool.submit(barrier.wait)
+    pool.shutdown(drain=True, timeout=5)
+
+    stats = pool.stats()
+    assert stats["completed"] == 3
+    assert stats["failed"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["run_time"]["max_ms"] >= 0
+
+
+def test_full_queue_rejects_job():
+    pool = BackgroundWorkerPool(concurrency=1, max_queue_size=1, put_timeout_seconds=0)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(5)
+
+    pool.submit(blocker)
+    assert started.wait(5)
+    pool.submit(lambda: None)
+
+    with pytest.raises(JobRejectedError):
+        pool.submit(lambda: None)
+
+    release.set()
+    pool.shutdown(drain=True, timeout=5)
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+
+
+def test_shutdown_drains_pending_jobs_and_refuses_new_ones():
+    pool = BackgroundWorkerPool(concurrency=1, max_queue_size=10, put_timeout_seconds=0)
+    done = []
+
+    for index in range(5):
+        pool.submit(done.append, index)
+    pool.shutdown(drain=True, timeout=5)
+
+    assert done == [0, 1, 2, 3, 4]
+    with pytest.raises(JobRejectedError):
+        pool.submit(done.append, 99)
+
+
+def test_failing_job_does_not_stop_worker():
+    pool = BackgroundWorkerPool(concurrency=1, max_queue_size=10, put_timeout_seconds=0)
+    done = []
+
+    def boom():
+        raise RuntimeError("falha no job")
+
+    pool.submit(boom)
+    pool.submit(done.append, "ok")
+    pool.shutdown(drain=True, timeout=5)
+
+    assert done == ["ok"]
+    assert pool.stats()["failed"] == 1
+
+
+def test_adapter_signals_backpressure(monkeypatch):
+    def reject(_relato_id):
+        raise JobRejectedError("Fila de processamento cheia (1)")
+
+    monkeypatch.setattr("app.infra.processing_adapter.enqueue_relato_processing", reject)
+
+    with pytest.raises(ProcessingBackpressureError):
+        asyncio.run(CloudTasksProcessingAdapter().enqueue_relato_processing("relato-1"))
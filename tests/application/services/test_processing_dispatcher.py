@@ -0,0 +1,90 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.services import processing_dispatcher
+from app.application.services.async_jobs import AsyncJobRunner
+from app.application.services.background_workers import JobRejectedError
+
+
+class FakeContext:
+    instances = 0
+
+    def __init__(self):
+        FakeContext.instances += 1
+        self.mark_processed = AsyncMock()
+
+
+@pytest.fixture
+def fake_context(monkeypatch):
+    FakeContext.instances = 0
+    monkeypatch.setattr(processing_dispatcher, "_WorkerContext", FakeContext)
+    monkeypatch.setattr(processing_dispatcher, "_context", None)
+    monkeypatch.setattr(processing_dispatcher, "refresh_galeria_card", lambda _relato_id: None)
+    yield
+    processing_dispatcher._context = None
+
+
+def test_completions_reuse_one_context_on_the_job_loop(fake_context, monkeypatch):
+    runner = AsyncJobRunner(concurrency=4, max_pending=10)
+    monkeypatch.setattr(processing_dispatcher, "get_async_job_runner", lambda: runner)
+
+    processing_dispatcher._on_job_completed("relato-1")
+    processing_dispatcher._on_job_completed("relato-2")
+    runner.shutdown(drain=True, timeout=5)
+
+    assert FakeContext.instances == 1
+    context = processing_dispatcher._get_worker_context()
+    assert sorted(c.args[0] for c in context.mark_processed.execute.await_args_list) == ["relato-1", "relato-2"]
+    assert runner.stats()["completed"] == 2
+
+
+def test_completion_waits_on_the_job_loop_when_queue_is_full(fake_context, monkeypatch):
+    runner = AsyncJobRunner(concurrency=1, max_pending=1)
+    monkeypatch.setattr(processing_dispatcher, "get_async_job_runner", lambda: runner)
+    loops = []
+
+    async def record_loop(_relato_id):
+        loops.append(asyncio.get_running_loop())
+
+    processing_dispatcher._get_worker_context().mark_processed.execute.side_effect = record_loop
+
+    def reject(*_args, **_kwargs):
+        raise JobRejectedError("cheia")
+
+    monkeypatch.setattr(runner, "submit", reject)
+
+    processing_dispatcher._on_job_completed("relato-1")
+    job_loop = runner._loop
+    runner.shutdown(drain=True, timeout=5)
+
+    processing_dispatcher._get_worker_context().mark_processed.execute.assert_awaited_once_with("relato-1")
+    assert loops == [job_loop]
+
+
+def test_completion_is_dropped_when_job_loop_is_closed(fake_context, monkeypatch):
+    runner = AsyncJobRunner(concurrency=1, max_pending=1)
+    runner.shutdown(drain=True, timeout=5)
+    monkeypatch.setattr(processing_dispatcher, "get_async_job_runner", lambda: runner)
+
+    processing_dispatcher._on_job_completed("relato-1")
+
+    assert FakeContext.instances == 0
+
+
+def test_mark_processed_runs_on_the_job_loop(fake_context, monkeypatch):
+    runner = AsyncJobRunner(concurrency=1, max_pending=10)
+    monkeypatch.setattr(processing_dispatcher, "get_async_job_runner", lambda: runner)
+    loops = []
+
+    async def record_loop(_relato_id):
+        loops.append(asyncio.get_running_loop())
+
+    processing_dispatcher._get_worker_context().mark_processed.execute.side_effect = record_loop
+
+    processing_dispatcher._on_job_completed("relato-1")
+    job_loop = runner._loop
+    runner.shutdown(drain=True, timeout=5)
+
+    assert loops == [job_loop]
@@ -2,6 +2,7 @@ import pytest
 import os
 import httpx
 from firebase_admin import auth
+from app.auth.profile_cache import user_profile_cache
 from app.firestore.client import get_firestore_client
 
 @pytest.fixture(scope="function")
@@ -76,4 +77,5 @@ def clean_firestore_users():
             # Se falhar a limpeza por conexão, apenas ignora para não travar toda a suite
             # (Os testes que dependem de estado limpo falharão ou darão skip individualmente)
             print(f"Aviso: Não foi possível limpar Firestore Local: {e}")
+    user_profile_cache.clear()
     yield
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.auth.profile_cache import UserProfileCache, user_profile_cache
+from app.auth.schemas import UserRole
+from app.auth.service import get_or_create_internal_user
+
+FIREBASE_DATA = {
+    "firebase_uid": "uid-1",
+    "email": "user@example.com",
+    "display_name": "User",
+    "avatar_url": None,
+}
+
+
+def _stored_profile(updated_at):
+    return {
+        "id": "uid-1",
+        "firebase_uid": "uid-1",
+        "email": "user@example.com",
+        "display_name": "User",
+        "avatar_url": None,
+        "role": UserRole.ADMIN,
+        "is_active": True,
+        "created_at": updated_at,
+        "updated_at": updated_at,
+    }
+
+
+def _mock_db(stored):
+    mock_db = MagicMock()
+    user_ref = mock_db.collection.return_value.document.return_value
+    user_ref.get.return_value.exists = stored is not None
+    user_ref.get.return_value.to_dict.return_value = stored
+    return mock_db, user_ref
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    user_profile_cache.clear()
+    yield
+    user_profile_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_profile_is_not_rewritten():
+    mock_db, user_ref = _mock_db(_stored_profile(datetime.now(timezone.utc)))
+
+    with patch("app.auth.service.get_firestore_client", return_value=mock_db):
+        user = await get_or_create_internal_user(dict(FIREBASE_DATA))
+
+    assert user.role == UserRole.ADMIN
+    user_ref.get.assert_called_once()
+    user_ref.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cached_profile_skips_firestore_entirely():
+    mock_db, user_ref = _mock_db(_stored_profile(datetime.now(timezone.utc)))
+
+    with patch("app.auth.service.get_firestore_client", return_value=mock_db):
+        await get_or_create_internal_user(dict(FIREBASE_DATA))
+        await get_or_create_internal_user(dict(FIREBASE_DATA))
+
+    user_ref.get.assert_called_once()
+    user_ref.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_email_writes_only_synced_fields():
+    mock_db, user_ref = _mock_db(_stored_profile(datetime.now(timezone.utc)))
+
+    with patch("app.auth.service.get_firestore_client", return_value=mock_db):
+        await get_or_create_internal_user(dict(FIREBASE_DATA))
+        user = await get_or_create_internal_user({**FIREBASE_DATA, "email": "new@example.com"})
+
+    assert user.email == "new@example.com"
+    user_ref.get.assert_called_once()
+    user_ref.set.assert_called_once()
+    args, kwargs = user_ref.set.call_args
+    assert kwargs["merge"] is True
+    assert args[0]["email"] == "new@example.com"
+    assert "role" not in args[0]
+
+
+@pytest.mark.asyncio
+async def test_stale_updated_at_is_touched():
+    stale = datetime.now(timezone.utc) - timedelta(days=30)
+    mock_db, user_ref = _mock_db(_stored_profile(stale))
+
+    with patch("app.auth.service.get_firestore_client", return_value=mock_db):
+        await get_or_create_internal_user(dict(FIREBASE_DATA))
+
+    user_ref.set.assert_called_once()
+    args, _ = user_ref.set.call_args
+    assert args[0]["updated_at"] > stale
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = UserProfileCache(max_size=10, ttl_seconds=60)
+    now = 1000.0
+    monkeypatch.setattr("app.auth.profile_cache.time.monotonic", lambda: now)
+    cache.put("uid-1", {"id": "uid-1"})
+
+    assert cache.get("uid-1") == {"id": "uid-1"}
+
+    monkeypatch.setattr("app.auth.profile_cache.time.monotonic", lambda: now + 61)
+    assert cache.get("uid-1") is None
@@ -0,0 +1,85 @@
+import base64
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.auth.service import verify_firebase_token
+from app.auth.token_cache import VerifiedTokenCache, verified_token_cache
+
+
+def _fake_jwt(sub="uid-1"):
+    header = base64.urlsafe_b64encode(json.dumps({"alg": "RS256"}).encode()).decode().rstrip("=")
+    return f"{header}.{sub}.signature"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    verified_token_cache.clear()
+    yield
+    verified_token_cache.clear()
+
+
+def test_repeat_token_skips_firebase_verification(monkeypatch):
+    monkeypatch.setenv("FIREBASE_AUTH_EMULATOR_HOST", "127.0.0.1:9099")
+    token = _fake_jwt()
+    before = verified_token_cache.stats()
+
+    with patch("firebase_admin.auth.verify_id_token") as mock_verify:
+        mock_verify.return_value = {
+            "uid": "uid-1",
+            "email": "user@example.com",
+            "exp": time.time() + 3600,
+        }
+
+        first = verify_firebase_token(token)
+        second = verify_firebase_token(token)
+
+    assert first == second
+    assert mock_verify.call_count == 1
+    stats = verified_token_cache.stats()
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 1
+
+
+def test_entries_expire_at_token_exp():
+    cache = VerifiedTokenCache(max_size=10, revocation_recheck_seconds=300)
+
+    cache.put("token", {"firebase_uid": "uid-1"}, exp=time.time() - 1)
+
+    assert cache.get("token") is None
+
+
+def test_entries_expire_at_revocation_recheck_interval(monkeypatch):
+    cache = VerifiedTokenCache(max_size=10, revocation_recheck_seconds=60)
+    now = time.time()
+    monkeypatch.setattr("app.auth.token_cache.time.time", lambda: now)
+    cache.put("token", {"firebase_uid": "uid-1"}, exp=now + 3600)
+
+    assert cache.get("token") == {"firebase_uid": "uid-1"}
+
+    monkeypatch.setattr("app.auth.token_cache.time.time", lambda: now + 61)
+    assert cache.get("token") is None
+
+
+def test_lru_evicts_least_recently_used():
+    cache = VerifiedTokenCache(max_size=2, revocation_recheck_seconds=300)
+    exp = time.time() + 3600
+
+    cache.put("a", {"firebase_uid": "a"}, exp=exp)
+    cache.put("b", {"firebase_uid": "b"}, exp=exp)
+    cache.get("a")
+    cache.put("c", {"firebase_uid": "c"}, exp=exp)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_tokens_without_exp_are_not_cached():
+    cache = VerifiedTokenCache(max_size=10, revocation_recheck_seconds=300)
+
+    cache.put("token", {"firebase_uid": "uid-1"}, exp=None)
+
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,56 @@
+import chromadb
+import pytest
+
+from app.chroma.buscador_segmentos import _buscar_por_tags, filtro_tags
+
+SEGMENTOS = {
+    "s1": {"tag_corticoide": True, "tag_coceira": True},
+    "s2": {"tag_coceira": True},
+    "s3": {"tag_hidratante": True},
+    "s4": {"tag_corticoide": True, "tag_coceira": True, "tag_hidratante": True},
+}
+
+
+@pytest.fixture
+def collection():
+    client = chromadb.EphemeralClient()
+    collection = client.get_or_create_collection(name="segmentos_teste", embedding_function=None)
+    collection.add(
+        ids=list(SEGMENTOS),
+        documents=[f"texto {segmento_id}" for segmento_id in SEGMENTOS],
+        embeddings=[[float(index), 1.0] for index in range(len(SEGMENTOS))],
+        metadatas=list(SEGMENTOS.values()),
+    )
+    yield collection
+    client.delete_collection("segmentos_teste")
+
+
+def _textos(resultados):
+    return sorted(resultado["texto"] for resultado in resultados)
+
+
+def test_filtro_tags():
+    assert filtro_tags(["tag_a"], "and") == {"tag_a": {"$eq": True}}
+    assert filtro_tags(["tag_a", "tag_b"], "or") == {
+        "$or": [{"tag_a": {"$eq": True}}, {"tag_b": {"$eq": True}}]
+    }
+
+
+def test_modos_and_e_or(collection):
+    assert _textos(_buscar_por_tags(["Corticóide", "coceira"], modo="and", k=10, collection=collection)) == [
+        "texto s1", "texto s4",
+    ]
+    assert _textos(_buscar_por_tags(["corticoide", "hidratante"], modo="or", k=10, collection=collection)) == [
+        "texto s1", "texto s3", "texto s4",
+    ]
+    assert _buscar_por_tags([], collection=collection) == []
+
+
+def test_paginacao_traz_so_a_pagina(collection):
+    primeira = _buscar_por_tags(["coceira"], k=2, collection=collection)
+    segunda = _buscar_por_tags(["coceira"], k=2, offset=2, collection=collection)
+
+    assert len(primeira) == 2
+    assert len(segunda) == 1
+    assert _textos(primeira + segunda) == ["texto s1", "texto s2", "texto s4"]
+    assert all(resultado["tags"] == ["tag_coceira"] for resultado in primeira + segunda)
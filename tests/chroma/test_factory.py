@@ -0,0 +1,76 @@
+import sys
+
+from app.chroma.factory import DBResourceFactory
+
+
+class FakeVector(list):
+    def tolist(self):
+        return list(self)
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, text):
+        self.calls.append(text)
+        if isinstance(text, list):
+            return FakeVector(FakeVector([float(len(item))]) for item in text)
+        return FakeVector([float(len(text)), 1.0])
+
+
+def _factory(**kwargs):
+    factory = DBResourceFactory(**kwargs)
+    factory._model = FakeModel()
+    return factory
+
+
+def test_import_does_not_load_resources():
+    import app.chroma.buscador_segmentos  # noqa: F401
+    import app.chroma.buscador_tags  # noqa: F401
+    from app.chroma.factory import db_factory
+
+    assert "sentence_transformers" not in sys.modules
+    assert db_factory.stats()["model_loaded"] is False
+    assert db_factory.stats()["clients"] == 0
+
+
+def test_encode_query_reuses_cached_embedding():
+    factory = _factory(query_cache_size=2)
+
+    first = factory.encode_query("coceira")
+    first.append(99.0)  # o chamador não altera o cache
+
+    assert factory.encode_query("coceira") == [7.0, 1.0]
+    assert factory._model.calls == ["coceira"]
+    assert factory.stats()["query_cache"]["hits"] == 1
+
+
+def test_encode_query_evicts_least_recent():
+    factory = _factory(query_cache_size=2)
+
+    factory.encode_query("a")
+    factory.encode_query("bb")
+    factory.encode_query("a")
+    factory.encode_query("ccc")
+    factory.encode_query("bb")
+
+    assert factory._model.calls == ["a", "bb", "ccc", "bb"]
+
+
+def test_encode_query_without_cache():
+    factory = _factory(query_cache_size=0)
+
+    factory.encode_query("a")
+    factory.encode_query("a")
+
+    assert factory._model.calls == ["a", "a"]
+    assert factory.stats()["query_cache"]["size"] == 0
+
+
+def test_encode_documents_is_one_batch():
+    factory = _factory()
+
+    assert factory.encode_documents(["a", "bb"]) == [[1.0], [2.0]]
+    assert factory._model.calls == [["a", "bb"]]
+    assert factory.encode_documents([]) == []
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from app.chroma import ingest_from_jsonl
+
+
+class FakeClient:
+    def __init__(self, max_batch_size):
+        self.max_batch_size = max_batch_size
+
+    def get_max_batch_size(self):
+        return self.max_batch_size
+
+
+class FakeCollection:
+    def __init__(self):
+        self.ids = []
+        self.calls = []
+
+    def add(self, *, ids, documents, embeddings, metadatas):
+        self.calls.append(list(ids))
+        if len(set(ids)) != len(ids) or set(ids) & set(self.ids):
+            raise ValueError("ID duplicado")
+        self.ids.extend(ids)
+
+
+class FakeFactory:
+    def __init__(self, max_batch_size=100):
+        self.client = FakeClient(max_batch_size)
+        self.collection = FakeCollection()
+        self.encoded = []
+
+    def get_client(self, path=None):
+        return self.client
+
+    def get_collection(self, name=None, *, path=None, create=False):
+        return self.collection
+
+    def encode_documents(self, texts):
+        self.encoded.append(len(texts))
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = FakeFactory(max_batch_size=3)
+    monkeypatch.setattr(ingest_from_jsonl, "factory", factory)
+    return factory
+
+
+def _jsonl(tmp_path, arquivos):
+    path = tmp_path / "depoimentos.jsonl"
+    path.write_text(
+        "\n".join(
+            json.dumps({"arquivo": arquivo, "conteudo": f"texto {arquivo}", "data_modificacao": "2026-01-01"})
+            for arquivo in arquivos
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_ingest_adds_in_batches_capped_by_the_client(factory, tmp_path):
+    path = _jsonl(tmp_path, [f"a{index}" for index in range(7)])
+
+    assert ingest_from_jsonl.ingerir_jsonl(path, batch_size=10) == 7
+    assert [len(ids) for ids in factory.collection.calls] == [3, 3, 1]
+    assert factory.encoded == [3, 3, 1]
+
+
+def test_duplicate_arquivo_only_drops_its_own_record(factory, tmp_path):
+    path = _jsonl(tmp_path, ["a0", "a1", "a2", "a3", "a1", "a5"])
+
+    assert ingest_from_jsonl.ingerir_jsonl(path) == 5
+    assert factory.collection.ids == ["a0", "a1", "a2", "a3", "a5"]
@@ -0,0 +1,42 @@
+from app.domain.galeria.similarity.scorers.minhash import (
+    MinHashLSHIndex,
+    estimate_jaccard,
+    minhash_signature,
+)
+from app.domain.galeria.similarity.scorers.tags_overlap import (
+    jaccard_from_sets,
+    jaccard_similarity,
+    normalize_tags,
+)
+
+
+def test_precomputed_sets_give_the_same_jaccard():
+    a = [" Coceira", "vermelhidão", "descamação", "ardor"]
+    b = ["coceira", "Descamação", "ardor", "insônia"]
+
+    assert jaccard_from_sets(normalize_tags(a), normalize_tags(b)) == jaccard_similarity(a, b)
+
+
+def test_signature_is_deterministic_and_estimates_jaccard():
+    a = normalize_tags([f"tag{index}" for index in range(20)])
+    b = normalize_tags([f"tag{index}" for index in range(10, 30)])
+
+    assert minhash_signature(a) == minhash_signature(list(a))
+    assert minhash_signature([]) == []
+    # Jaccard real = 10/30
+    assert abs(estimate_jaccard(minhash_signature(a), minhash_signature(b)) - 1 / 3) < 0.2
+
+
+def test_lsh_shortlists_similar_sets_only():
+    index = MinHashLSHIndex()
+    base = [f"sintoma{index}" for index in range(8)]
+
+    index.insert("quase_igual", minhash_signature(base[:7] + ["outro"]))
+    index.insert("diferente", minhash_signature([f"x{index}" for index in range(8)]))
+    index.insert("vazio", minhash_signature([]))
+
+    assert index.candidates(minhash_signature(base)) == {"quase_igual"}
+    assert len(index) == 2
+
+    index.remove("quase_igual")
+    assert index.candidates(minhash_signature(base)) == set()
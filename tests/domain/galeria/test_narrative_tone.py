@@ -0,0 +1,32 @@
+import itertools
+
+from app.domain.galeria.similarity.scorers.narrative_tone import (
+    narrative_tone_features,
+    narrative_tone_similarity,
+    narrative_tone_similarity_from_features,
+    resolve_tone_features,
+)
+
+TEXTOS = [
+    "",
+    "Tive MELHORA em poucas semanas",
+    "sem controle, muita coceira e nenhum resultado",
+    "melhora e controle, resultado visível",
+    "coceira",
+]
+
+
+def test_features_give_the_same_score_as_the_text_scan():
+    for text_a, text_b in itertools.product(TEXTOS, repeat=2):
+        assert narrative_tone_similarity_from_features(
+            narrative_tone_features(text_a),
+            narrative_tone_features(text_b),
+        ) == narrative_tone_similarity(text_a, text_b)
+
+
+def test_stored_features_are_used_only_in_the_current_version():
+    stored = {"version": 1, "length": 10, "markers": 2}
+
+    assert resolve_tone_features(stored, "outro texto") is stored
+    assert resolve_tone_features({"version": 0, "length": 10}, "coceira") == narrative_tone_features("coceira")
+    assert resolve_tone_features(None, None) == {"version": 1, "length": 0, "markers": 0}
@@ -61,3 +61,49 @@ def test_similarity_score_is_compositional_and_deterministic():
     assert round(sum(result.breakdown.values()), 4) == 0.7
     
     
+
+
+def test_calculate_many_matches_scalar_path_exactly():
+    import random
+
+    from app.domain.galeria.similarity.policy import SIMILARITY_POLICY_V1, compile_policy
+
+    calculator = SimilarityCalculator()
+    compiled = compile_policy(SIMILARITY_POLICY_V1)
+    rng = random.Random(3)
+
+    candidates = [
+        {
+            axis: rng.choice([0.0, round(rng.random(), 4), 1.0])
+            for axis in compiled.axes
+            if rng.random() > 0.2
+        }
+        for _ in range(300)
+    ]
+
+    batch = calculator.calculate_many(
+        partial_scores=[compiled.row(scores) for scores in candidates],
+        policy=SIMILARITY_POLICY_V1,
+    )
+
+    assert batch.scores() == [
+        calculator.calculate(partial_scores=scores, policy=SIMILARITY_POLICY_V1)
+        for scores in candidates
+    ]
+
+
+def test_compiled_policy_is_reused_and_validated_once():
+    import pytest
+
+    from app.domain.galeria.similarity.policy import SIMILARITY_POLICY_V1, compile_policy
+
+    assert compile_policy(SIMILARITY_POLICY_V1) is compile_policy(SIMILARITY_POLICY_V1)
+
+    with pytest.raises(ValueError):
+        compile_policy(SimilarityPolicy(version="bad", weights={SimilarityAxis.SYMPTOMS: 0.4}))
+
+    with pytest.raises(ValueError):
+        SimilarityCalculator().calculate_many(
+            partial_scores=[(1.5, 0.0, 0.0)],
+            policy=SIMILARITY_POLICY_V1,
+        )
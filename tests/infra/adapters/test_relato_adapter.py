@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from app.domain.relato.states import RelatoStatus
+from app.infra.adapters import relato_adapter
+
+
+class FakeSnapshot:
+    def __init__(self, data):
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeRef:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, data):
+        self.updates.append(data)
+
+    def get(self, field_paths=None):
+        return FakeSnapshot({"user_id": "u1"})
+
+
+class FakeDb:
+    def __init__(self):
+        self.ref = FakeRef()
+
+    def collection(self, _name):
+        return self
+
+    def document(self, _relato_id):
+        return self.ref
+
+
+class FakeRunner:
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, coro_fn, *args, job_name=None):
+        self.jobs.append((coro_fn, args))
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDb()
+    refreshed = []
+    invalidated = []
+    runner = FakeRunner()
+    monkeypatch.setattr(relato_adapter, "get_firestore_client", lambda: db)
+    monkeypatch.setattr(relato_adapter, "refresh_galeria_card", refreshed.append)
+    monkeypatch.setattr(relato_adapter.relato_base_cache, "invalidate", invalidated.append)
+    monkeypatch.setattr(relato_adapter, "get_async_job_runner", lambda: runner)
+    db.refreshed = refreshed
+    db.invalidated = invalidated
+    db.runner = runner
+    return db
+
+
+@pytest.mark.parametrize("new_status", [RelatoStatus.APPROVED_PUBLIC, RelatoStatus.PROCESSED])
+def test_status_update_writes_only_status(fake_db, new_status):
+    relato_adapter.update_relato_status_adapter("r1", new_status)
+
+    (update,) = fake_db.ref.updates
+    assert set(update) == {"status", "updated_at"}
+    assert update["status"] == new_status.value
+
+
+def test_derived_reads_are_refreshed_off_the_request_path(fake_db):
+    relato_adapter.update_relato_status_adapter("r1", RelatoStatus.APPROVED_PUBLIC)
+
+    assert fake_db.refreshed == []
+    assert fake_db.invalidated == []
+    ((coro_fn, args),) = fake_db.runner.jobs
+
+    asyncio.run(coro_fn(*args))
+
+    assert fake_db.refreshed == ["r1"]
+    assert fake_db.invalidated == ["u1"]
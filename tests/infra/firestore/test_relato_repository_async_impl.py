@@ -0,0 +1,117 @@
+import pytest
+
+from app.domain.relato.states import RelatoStatus
+from app.infra.firestore.relato_repository_async_impl import AsyncFirestoreRelatoRepository
+from app.infra.firestore.relato_repository_factory import get_relato_repository
+from app.infra.firestore.relato_repository_impl import FirestoreRelatoRepository
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeAsyncDocument:
+    def __init__(self, data=None):
+        self.data = data
+        self.updated_payload = None
+        self.set_payload = None
+        self.set_merge = None
+
+    async def get(self):
+        return FakeSnapshot("relato-123", self.data)
+
+    async def update(self, payload):
+        self.updated_payload = payload
+
+    async def set(self, payload, merge=False):
+        self.set_payload = payload
+        self.set_merge = merge
+
+
+class FakeAsyncCollection:
+    def __init__(self, document):
+        self._document = document
+
+    def document(self, _relato_id):
+        return self._document
+
+
+class FakeAsyncFirestore:
+    def __init__(self, document):
+        self._document = document
+
+    def collection(self, _name):
+        return FakeAsyncCollection(self._document)
+
+
+@pytest.fixture
+def document(monkeypatch):
+    document = FakeAsyncDocument()
+    monkeypatch.setattr(
+        "app.infra.firestore.relato_repository_async_impl.get_async_firestore_client",
+        lambda: FakeAsyncFirestore(document),
+    )
+    return document
+
+
+@pytest.mark.asyncio
+async def test_update_status_persists_enum_value(document):
+    repository = AsyncFirestoreRelatoRepository()
+
+    await repository.update_status("relato-123", RelatoStatus.PROCESSING)
+
+    assert document.updated_payload["status"] == RelatoStatus.PROCESSING.value
+
+
+@pytest.mark.asyncio
+async def test_save_normalizes_status_enum_to_value(document):
+    repository = AsyncFirestoreRelatoRepository()
+
+    await repository.save(
+        "relato-123",
+        {
+            "owner_id": "user-123",
+            "status": RelatoStatus.CREATED,
+            "image_refs": {"antes": [], "durante": [], "depois": []},
+        },
+    )
+
+    assert document.set_payload["status"] == RelatoStatus.CREATED.value
+    assert "created_at" in document.set_payload
+    assert document.set_merge is True
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_returns_none_when_missing(document):
+    repository = AsyncFirestoreRelatoRepository()
+
+    assert await repository.get_by_id("relato-123") is None
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_includes_document_id(document):
+    document.data = {"status": "created"}
+    repository = AsyncFirestoreRelatoRepository()
+
+    relato = await repository.get_by_id("relato-123")
+
+    assert relato == {"status": "created", "id": "relato-123"}
+
+
+def test_factory_selects_backend(document, monkeypatch):
+    monkeypatch.setattr(
+        "app.infra.firestore.relato_repository_impl.get_firestore_client",
+        lambda: FakeAsyncFirestore(document),
+    )
+
+    assert isinstance(get_relato_repository("async"), AsyncFirestoreRelatoRepository)
+    assert isinstance(get_relato_repository("sync"), FirestoreRelatoRepository)
+
+    with pytest.raises(ValueError):
+        get_relato_repository("mongo")
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from app.domain.relato.states import RelatoStatus
@@ -12,6 +14,7 @@ class FakeDocument:
 
     def update(self, payload):
         self.updated_payload = payload
+        self.update_thread = threading.current_thread()
 
     def set(self, payload, merge=False):
         self.set_payload = payload
@@ -70,3 +73,19 @@ async def test_save_normalizes_status_enum_to_value(monkeypatch):
 
     assert document.set_payload["status"] == RelatoStatus.CREATED.value
     assert document.set_merge is True
+
+
+@pytest.mark.asyncio
+async def test_offload_io_runs_sdk_calls_off_the_event_loop_thread(monkeypatch):
+    document = FakeDocument()
+    monkeypatch.setattr(
+        "app.infra.firestore.relato_repository_impl.get_firestore_client",
+        lambda: FakeFirestore(document),
+    )
+
+    await FirestoreRelatoRepository().update_status("relato-123", RelatoStatus.PROCESSING)
+    assert document.update_thread is threading.current_thread()
+
+    await FirestoreRelatoRepository(offload_io=True).update_status("relato-123", RelatoStatus.PROCESSED)
+    assert document.update_thread is not threading.current_thread()
+    assert document.updated_payload["status"] == RelatoStatus.PROCESSED.value
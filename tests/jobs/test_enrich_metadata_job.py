@@ -0,0 +1,89 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from app.jobs.enrich_metadata_job import EnrichMetadataJob
+
+
+def _job(on_completed_callback=None, **kwargs):
+    pipeline_manager = MagicMock()
+    pipeline_manager.claim_task.return_value = True
+    relato_repo = MagicMock()
+    relato_repo.get_by_id.return_value = {"conteudo_original": "texto", "metadados": {}}
+    job = EnrichMetadataJob(
+        relato_repo=relato_repo,
+        effect_repo=MagicMock(),
+        enriched_repo=MagicMock(),
+        pipeline_manager=pipeline_manager,
+        on_completed_callback=on_completed_callback,
+        **kwargs,
+    )
+    return job, pipeline_manager
+
+
+def test_run_async_retries_llm_with_non_blocking_backoff(monkeypatch):
+    calls = []
+    sleeps = []
+
+    def flaky_llm(relato_text):
+        calls.append(relato_text)
+        if len(calls) < 3:
+            raise RuntimeError("timeout do LLM")
+        return {"idade": 30}
+
+    async def fake_anonymous(_payload):
+        return "conteúdo anônimo"
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("app.jobs.enrich_metadata_job.run_enrich_metadata_llm", flaky_llm)
+    monkeypatch.setattr("app.jobs.enrich_metadata_job.generate_anonymous_content", fake_anonymous)
+
+    completed = []
+
+    async def on_completed(relato_id):
+        completed.append(relato_id)
+
+    job, pipeline_manager = _job(on_completed, async_sleep=fake_sleep)
+    asyncio.run(job.run_async("relato-1"))
+
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+    pipeline_manager.complete_task.assert_called_once_with("relato-1", job.EFFECT_TYPE)
+    assert completed == ["relato-1"]
+
+
+def test_run_shares_the_flow_with_blocking_sleep_and_sync_callback(monkeypatch):
+    calls = []
+    sleeps = []
+
+    def flaky_llm(relato_text):
+        calls.append(relato_text)
+        if len(calls) < 2:
+            raise RuntimeError("timeout do LLM")
+        return {"idade": 30}
+
+    async def fake_anonymous(_payload):
+        return "conteúdo anônimo"
+
+    monkeypatch.setattr("app.jobs.enrich_metadata_job.run_enrich_metadata_llm", flaky_llm)
+    monkeypatch.setattr("app.jobs.enrich_metadata_job.generate_anonymous_content", fake_anonymous)
+
+    completed = []
+    job, pipeline_manager = _job(completed.append, sleep=sleeps.append)
+    job.run("relato-1")
+
+    assert len(calls) == 2
+    assert len(sleeps) == 1
+    pipeline_manager.complete_task.assert_called_once_with("relato-1", job.EFFECT_TYPE)
+    assert completed == ["relato-1"]
+
+def test_retry_delay_grows_exponentially_with_jitter():
+    job, _ = _job()
+
+    for attempt in (1, 2, 3):
+        base = job.RETRY_DELAY_SECONDS * 2 ** (attempt - 1)
+        delay = job.retry_delay(attempt)
+        assert base / 2 <= delay <= base
+
+    assert job.retry_delay(20) <= job.RETRY_MAX_DELAY_SECONDS
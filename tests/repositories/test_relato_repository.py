@@ -0,0 +1,91 @@
+from app.repositories import relato_repository
+from app.repositories.relato_repository import RelatoRepository
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeQuery:
+    def __init__(self, db, docs):
+        self._db = db
+        self._docs = docs
+
+    def where(self, *args, **kwargs):
+        return self
+
+    def order_by(self, *args, **kwargs):
+        return self
+
+    def limit(self, count):
+        return FakeQuery(self._db, self._docs[:count])
+
+    def stream(self):
+        self._db.calls.append("query")
+        return iter(self._docs)
+
+
+class FakeDocRef:
+    def __init__(self, doc_id):
+        self.id = doc_id
+
+
+class FakeCollection(FakeQuery):
+    def document(self, doc_id):
+        return FakeDocRef(doc_id)
+
+
+class FakeDb:
+    def __init__(self, relatos, enrichments):
+        self.calls = []
+        self._relatos = relatos
+        self._enrichments = enrichments
+
+    def collection(self, name):
+        if name == "relatos":
+            return FakeCollection(self, self._relatos)
+        return FakeCollection(self, [])
+
+    def get_all(self, refs):
+        self.calls.append("get_all")
+        # ordem invertida: o repositório não pode depender dela
+        return [
+            FakeSnapshot(ref.id, self._enrichments.get(ref.id))
+            for ref in reversed(list(refs))
+        ]
+
+
+def _repo(monkeypatch, count=100):
+    relatos = [FakeSnapshot(f"r{index}", {"status": "approved_public"}) for index in range(count)]
+    enrichments = {
+        f"r{index}": {"relato_id": f"r{index}", "data": {"sintomas": [f"s{index}", "prurido"]}}
+        for index in range(0, count, 2)
+    }
+    db = FakeDb(relatos, enrichments)
+    monkeypatch.setattr(relato_repository, "get_firestore_client", lambda: db)
+    return RelatoRepository(), db
+
+
+def test_get_aprovados_loads_enrichments_in_one_batch(monkeypatch):
+    repo, db = _repo(monkeypatch)
+
+    relatos = repo.get_aprovados(limit=100)
+
+    assert db.calls == ["query", "get_all"]
+    assert len(relatos) == 100
+    assert relatos[0]["tags"] == ["s0", "prurido"]
+    assert relatos[1]["enrichment"] == {}
+    assert relatos[1]["tags"] == []
+
+
+def test_get_by_id_reads_enrichment_by_document_id(monkeypatch):
+    repo, db = _repo(monkeypatch, count=1)
+
+    assert repo._get_enrichment("r0") == {"sintomas": ["s0", "prurido"]}
+    assert db.calls == ["get_all"]
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from app.routes import conditional
+from app.routes.conditional import build_validators, is_not_modified, not_modified_response
+
+MODIFIED = datetime(2026, 1, 1, 12, 0, 30, 500, tzinfo=timezone.utc)
+
+
+def _request(**headers):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def test_etag_depends_on_parts():
+    first = build_validators("feed", "v1", 1, 12, last_modified=MODIFIED)
+
+    assert first.etag.startswith('W/"')
+    assert build_validators("feed", "v1", 1, 12, last_modified=MODIFIED) == first
+    assert build_validators("feed", "v1", 2, 12, last_modified=MODIFIED).etag != first.etag
+
+
+def test_signed_urls_follow_expiry_window(monkeypatch):
+    monkeypatch.setattr(conditional, "expiry_window", lambda now=None: None)
+    assert build_validators("galeria", "v1", signed_urls=True) is None
+
+    window_start = MODIFIED.timestamp() + 3600
+    monkeypatch.setattr(conditional, "expiry_window", lambda now=None: (window_start, window_start + 3600))
+    validators = build_validators("galeria", "v1", last_modified=MODIFIED, signed_urls=True)
+
+    assert validators.last_modified.timestamp() == window_start
+    assert validators.etag != build_validators("galeria", "v1", last_modified=MODIFIED).etag
+
+
+def test_if_none_match():
+    validators = build_validators("feed", "v1")
+
+    assert is_not_modified(_request(if_none_match=validators.etag), validators)
+    assert is_not_modified(_request(if_none_match=f'"outro", {validators.etag[2:]}'), validators)
+    assert is_not_modified(_request(if_none_match="*"), validators)
+    assert not is_not_modified(_request(if_none_match='W/"outro"'), validators)
+    assert not is_not_modified(_request(), validators)
+
+
+def test_if_modified_since():
+    validators = build_validators("feed", "v1", last_modified=MODIFIED)
+
+    assert is_not_modified(_request(if_modified_since="Thu, 01 Jan 2026 12:00:30 GMT"), validators)
+    assert not is_not_modified(_request(if_modified_since="Thu, 01 Jan 2026 12:00:29 GMT"), validators)
+    assert not is_not_modified(_request(if_modified_since="data inválida"), validators)
+    assert not is_not_modified(
+        _request(if_none_match='W/"outro"', if_modified_since="Thu, 01 Jan 2026 12:00:30 GMT"),
+        validators,
+    )
+
+
+def test_not_modified_response_headers():
+    validators = build_validators("feed", "v1", last_modified=MODIFIED)
+
+    response = not_modified_response(validators, cache_control="public, no-cache", vary="Authorization")
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == validators.etag
+    assert response.headers["Last-Modified"] == "Thu, 01 Jan 2026 12:00:30 GMT"
+    assert response.headers["Cache-Control"] == "public, no-cache"
+    assert response.headers["Vary"] == "Authorization"
@@ -76,3 +76,36 @@ async def test_feed_route_rejeita_limit_fora_do_contrato(client: AsyncClient):
     response = await client.get("/feed?limit=51")
 
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_feed_anonimo_responde_304_para_etag_atual(
+    client: AsyncClient,
+    monkeypatch,
+):
+    from app.application.queries.public_relato_replica import PublicRelatoReplica, ReplicaValidator
+
+    calls = []
+
+    class CountingRepository(FakeRelatoRepository):
+        def get_aprovados(self, limit=50):
+            calls.append(limit)
+            return super().get_aprovados(limit)
+
+    validator = ReplicaValidator("v1", datetime(2026, 1, 1, tzinfo=timezone.utc))
+    monkeypatch.setattr(PublicRelatoReplica, "feed_validator", lambda self: validator)
+    monkeypatch.setattr(PublicRelatoReplica, "is_fresh", lambda self: False)
+    monkeypatch.setattr("app.routes.feed.RelatoRepository", CountingRepository)
+
+    response = await client.get("/feed")
+    assert response.status_code == 200
+    assert response.headers["Last-Modified"] == "Thu, 01 Jan 2026 00:00:00 GMT"
+    assert response.headers["Cache-Control"] == "public, no-cache"
+
+    cached = await client.get("/feed", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert len(calls) == 1
+
+    other_page = await client.get("/feed?page=2", headers={"If-None-Match": response.headers["ETag"]})
+    assert other_page.status_code == 200
@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.application.queries.public_relato_replica import PublicRelatoReplica, ReplicaValidator
+from app.routes.relatos import get_storage_port
+
+
+class FakeRelatoRepository:
+    async def get_by_id(self, relato_id):
+        return {"image_refs": {"antes": ["relatos/r1/antes.jpg"]}}
+
+
+class FakeStorage:
+    async def get_signed_urls(self, paths):
+        return {path: f"https://signed.test/{path}" for path in paths}
+
+
+@pytest.fixture
+def imagens_fakes(app, monkeypatch):
+    monkeypatch.setattr(
+        "app.infra.firestore.relato_repository_factory.get_relato_repository",
+        lambda: FakeRelatoRepository(),
+    )
+    app.dependency_overrides[get_storage_port] = lambda: FakeStorage()
+    yield
+    app.dependency_overrides.pop(get_storage_port, None)
+
+
+@pytest.mark.asyncio
+async def test_imagens_de_relato_nao_publico_nao_vao_para_cache_compartilhado(
+    client: AsyncClient,
+    imagens_fakes,
+    monkeypatch,
+):
+    monkeypatch.setattr(PublicRelatoReplica, "relato_validator", lambda self, relato_id: None)
+
+    response = await client.get("/relatos/r1/imagens")
+
+    assert response.status_code == 200
+    assert response.json()["antes"]["full_url"] == "https://signed.test/relatos/r1/antes.jpg"
+    assert response.headers["Cache-Control"] == "private, no-store"
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_imagens_de_relato_publico_sao_cacheaveis_e_validadas(
+    client: AsyncClient,
+    imagens_fakes,
+    monkeypatch,
+):
+    validator = ReplicaValidator("v1", datetime(2026, 1, 1, tzinfo=timezone.utc))
+    monkeypatch.setattr(PublicRelatoReplica, "relato_validator", lambda self, relato_id: validator)
+
+    response = await client.get("/relatos/r1/imagens")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+
+    cached = await client.get("/relatos/r1/imagens", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    assert cached.headers["Cache-Control"].startswith("public, max-age=")
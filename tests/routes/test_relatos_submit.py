@@ -0,0 +1,76 @@
+# tests/routes/test_relatos_submit.py
+"""
+Contrato HTTP de POST /relatos/{relato_id}/submit quando o backend de
+processamento recusa o relato por backpressure.
+"""
+from unittest.mock import AsyncMock
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.application.effects.build_result import build_effect_result
+from app.application.services.background_workers import JobRejectedError
+from app.auth.dependencies import get_current_user
+from app.auth.schemas import User
+from app.domain.relato.contracts import Decision
+from app.domain.relato.effects.enqueue import EnqueueProcessingEffect
+from app.domain.relato.effects.update_status import UpdateRelatoStatusEffect
+from app.domain.relato.states import RelatoStatus
+from app.main import app
+
+
+class FakeRelatoRepository:
+    def __init__(self):
+        self.get_by_id = AsyncMock(return_value={"id": "relato-1", "status": "created", "owner_id": "user-1"})
+        self.update_status = AsyncMock()
+
+
+def test_submit_returns_accepted_when_processing_queue_is_full(monkeypatch):
+    repo = FakeRelatoRepository()
+    recorded = []
+
+    def record_effect_result(**kwargs):
+        recorded.append(kwargs)
+        return build_effect_result(**kwargs)
+
+    def reject(_relato_id):
+        raise JobRejectedError("Fila de processamento cheia (1)")
+
+    monkeypatch.setattr(
+        "app.infra.firestore.relato_repository_factory.get_relato_repository",
+        lambda: repo,
+    )
+    monkeypatch.setattr(
+        "app.application.relatos.submit_relato_use_case.decide",
+        lambda **_kwargs: Decision(
+            allowed=True,
+            reason=None,
+            next_state=RelatoStatus.PROCESSING,
+            previous_state=RelatoStatus.CREATED,
+            effects=[
+                UpdateRelatoStatusEffect(relato_id="relato-1", new_status=RelatoStatus.PROCESSING),
+                EnqueueProcessingEffect(relato_id="relato-1"),
+            ],
+        ),
+    )
+    monkeypatch.setattr("app.infra.processing_adapter.enqueue_relato_processing", reject)
+    monkeypatch.setattr("app.application.effects.dispatcher.record_effect_result", record_effect_result)
+
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id="user-1",
+        firebase_uid="fb-user-1",
+        email="user@example.com",
+        role="usuario_logado",
+    )
+    try:
+        response = TestClient(app).post("/relatos/relato-1/submit")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["data"]["status"] == RelatoStatus.PROCESSING.value
+    repo.update_status.assert_awaited_once()
+    assert [(r["effect_type"], r["success"]) for r in recorded] == [
+        ("UPDATE_STATUS", True),
+        ("ENQUEUE_PROCESSING", False),
+    ]